@@ -0,0 +1,35 @@
+"""
+pyubx2 benchmark suites.
+
+Times UBX decoding for every message type in the payload definitions,
+decode scaling against repeating group size, UBXReader throughput
+over various stream types and message construction / serialization,
+and measures the memory held by parsed messages of each type,
+writing the results to a JSON file so that runs can be compared
+between releases:
+
+python3 -m benchmarks output=pyubx2-1.2.23.json
+python3 -m benchmarks compare=pyubx2-1.2.22.json,pyubx2-1.2.23.json
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from benchmarks.common import (
+    MINTIME,
+    REPEAT,
+    compare_results,
+    generate_messages,
+    load_results,
+    measure,
+    metadata,
+    save_results,
+)
+from benchmarks.construct import construct_benchmarks
+from benchmarks.decode import decode_benchmarks, scaling_benchmarks
+from benchmarks.memory import measure_memory, memory_benchmarks
+from benchmarks.stream import stream_benchmarks
+from benchmarks.runner import SUITES, run_benchmarks
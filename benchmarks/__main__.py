@@ -0,0 +1,97 @@
+"""
+pyubx2 benchmark CLI.
+
+Usage (kwargs optional):
+
+python3 -m benchmarks suites=decode,scaling,stream,construct output=results.json
+    mintime=0.02 repeat=5 messages=10000 modes=GET,SET,POLL identities=NAV-PVT,NAV-SAT
+
+python3 -m benchmarks suites=memory path=capture.ubx count=100
+
+python3 -m benchmarks compare=base.json,current.json threshold=1.1
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from sys import argv
+
+from benchmarks.common import compare_results, load_results, save_results
+from benchmarks.runner import run_benchmarks
+
+OUTPUT = "pyubx2_benchmark.json"
+LISTARGS = ("suites", "modes", "identities")
+INTARGS = ("validate", "parsebitfield", "scaling", "lazy")
+
+
+def compare(base: str, current: str, threshold: float = 1.1):
+    """
+    Print comparison of two benchmark results files.
+
+    :param str base: path to base results e.g. from previous release
+    :param str current: path to current results
+    :param float threshold: ratio above which a benchmark is flagged as slower (1.1)
+    """
+
+    base = load_results(base)
+    current = load_results(current)
+    print(
+        f"pyubx2 {base['metadata']['pyubx2']} -> {current['metadata']['pyubx2']}"
+        " (ratio of best times, > 1 = slower)"
+    )
+    for name, ratio in compare_results(base, current).items():
+        flag = " SLOWER" if ratio > threshold else ""
+        flag = " FASTER" if ratio < 1 / threshold else flag
+        print(f"{ratio:8.3f} {name}{flag}")
+
+
+def print_memory(results: dict):
+    """
+    Print memory benchmark results.
+
+    :param dict results: memory benchmark results
+    """
+
+    print(f"{'identity':<20}{'length':>10}{'default':>10}{'compact':>10}{'lazy':>10}")
+    for identity, val in results.items():
+        print(
+            f"{identity:<20}{val['length']:>10.0f}{val['default']:>10.0f}"
+            f"{val['compact']:>10.0f}{val['lazy']:>10.0f}"
+        )
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as run_benchmarks() method, plus output and compare
+    """
+
+    kwargs = dict(arg.split("=", 1) for arg in argv[1:])
+    if "compare" in kwargs:
+        base, current = kwargs["compare"].split(",")
+        compare(base, current, float(kwargs.get("threshold", 1.1)))
+        return
+    output = kwargs.pop("output", OUTPUT)
+    for key in LISTARGS:
+        if key in kwargs:
+            kwargs[key] = kwargs[key].split(",")
+    for key in INTARGS:
+        if key in kwargs:
+            kwargs[key] = int(kwargs[key])
+    if "svs" in kwargs:
+        kwargs["svs"] = [int(val) for val in kwargs["svs"].split(",")]
+    results = run_benchmarks(
+        progress=lambda name: print(f"Running {name} benchmarks..."), **kwargs
+    )
+    if "memory" in results["results"]:
+        print_memory(results["results"]["memory"])
+    save_results(results, output)
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
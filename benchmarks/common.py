@@ -0,0 +1,239 @@
+"""
+Common benchmark timing, message generation and results handling.
+
+Each timed operation is repeated in a loop until the loop takes at
+least 'mintime' seconds, and the loop is then timed 'repeat' times.
+The best (minimum) and median time per operation are reported.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import json
+import os
+import platform
+from datetime import datetime, timezone
+from statistics import median
+from timeit import Timer
+
+import pynmeagps
+import pyrtcm
+
+from pyubx2 import GET, POLL, SET, UBXMessage, UBXReader, __version__
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+from pyubx2.ubxtypes_poll import UBX_PAYLOADS_POLL
+from pyubx2.ubxtypes_set import UBX_PAYLOADS_SET
+
+MINTIME = 0.02  # minimum duration of each timed loop in seconds
+REPEAT = 5  # number of timed loops
+REPEATS = 4  # default number of repeats in generated repeating groups
+MODES = {"GET": GET, "SET": SET, "POLL": POLL}
+PAYLOADS = {GET: UBX_PAYLOADS_GET, SET: UBX_PAYLOADS_SET, POLL: UBX_PAYLOADS_POLL}
+
+
+def measure(func: object, **kwargs) -> dict:
+    """
+    Time function call.
+
+    :param object func: function to time, taking no arguments
+    :param float mintime: (kwarg) minimum duration of each timed loop (0.02)
+    :param int repeat: (kwarg) number of timed loops (5)
+    :param int number: (kwarg) calls per loop, None = calibrate using mintime (None)
+    :return: dict of number, repeat, best and median time per call in seconds
+        and rate (calls per second, based on best time)
+    :rtype: dict
+    """
+
+    mintime = float(kwargs.get("mintime", MINTIME))
+    repeat = int(kwargs.get("repeat", REPEAT))
+    number = kwargs.get("number", None)
+    timer = Timer(func)
+    if number is None:  # calibrate
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= mintime:
+                break
+            if elapsed <= 0:
+                number *= 10
+            else:
+                number = max(
+                    number + 1, min(number * 10, int(number * mintime / elapsed * 1.2))
+                )
+    number = int(number)
+    times = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    best = min(times)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best": best,
+        "median": median(times),
+        "rate": 1 / best if best > 0 else None,
+    }
+
+
+def message_kwargs(definition: dict, repeats: int = REPEATS) -> dict:
+    """
+    Get keyword arguments to construct message from payload definition,
+    comprising the number of repeats for each top level repeating group
+    whose size is given by an attribute and, if there are none, a zero
+    value for the first numeric or bitfield attribute (so that the constructor
+    generates a full rather than a null payload).
+
+    :param dict definition: payload definition
+    :param int repeats: number of repeats (4)
+    :return: dict of attribute names and values
+    :rtype: dict
+    """
+
+    kwargs = {}
+    for val in definition.values():
+        if isinstance(val, tuple) and isinstance(val[0], str) and val[0] in definition:
+            kwargs[val[0]] = repeats
+    if not kwargs:
+        for key, val in definition.items():
+            typ = val[0] if isinstance(val, (list, tuple)) else val
+            if isinstance(typ, str) and typ[0:1] in ("U", "I", "E", "L", "R", "X"):
+                kwargs[key] = 0
+                break
+    return kwargs
+
+
+def generate_messages(mode: int = GET, identities: object = None, **kwargs) -> tuple:
+    """
+    Generate message of each identity in payload definitions for
+    given mode, with default attribute values and each top level
+    repeating group repeated 'repeats' times. Messages which cannot
+    be constructed from their identity and attribute values alone
+    (e.g. those whose definition is selected by payload content),
+    or which do not parse back to the same identity, are skipped.
+
+    :param int mode: message mode 0 = GET, 1 = SET, 2 = POLL (0)
+    :param object identities: iterable of identities, None = all (None)
+    :param int repeats: (kwarg) number of repeats in repeating groups (4)
+    :return: tuple of (dict of identity and tuple of (keyword arguments, raw message),
+        list of identities skipped)
+    :rtype: tuple
+    """
+
+    repeats = int(kwargs.get("repeats", REPEATS))
+    payloads = PAYLOADS[mode]
+    messages = {}
+    skipped = []
+    for identity in payloads if identities is None else identities:
+        if identity not in payloads:
+            skipped.append(identity)
+            continue
+        msgkwargs = message_kwargs(payloads[identity], repeats)
+        try:
+            raw = UBXMessage(
+                identity.split("-")[0], identity, mode, **msgkwargs
+            ).serialize()
+            wrong = UBXReader.parse(raw, msgmode=mode).identity != identity
+        except Exception:  # pylint: disable=broad-exception-caught
+            wrong = True
+        if wrong:
+            skipped.append(identity)
+            continue
+        messages[identity] = (msgkwargs, raw)
+    return messages, skipped
+
+
+def metadata() -> dict:
+    """
+    Get details of benchmark environment.
+
+    :return: dict of environment details
+    :rtype: dict
+    """
+
+    return {
+        "pyubx2": __version__,
+        "pynmeagps": pynmeagps.__version__,
+        "pyrtcm": pyrtcm.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def save_results(results: dict, path: str):
+    """
+    Save benchmark results to JSON file.
+
+    :param dict results: benchmark results
+    :param str path: path to JSON file
+    """
+
+    with open(path, "w", encoding="utf-8") as outfile:
+        json.dump(results, outfile, indent=2)
+
+
+def load_results(path: str) -> dict:
+    """
+    Load benchmark results from JSON file.
+
+    :param str path: path to JSON file
+    :return: benchmark results
+    :rtype: dict
+    """
+
+    with open(path, "r", encoding="utf-8") as infile:
+        return json.load(infile)
+
+
+def _timings(results: object, path: tuple = ()) -> dict:
+    """
+    Flatten nested benchmark results into dict of timings.
+
+    :param object results: nested benchmark results
+    :param tuple path: keys of enclosing results
+    :return: dict of '/'-separated benchmark name and best time
+    :rtype: dict
+    """
+
+    res = {}
+    if isinstance(results, dict):
+        if "best" in results:
+            res["/".join(path)] = results["best"]
+        else:
+            for key, val in results.items():
+                res.update(_timings(val, path + (str(key),)))
+    elif isinstance(results, list):
+        for val in results:
+            if isinstance(val, dict) and "best" in val:
+                name = ",".join(
+                    f"{key}={val[key]}"
+                    for key in val
+                    if key not in ("number", "repeat", "best", "median", "rate")
+                )
+                res["/".join(path + (name,))] = val["best"]
+    return res
+
+
+def compare_results(base: dict, current: dict) -> dict:
+    """
+    Compare best times of benchmarks present in both sets of results.
+
+    :param dict base: base benchmark results e.g. from previous release
+    :param dict current: current benchmark results
+    :return: dict of benchmark name and ratio of current to base time
+        (> 1 = slower), sorted by ratio
+    :rtype: dict
+    """
+
+    basetimes = _timings(base.get("results", {}))
+    currtimes = _timings(current.get("results", {}))
+    ratios = {
+        name: currtimes[name] / best
+        for name, best in basetimes.items()
+        if name in currtimes and best > 0
+    }
+    return dict(sorted(ratios.items(), key=lambda item: item[1], reverse=True))
@@ -0,0 +1,79 @@
+"""
+UBX message construction and serialization benchmarks.
+
+Times construction of a UBXMessage from keyword arguments, and its
+serialization, for each identity in the payload definitions, together
+with construction of configuration database CFG-VALSET and
+CFG-VALGET messages.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from pyubx2 import UBXMessage
+from pyubx2.ubxtypes_configdb import (
+    POLL_LAYER_RAM,
+    SET_LAYER_RAM,
+    TXN_NONE,
+    UBX_CONFIG_DATABASE,
+)
+
+from benchmarks.common import MODES, generate_messages, measure
+
+CONFIGKEYS = 64  # max number of keys in a CFG-VALSET or CFG-VALGET message
+
+
+def construct_benchmarks(**kwargs) -> dict:
+    """
+    Time construction and serialization of each identity.
+
+    :param object modes: (kwarg) iterable of message modes 'GET', 'SET', 'POLL' (all)
+    :param object identities: (kwarg) iterable of identities, None = all (None)
+    :param int repeats: (kwarg) number of repeats in repeating groups (4)
+    :param kwargs: (kwarg) measure keyword arguments e.g. mintime
+    :return: dict of mode and dict of identity and construct and serialize
+        timings, and list of identities skipped for each mode, plus
+        config_set and config_poll timings
+    :rtype: dict
+    """
+
+    modes = kwargs.get("modes", MODES)
+    identities = kwargs.get("identities", None)
+    res = {}
+    for modename in modes:
+        mode = MODES[modename]
+        messages, skipped = generate_messages(
+            mode, identities, repeats=kwargs.get("repeats", 4)
+        )
+        results = {}
+        for identity, (msgkwargs, _) in messages.items():
+            cls = identity.split("-")[0]
+            msg = UBXMessage(cls, identity, mode, **msgkwargs)
+            results[identity] = {
+                "construct": measure(
+                    lambda args=(cls, identity, mode), msgkwargs=msgkwargs: UBXMessage(
+                        *args, **msgkwargs
+                    ),
+                    **kwargs,
+                ),
+                "serialize": measure(msg.serialize, **kwargs),
+            }
+        res[modename] = {"messages": results, "skipped": skipped}
+
+    # config database keys with integer values
+    cfgdata = [
+        (name, 0)
+        for name, (_, att) in UBX_CONFIG_DATABASE.items()
+        if att[0] in ("U", "I", "E", "L")
+    ][:CONFIGKEYS]
+    keys = [name for name, _ in cfgdata]
+    res["config_set"] = measure(
+        lambda: UBXMessage.config_set(SET_LAYER_RAM, TXN_NONE, cfgdata), **kwargs
+    )
+    res["config_poll"] = measure(
+        lambda: UBXMessage.config_poll(POLL_LAYER_RAM, 0, keys), **kwargs
+    )
+    return res
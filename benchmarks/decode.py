@@ -0,0 +1,87 @@
+"""
+UBX decode benchmarks.
+
+decode_benchmarks times UBXReader.parse for a generated message of
+each identity in the payload definitions. scaling_benchmarks times
+UBXReader.parse for NAV-SAT messages with increasing numbers of
+satellites, to show how decode time scales with repeating group size.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from pyubx2 import GET, UBXMessage, UBXReader
+
+from benchmarks.common import MODES, generate_messages, measure
+
+SCALINGSVS = (1,) + tuple(range(8, 121, 8))  # default NAV-SAT sizes
+PARSEKWARGS = ("validate", "parsebitfield", "scaling", "lazy")
+
+
+def decode_benchmarks(**kwargs) -> dict:
+    """
+    Time parsing of generated message of each identity.
+
+    :param object modes: (kwarg) iterable of message modes 'GET', 'SET', 'POLL' (all)
+    :param object identities: (kwarg) iterable of identities, None = all (None)
+    :param int repeats: (kwarg) number of repeats in repeating groups (4)
+    :param kwargs: (kwarg) UBXReader.parse keyword arguments e.g. lazy,
+        and measure keyword arguments e.g. mintime
+    :return: dict of mode and dict of identity and timings, plus
+        payload length, and list of identities skipped for each mode
+    :rtype: dict
+    """
+
+    modes = kwargs.get("modes", MODES)
+    identities = kwargs.get("identities", None)
+    parsekwargs = {key: kwargs[key] for key in PARSEKWARGS if key in kwargs}
+    res = {}
+    for modename in modes:
+        mode = MODES[modename]
+        messages, skipped = generate_messages(
+            mode, identities, repeats=kwargs.get("repeats", 4)
+        )
+        results = {}
+        for identity, (_, raw) in messages.items():
+            results[identity] = {
+                "length": len(raw) - 8,
+                **measure(
+                    lambda raw=raw, mode=mode: UBXReader.parse(
+                        raw, msgmode=mode, **parsekwargs
+                    ),
+                    **kwargs,
+                ),
+            }
+        res[modename] = {"messages": results, "skipped": skipped}
+    return res
+
+
+def scaling_benchmarks(**kwargs) -> list:
+    """
+    Time parsing of NAV-SAT messages with increasing numbers of satellites.
+
+    :param object svs: (kwarg) iterable of numbers of satellites (1, 8, 16 .. 120)
+    :param kwargs: (kwarg) UBXReader.parse keyword arguments e.g. lazy,
+        and measure keyword arguments e.g. mintime
+    :return: list of timings, plus number of satellites and payload length
+    :rtype: list
+    """
+
+    svs = kwargs.get("svs", SCALINGSVS)
+    parsekwargs = {key: kwargs[key] for key in PARSEKWARGS if key in kwargs}
+    res = []
+    for numsvs in svs:
+        raw = UBXMessage("NAV", "NAV-SAT", GET, numSvs=numsvs).serialize()
+        res.append(
+            {
+                "numSvs": numsvs,
+                "length": len(raw) - 8,
+                **measure(
+                    lambda raw=raw: UBXReader.parse(raw, **parsekwargs), **kwargs
+                ),
+            }
+        )
+    return res
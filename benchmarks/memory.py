@@ -0,0 +1,128 @@
+"""
+UBX message memory benchmarks.
+
+Measures the memory held by each parsed UBXMessage, by identity,
+using tracemalloc, for the default representation (one instance
+attribute per payload attribute), the compact representation (a
+single tuple of values with a shared table of attribute names) and
+lazy decoding (before any attributes are accessed).
+
+Messages are generated from the payload definitions or, if a
+capture file path is given, taken from the capture file.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import gc
+import sys
+import tracemalloc
+from itertools import cycle, islice
+
+from pyubx2 import GET, UBXParseError, UBXReader
+
+from benchmarks.common import generate_messages
+
+COUNT = 100  # number of messages of each identity measured
+REPRESENTATIONS = {
+    "default": {},
+    "compact": {"compact": True},
+    "lazy": {"lazy": True},
+}
+
+
+def measure_memory(func: object, count: int = COUNT) -> float:
+    """
+    Measure memory allocated by, and still held by the results of,
+    function call.
+
+    :param object func: function to measure, taking no arguments
+    :param int count: number of calls (100)
+    :return: bytes per call
+    :rtype: float
+    """
+
+    func()  # warm up any caches
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [func() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return (after - before - sys.getsizeof(results)) / count
+
+
+def _capture_messages(path: str) -> dict:
+    """
+    Get raw UBX messages in capture file, by identity.
+
+    :param str path: path to capture file
+    :return: dict of identity and list of raw messages
+    :rtype: dict
+    """
+
+    messages = {}
+    with open(path, "rb") as stream:
+        ubr = UBXReader(stream, protfilter=2, framesonly=True, quitonerror=0)
+        for raw, frame in ubr:
+            messages.setdefault(frame.identity, []).append(raw)
+    return messages
+
+
+def memory_benchmarks(**kwargs) -> dict:
+    """
+    Measure memory held by parsed message of each identity.
+
+    :param str path: (kwarg) capture file, None = generate messages
+        from GET payload definitions (None)
+    :param object identities: (kwarg) iterable of identities, None = all (None)
+    :param int repeats: (kwarg) number of repeats in generated repeating groups (4)
+    :param int count: (kwarg) number of messages of each identity measured (100)
+    :return: dict of identity and mean payload length, and bytes per message
+        for each representation
+    :rtype: dict
+    """
+
+    path = kwargs.get("path", None)
+    identities = kwargs.get("identities", None)
+    count = int(kwargs.get("count", COUNT))
+    if path is None:
+        messages, _ = generate_messages(
+            GET, identities, repeats=kwargs.get("repeats", 4)
+        )
+        messages = {identity: [raw] for identity, (_, raw) in messages.items()}
+    else:
+        messages = _capture_messages(path)
+        if identities is not None:
+            messages = {
+                identity: raws
+                for identity, raws in messages.items()
+                if identity in identities
+            }
+    res = {}
+    for identity, raws in messages.items():
+        raws = list(islice(cycle(raws), count))
+        try:
+            res[identity] = {
+                "length": sum(len(raw) - 8 for raw in raws) / count,
+                **{
+                    name: measure_memory(
+                        lambda nextraw=cycle(raws).__next__, parsekwargs=parsekwargs: (
+                            UBXReader.parse(nextraw(), **parsekwargs)
+                        ),
+                        count,
+                    )
+                    for name, parsekwargs in REPRESENTATIONS.items()
+                },
+            }
+        except UBXParseError:  # e.g. not parseable in GET mode
+            continue
+    return res
@@ -0,0 +1,51 @@
+"""
+Benchmark runner.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from benchmarks.common import metadata
+from benchmarks.construct import construct_benchmarks
+from benchmarks.decode import decode_benchmarks, scaling_benchmarks
+from benchmarks.memory import memory_benchmarks
+from benchmarks.stream import stream_benchmarks
+
+SUITES = {
+    "decode": decode_benchmarks,
+    "scaling": scaling_benchmarks,
+    "stream": stream_benchmarks,
+    "construct": construct_benchmarks,
+    "memory": memory_benchmarks,
+}
+
+
+def run_benchmarks(suites: object = None, **kwargs) -> dict:
+    """
+    Run benchmark suites.
+
+    :param object suites: iterable of suite names, None = all (None)
+    :param object progress: (kwarg) function called with name of each
+        suite before it is run (None)
+    :param kwargs: (kwarg) suite keyword arguments e.g. mintime, repeat
+    :return: dict of metadata and dict of suite name and results
+    :rtype: dict
+    :raises: ValueError (if suite name is invalid)
+    """
+
+    progress = kwargs.pop("progress", None)
+    suites = list(SUITES) if suites is None else list(suites)
+    for name in suites:
+        if name not in SUITES:
+            raise ValueError(
+                f"Invalid benchmark suite {name} - must be one of {', '.join(SUITES)}"
+            )
+    results = {}
+    for name in suites:
+        if progress is not None:
+            progress(name)
+        results[name] = SUITES[name](**kwargs)
+    return {"metadata": metadata(), "results": results}
@@ -0,0 +1,168 @@
+"""
+UBXReader stream benchmarks.
+
+Times reading a generated stream of UBX messages (optionally
+interleaved with NMEA sentences and RTCM3 frames) in its entirety
+through UBXReader, from a BytesIO buffer, a file, a memory-mapped
+file and a SocketStream over a local socket pair.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import os
+import socket
+import tempfile
+import threading
+from io import BytesIO
+
+from pyubx2 import GET, UBXMessage, UBXReader
+
+from benchmarks.common import measure
+
+MESSAGES = 10000  # default number of messages in stream
+# UBX messages in stream, with repeating group sizes
+UBXMESSAGES = (
+    ("NAV", "NAV-PVT", {}),
+    ("NAV", "NAV-SAT", {"numSvs": 20}),
+    ("NAV", "NAV-DOP", {}),
+    ("NAV", "NAV-HPPOSLLH", {}),
+    ("NAV", "NAV-STATUS", {}),
+    ("RXM", "RXM-RAWX", {"numMeas": 20}),
+)
+# NMEA sentences and RTCM3 1005, 1230 and 4072 frames in mixed stream
+NMEAMESSAGES = (
+    b"$GNGLL,3203.94995,N,03446.42914,E,084158.00,A,D*77\r\n",
+    b"$GNRMC,084159.00,A,3203.94995,N,03446.42914,E,0.000,,080222,,,D,V*1F\r\n",
+)
+RTCMMESSAGES = (
+    bytes.fromhex("d300133ed000038a58d9493c872f34109d07d6af48205ad7f7"),
+    bytes.fromhex("d300044ce00080ededd6"),
+    bytes.fromhex(
+        "d3003efe8001000000130ab88a400000080000000000000001ff9f00160200fe5c00190201"
+        "fedd001d030002860013050000000190060003f7001a06010425001ed24f2c"
+    ),
+)
+
+
+def generate_stream(messages: int = MESSAGES, mixed: bool = False) -> bytes:
+    """
+    Generate stream of messages.
+
+    :param int messages: number of messages (10000)
+    :param bool mixed: interleave NMEA and RTCM3 messages Y/N (False)
+    :return: stream data
+    :rtype: bytes
+    """
+
+    frames = [
+        UBXMessage(cls, identity, GET, **msgkwargs).serialize()
+        for cls, identity, msgkwargs in UBXMESSAGES
+    ]
+    if mixed:
+        frames += NMEAMESSAGES + RTCMMESSAGES
+    return b"".join(frames[i % len(frames)] for i in range(messages))
+
+
+def _read_all(stream: object, **kwargs) -> int:
+    """
+    Read all messages from stream.
+
+    :param object stream: data stream
+    :param kwargs: UBXReader keyword arguments
+    :return: number of messages read
+    :rtype: int
+    """
+
+    count = 0
+    for _ in UBXReader(stream, **kwargs):
+        count += 1
+    return count
+
+
+def _read_socket(data: bytes, **kwargs) -> int:
+    """
+    Read all messages sent over local socket pair.
+
+    :param bytes data: stream data
+    :param kwargs: UBXReader keyword arguments
+    :return: number of messages read
+    :rtype: int
+    """
+
+    sock, peer = socket.socketpair()
+
+    def send():
+        peer.sendall(data)
+        peer.close()
+
+    sender = threading.Thread(target=send, daemon=True)
+    sender.start()
+    try:
+        with sock:
+            return _read_all(sock, **kwargs)
+    finally:
+        sender.join()
+
+
+def stream_benchmarks(**kwargs) -> dict:
+    """
+    Time reading of generated streams.
+
+    :param int messages: (kwarg) number of messages in each stream (10000)
+    :param kwargs: (kwarg) measure keyword arguments e.g. repeat
+        (each timed loop reads the entire stream once)
+    :return: dict of stream type and timings, plus number of messages,
+        bytes and throughput in messages and MB per second
+    :rtype: dict
+    """
+
+    messages = int(kwargs.get("messages", MESSAGES))
+    measurekwargs = {"repeat": kwargs.get("repeat", 5), "number": 1}
+    ubxdata = generate_stream(messages)
+    mixdata = generate_stream(messages, True)
+    res = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "stream.ubx")
+        with open(path, "wb") as outfile:
+            outfile.write(ubxdata)
+
+        def read_file(**readkwargs):
+            with open(path, "rb") as stream:
+                return _read_all(stream, **readkwargs)
+
+        def read_mmap(**readkwargs):
+            ubr = UBXReader.from_file(path, **readkwargs)
+            count = sum(1 for _ in ubr)
+            ubr.datastream.close()
+            return count
+
+        benchmarks = {
+            "bytesio": (ubxdata, lambda: _read_all(BytesIO(ubxdata))),
+            "bytesio-frames": (
+                ubxdata,
+                lambda: _read_all(BytesIO(ubxdata), framesonly=True),
+            ),
+            "file": (ubxdata, read_file),
+            "mmap": (ubxdata, read_mmap),
+            "socket": (ubxdata, lambda: _read_socket(ubxdata)),
+            "mixed": (mixdata, lambda: _read_all(BytesIO(mixdata), protfilter=7)),
+            "mixed-frames": (
+                mixdata,
+                lambda: _read_all(BytesIO(mixdata), protfilter=7, framesonly=True),
+            ),
+        }
+        for name, (data, func) in benchmarks.items():
+            count = func()  # warm up and check all messages are read
+            timings = measure(func, **measurekwargs)
+            res[name] = {
+                "messages": count,
+                "bytes": len(data),
+                **timings,
+                "msgs_per_sec": count / timings["best"],
+                "mb_per_sec": len(data) / timings["best"] / 1e6,
+            }
+    return res
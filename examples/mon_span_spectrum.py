@@ -19,7 +19,7 @@ Created on 19 Nov 2020
 
 import matplotlib.pyplot as plt
 import numpy as np
-from pyubx2 import UBXReader, UBXMessage
+from pyubx2 import ARR_NUMPY, UBXReader, UBXMessage
 
 RF_SIGS = {
     "L1": 1.57542,
@@ -53,7 +53,7 @@ def plot_spectrum(msg: UBXMessage):
 
         # set data coordinates
         x_axis = np.arange(ctr - spn / 2, ctr + spn / 2, res) / 1e9  # plot as GHz
-        y_axis = np.array(spec)  # - pga  # adjust by receiver gain
+        y_axis = spec  # - pga  # adjust by receiver gain
         minhz = min(minhz, np.min(x_axis))
         maxhz = max(maxhz, np.max(x_axis))
         maxdb = max(maxdb, np.max(y_axis))
@@ -81,7 +81,8 @@ def plot_spectrum(msg: UBXMessage):
 if __name__ == "__main__":
     # read binary UBX data stream containing one or more MON-SPAN messages
     with open("mon_span.ubx", "rb") as stream:
-        ubr = UBXReader(stream)
+        # return spectrum as NumPy array rather than list
+        ubr = UBXReader(stream, arraytype=ARR_NUMPY)
         for raw_data, parsed_data in ubr:
             if parsed_data.identity == "MON-SPAN":
                 plot_spectrum(parsed_data)
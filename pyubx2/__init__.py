@@ -1,19 +1,17 @@
 """
 Created on 27 Sep 2020
 
+Payload definition tables (ubxtypes_get, ubxtypes_set, ubxtypes_poll,
+ubxtypes_configdb) and the pynmeagps coordinate helpers are imported
+on first use, but remain importable from the package as before.
+
 :author: semuadmin
 :copyright: SEMU Consulting © 2020
 :license: BSD 3-Clause
 """
 
-from pynmeagps.nmeahelpers import (
-    latlon2dmm,
-    latlon2dms,
-    llh2iso6709,
-    ecef2llh,
-    llh2ecef,
-    haversine,
-)
+from importlib import import_module
+
 from pyubx2._version import __version__
 from pyubx2.exceptions import (
     UBXMessageError,
@@ -23,14 +21,82 @@ from pyubx2.exceptions import (
     ParameterError,
     GNSSStreamError,
 )
+from pyubx2.ubxdecoder import UBXDecoder
+from pyubx2.ubxframe import UBXFrame
 from pyubx2.ubxmessage import UBXMessage
 from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxasyncreader import AsyncUBXReader
+from pyubx2.ubxparser import UBXParser
+from pyubx2.ubxcolumns import UBXColumnSink
+from pyubx2.ubxindex import UBXIndex
 from pyubx2.socket_stream import SocketStream
 from pyubx2.ubxtypes_core import *
-from pyubx2.ubxtypes_get import *
-from pyubx2.ubxtypes_poll import *
-from pyubx2.ubxtypes_set import *
 from pyubx2.ubxhelpers import *
-from pyubx2.ubxtypes_configdb import *
 
 version = __version__  # pylint: disable=invalid-name
+
+# names imported from module on first use
+_LAZY_NAMES = {
+    "latlon2dmm": "pynmeagps",
+    "latlon2dms": "pynmeagps",
+    "llh2iso6709": "pynmeagps",
+    "ecef2llh": "pynmeagps",
+    "llh2ecef": "pynmeagps",
+    "haversine": "pynmeagps",
+    "UBX_PAYLOADS_GET": "pyubx2.ubxtypes_get",
+    "UBX_PAYLOADS_POLL": "pyubx2.ubxtypes_poll",
+    "UBX_GET": "pyubx2.ubxtypes_set",
+    "UBX_PAYLOADS_SET": "pyubx2.ubxtypes_set",
+    "SET_LAYER_RAM": "pyubx2.ubxtypes_configdb",
+    "SET_LAYER_BBR": "pyubx2.ubxtypes_configdb",
+    "SET_LAYER_FLASH": "pyubx2.ubxtypes_configdb",
+    "POLL_LAYER_RAM": "pyubx2.ubxtypes_configdb",
+    "POLL_LAYER_BBR": "pyubx2.ubxtypes_configdb",
+    "POLL_LAYER_FLASH": "pyubx2.ubxtypes_configdb",
+    "POLL_LAYER_DEFAULT": "pyubx2.ubxtypes_configdb",
+    "TXN_NONE": "pyubx2.ubxtypes_configdb",
+    "TXN_START": "pyubx2.ubxtypes_configdb",
+    "TXN_ONGOING": "pyubx2.ubxtypes_configdb",
+    "TXN_COMMIT": "pyubx2.ubxtypes_configdb",
+    "UBX_CONFIG_STORSIZE": "pyubx2.ubxtypes_configdb",
+    "UBX_CONFIG_DATABASE": "pyubx2.ubxtypes_configdb",
+}
+# submodules imported on first use
+_LAZY_MODULES = ("ubxtypes_get", "ubxtypes_set", "ubxtypes_poll", "ubxtypes_configdb")
+
+__all__ = (
+    [name for name in globals() if name[0] != "_"]
+    + list(_LAZY_NAMES)
+    + list(_LAZY_MODULES)
+)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import name from its module, or submodule, on first access.
+
+    :param str name: name e.g. 'UBX_PAYLOADS_GET' or 'ubxtypes_get'
+    :return: named object
+    :rtype: object
+    :raises: AttributeError
+    """
+
+    if name in _LAZY_MODULES:
+        val = globals()[name] = import_module(f"{__name__}.{name}")
+        return val
+    module = _LAZY_NAMES.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    val = globals()[name] = getattr(import_module(module), name)
+    return val
+
+
+def __dir__() -> list:
+    """
+    List module names, including those not yet imported.
+
+    :return: list of names
+    :rtype: list
+    """
+
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_MODULES))
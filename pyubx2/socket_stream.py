@@ -22,6 +22,12 @@ from socket import socket
 class SocketStream:
     """
     socket stream class.
+
+    Data is received into a preallocated buffer with
+    socket.recv_into(). Unread data lies between a read cursor and
+    a write cursor, so reads do not copy the remaining buffer, and
+    unread data is only moved to the front of the buffer when
+    there is insufficient free space at the end.
     """
 
     def __init__(self, sock: socket, **kwargs):
@@ -34,34 +40,77 @@ class SocketStream:
 
         self._socket = sock
         self._bufsize = kwargs.get("bufsize", 4096)
-        self._buffer = bytearray()
+        self._buffer = bytearray(self._bufsize * 4)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # read cursor
+        self._end = 0  # write cursor
         self._recv()  # populate initial buffer
 
     def _recv(self) -> bool:
         """
         Read bytes from socket into internal buffer.
 
-        :return: return code (0 = failure, 1 = success)
+        :return: return code (0 = failure or connection closed, 1 = success)
         :rtype: bool
         """
 
+        if len(self._buffer) - self._end < self._bufsize:
+            self._make_space()
         try:
-            data = self._socket.recv(self._bufsize)
-            self._buffer += data
+            num = self._socket.recv_into(
+                self._view[self._end : self._end + self._bufsize], self._bufsize
+            )
         except (OSError, TimeoutError):
             return False
+        if not num:  # connection closed
+            return False
+        self._end += num
         return True
 
+    def _make_space(self):
+        """
+        Make space for a further recv at end of internal buffer,
+        by moving unread data to the front of the buffer or,
+        if necessary, enlarging the buffer.
+        """
+
+        unread = self._end - self._start
+        if len(self._buffer) - unread < self._bufsize:  # enlarge
+            buffer = bytearray(max(len(self._buffer) * 2, unread + self._bufsize))
+            buffer[0:unread] = self._view[self._start : self._end]
+            self._view.release()
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        else:
+            self._view[0:unread] = self._view[self._start : self._end]
+        self._start = 0
+        self._end = unread
+
+    def _take(self, num: int) -> bytes:
+        """
+        Consume specified number of bytes from internal buffer.
+
+        :param int num: number of bytes
+        :return: bytes
+        :rtype: bytes
+        """
+
+        data = bytes(self._view[self._start : self._start + num])
+        self._start += num
+        if self._start == self._end:  # buffer empty, reset cursors
+            self._start = self._end = 0
+        return data
+
     @property
     def buffer(self) -> bytearray:
         """
         Getter for buffer.
 
-        :return: buffer
+        :return: buffer (unread data)
         :rtype: bytearray
         """
 
-        return self._buffer
+        return self._buffer[self._start : self._end]
 
     def read(self, num: int) -> bytes:
         """
@@ -74,12 +123,24 @@ class SocketStream:
         """
 
         # if at end of internal buffer, top it up from socket
-        while len(self._buffer) < num:
+        while self._end - self._start < num:
             if not self._recv():
                 return b""
-        data = self._buffer[:num]
-        self._buffer = self._buffer[num:]
-        return bytes(data)
+        return self._take(num)
+
+    def read1(self, num: int) -> bytes:
+        """
+        Read up to specified number of bytes from buffer, only
+        receiving from socket if buffer is empty.
+
+        :param int num: maximum number of bytes to read
+        :return: bytes read (empty if socket has failed or closed)
+        :rtype: bytes
+        """
+
+        if self._start == self._end and not self._recv():
+            return b""
+        return self._take(min(num, self._end - self._start))
 
     def readline(self) -> bytes:
         """
@@ -90,14 +151,11 @@ class SocketStream:
         :rtype: bytes
         """
 
-        line = b""
+        searched = 0  # number of unread bytes already searched
         while True:
-            data = self.read(1)
-            if len(data) == 1:
-                line += data
-                if line[-1:] == b"\n":  # LF
-                    break
-            else:
-                break
-
-        return line
+            end = self._buffer.find(b"\n", self._start + searched, self._end)
+            if end >= 0:  # LF
+                return self._take(end + 1 - self._start)
+            searched = self._end - self._start
+            if not self._recv():
+                return self._take(searched)
@@ -0,0 +1,97 @@
+"""
+AsyncUBXReader class.
+
+Reads and parses individual UBX, NMEA or RTCM3 messages from an
+asyncio StreamReader (e.g. as returned by asyncio.open_connection
+or a serial_asyncio connection), for use in asyncio applications:
+
+async for (raw_data, parsed_data) in AsyncUBXReader(stream):
+    ...
+
+Data is read from the StreamReader as it becomes available and
+framed and parsed by an internal UBXReader, so protocol detection,
+filtering and error handling are identical to UBXReader.read().
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from pyubx2.ubxreader import UBXReader
+
+
+class AsyncUBXReader:
+    """
+    AsyncUBXReader class.
+    """
+
+    def __init__(self, datastream: object, **kwargs):
+        """Constructor.
+
+        :param StreamReader datastream: asyncio input data stream
+        :param int bufsize: (kwarg) maximum number of bytes to read from stream at a time (4096)
+        :param kwargs: optional UBXReader keyword arguments (protfilter, quitonerror etc.)
+        """
+
+        self._stream = datastream
+        self._bufsize = int(kwargs.get("bufsize", 4096))
+        self._ubr = UBXReader(None, **kwargs)
+
+    def __aiter__(self):
+        """Asynchronous iterator."""
+
+        return self
+
+    async def __anext__(self) -> tuple:
+        """
+        Return next item in asynchronous iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage)
+        :rtype: tuple
+        :raises: StopAsyncIteration
+
+        """
+
+        (raw_data, parsed_data) = await self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopAsyncIteration
+        return (raw_data, parsed_data)
+
+    async def read(self) -> tuple:
+        """
+        Read a single NMEA, UBX or RTCM3 message from the stream
+        and return both raw and parsed data, awaiting further data
+        from the stream until a complete message is available.
+
+        'protfilter' determines which protocols are parsed.
+        'quitonerror' determines whether to raise, log or ignore parsing errors.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage, NMEAMessage,
+            RTCMMessage or UBXFrame), or (None, None) at end of stream
+        :rtype: tuple
+        :raises: UBXStreamError (if unrecognised protocol in data stream)
+        """
+
+        # pylint: disable=protected-access
+
+        while True:
+            msg = self._ubr._read_buffered()
+            if msg is not None:
+                return msg
+            data = await self._stream.read(self._bufsize)
+            if not data:  # EOF
+                return (None, None)
+            self._ubr._feed(data)
+
+    @property
+    def datastream(self) -> object:
+        """
+        Getter for stream.
+
+        :return: data stream
+        :rtype: StreamReader
+        """
+
+        return self._stream
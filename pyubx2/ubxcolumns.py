@@ -0,0 +1,350 @@
+"""
+UBXColumnSink class.
+
+Accumulates selected attributes of selected UBX message types
+from a data stream into columnar form, with one typed array per
+attribute, for efficient loading into analytics tools such as
+pandas or Arrow / Parquet:
+
+sink = UBXColumnSink({"NAV-PVT": ["iTOW", "lat", "lon", "hMSL", "fixType"]})
+sink.consume(UBXReader(stream, framesonly=True, msgfilter={"NAV-PVT"}))
+cols = sink.to_numpy()["NAV-PVT"]  # dict of attribute name and numpy.ndarray
+df = pandas.DataFrame(cols)
+
+Rather than instantiating a UBXMessage for each message, the fixed
+(non-repeating) part of each raw payload is appended to a buffer
+and each batch of payloads is converted in a single np.frombuffer
+operation. Column types are derived from the payload definitions
+(see ubxtypes_get), with scale factors and bitfields applied
+according to the 'scaling' and 'parsebitfield' settings.
+
+Requires NumPy. Conversion to Arrow tables or Parquet files
+additionally requires pyarrow.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from importlib import import_module
+
+import pyubx2.exceptions as ube
+import pyubx2.ubxtypes_core as ubt
+from pyubx2.ubxdecoder import OP_BLOCK, get_decoder, get_scales
+from pyubx2.ubxhelpers import lazy_import, validate_checksums
+from pyubx2.ubxmessage import VERSION_SELECTORS, UBXMessage
+from pyubx2.ubxnumpy import block_dtypes, check_numpy, convert_columns, field_names, np
+
+ubg = lazy_import("pyubx2.ubxtypes_get")
+pa = lazy_import("pyarrow")  # pyarrow is optional
+
+BATCHSIZE = 65536
+
+
+class UBXColumnSink:
+    """
+    UBXColumnSink class.
+    """
+
+    def __init__(self, identities: object, **kwargs):
+        """Constructor.
+
+        :param object identities: dict of message identity and list of attribute names
+            (None = all attributes in fixed part of payload), or list of message identities
+        :param int batchsize: (kwarg) messages of each type to accumulate before conversion (65536)
+        :param bool parsebitfield: (kwarg) parse bitfields ('X' type attributes) Y/N (True)
+        :param bool scaling: (kwarg) apply scale factors Y/N (True)
+        :param object onbatch: (kwarg) function called with (identity, dict of arrays) for
+            each converted batch, in which case batches are not retained (None)
+        :raises: UBXMessageError (if NumPy not installed or invalid identity)
+        """
+
+        check_numpy()
+        if not isinstance(identities, dict):
+            identities = {identity: None for identity in identities}
+        msgids = {name: key for key, name in ubt.UBX_MSGIDS.items()}
+        self._ids = {}  # message class/id as bytes: identity
+        self._versioned = set()  # message class/ids with payload-selected definitions
+        self._names = {}  # identity: tuple of attribute names
+        self._batches = {}  # identity: list of converted batches
+        for identity, names in identities.items():
+            msgid = msgids.get(identity, b"")
+            if len(msgid) != 2:
+                raise ube.UBXMessageError(f"Unknown or unsupported identity {identity}")
+            self._ids[msgid] = identity
+            if (ubt.GET, msgid) in VERSION_SELECTORS:
+                self._versioned.add(msgid)
+            self._names[identity] = None if names is None else tuple(names)
+            self._batches[identity] = []
+        self._batchsize = int(kwargs.get("batchsize", BATCHSIZE))
+        self._parsebf = kwargs.get("parsebitfield", True)
+        self._scaling = kwargs.get("scaling", True)
+        self._onbatch = kwargs.get("onbatch", None)
+        # (message class/id, payload length[, first 2 bytes of payload]): layout
+        self._layouts = {}
+        self._decoders = {}  # payload decoder: layout
+        self._pending = {}  # identity: [payloads as bytearray, count, layout]
+        self._pdicts = {}  # identity: payload definition of latest layout
+
+    def add(self, raw: bytes) -> bool:
+        """
+        Add raw UBX message to sink, if of a selected type.
+
+        :param bytes raw: raw UBX message, including header and checksum
+        :return: True if message added, False if ignored
+        :rtype: bool
+        :raises: UBXMessageError (if attribute not in fixed part of payload)
+        """
+
+        msgid = bytes(raw[2:4])
+        key = (msgid, len(raw) - 8)
+        if msgid in self._versioned:  # definition selected by e.g. version byte
+            key += (bytes(raw[6:8]),)
+        layout = self._layouts.get(key, 0)
+        if layout == 0:  # first message of this type and length
+            layout = self._layouts[key] = self._get_layout(raw)
+        if layout is None:  # not selected or payload too short
+            return False
+        identity = layout[0]
+        pending = self._pending.get(identity, None)
+        if pending is None or pending[2] is not layout:
+            if pending is not None:  # payload version changed
+                self._flush(identity)
+            pending = self._pending[identity] = [bytearray(), 0, layout]
+        pending[0] += raw[6 : 6 + layout[1]]
+        pending[1] += 1
+        if pending[1] >= self._batchsize:
+            self._flush(identity)
+        return True
+
+    def consume(self, stream: object) -> int:
+        """
+        Add all selected UBX messages from UBXReader (or any iterable
+        of (raw_data, parsed_data) tuples) to sink. A UBXReader
+        created with framesonly=True and a msgfilter of the selected
+        identities is the most efficient source.
+
+        :param object stream: UBXReader
+        :return: number of messages added
+        :rtype: int
+        """
+
+        add = self.add
+        count = 0
+        for raw, _ in stream:
+            if raw is not None and raw[0:2] == ubt.UBX_HDR:
+                count += add(raw)
+        return count
+
+    def consume_buffer(self, buffer: object) -> int:
+        """
+        Add all selected UBX messages with valid checksums in buffer
+        (e.g. the contents of a log file) to sink. Frames are located
+        and validated in bulk (see validate_checksums), which is
+        considerably faster than reading the buffer with UBXReader.
+        Any non-UBX data is ignored.
+
+        :param object buffer: buffer e.g. bytes, bytearray, memoryview or mmap
+        :return: number of messages added
+        :rtype: int
+        """
+
+        view = memoryview(buffer).cast("B")
+        add = self.add
+        count = 0
+        for offset, length, valid in validate_checksums(view):
+            if valid:
+                count += add(view[offset : offset + length])
+        return count
+
+    def _get_layout(self, raw: bytes) -> tuple:
+        """
+        Get layout of fixed part of payload for message type.
+
+        :param bytes raw: raw UBX message
+        :return: tuple of (identity, size, raw dtype, compiled fields, attribute names),
+            or None if message is not selected or payload is too short
+        :rtype: tuple
+        :raises: UBXMessageError (if attribute not in fixed part of payload)
+        """
+
+        # pylint: disable=protected-access
+
+        raw = bytes(raw)
+        identity = self._ids.get(raw[2:4], None)
+        if identity is None:
+            return None
+        payload = raw[6:-2]
+        msg = UBXMessage(raw[2:3], raw[3:4], ubt.GET, payload=payload, lazy=True)
+        pdict = msg._get_dict(payload=payload)
+        self._pdicts[identity] = pdict
+        decoder = get_decoder(pdict, parsebitfield=self._parsebf, scaling=self._scaling)
+        if decoder is None:
+            raise ube.UBXMessageError(f"{identity} cannot be converted")
+        layout = self._decoders.get(decoder, None)
+        if layout is not None:  # same payload definition as previous length
+            return None if len(payload) < layout[1] else layout
+        size = 0
+        dtnames, formats, offsets, fields = [], [], [], ()
+        for op in decoder.plan:  # leading fixed size blocks
+            if op[0] != OP_BLOCK:
+                break
+            rawdtype, _ = block_dtypes(op[1], op[2])
+            for name in rawdtype.names:
+                dtnames.append(name)
+                formats.append(rawdtype.fields[name][0])
+                offsets.append(size + rawdtype.fields[name][1])
+            fields += op[2]
+            size += op[1].size
+        names = self._names[identity]
+        available = field_names(fields)
+        if names is None:
+            names = self._names[identity] = tuple(
+                name for name in available if name[0] != "_"
+            )
+        missing = [name for name in names if name not in available]
+        if missing:
+            raise ube.UBXMessageError(
+                f"{identity} attribute(s) {', '.join(missing)} not in fixed part of payload"
+            )
+        rawdtype = np.dtype(
+            {"names": dtnames, "formats": formats, "offsets": offsets, "itemsize": size}
+        )
+        layout = self._decoders[decoder] = (identity, size, rawdtype, fields, names)
+        return None if len(payload) < size else layout
+
+    def _flush(self, identity: str):
+        """
+        Convert pending payloads of given message type to batch of arrays.
+
+        :param str identity: message identity
+        """
+
+        payloads, count, (_, _, rawdtype, fields, names) = self._pending.pop(identity)
+        raw = np.frombuffer(payloads, dtype=rawdtype, count=count)
+        cols = convert_columns(raw, fields, set(names))
+        batch = {name: np.ascontiguousarray(cols[name]) for name in names}
+        if self._onbatch is None:
+            self._batches[identity].append(batch)
+        else:
+            self._onbatch(identity, batch)
+
+    def flush(self):
+        """
+        Convert all pending messages.
+        """
+
+        for identity in list(self._pending):
+            self._flush(identity)
+
+    def to_numpy(self) -> dict:
+        """
+        Get accumulated messages as NumPy arrays. Array fields (e.g.
+        A256) are returned as 2-dimensional arrays.
+
+        :return: dict of identity and dict of attribute name and numpy.ndarray
+            (empty if no messages of that type)
+        :rtype: dict
+        """
+
+        self.flush()
+        res = {}
+        for identity, batches in self._batches.items():
+            if batches:
+                res[identity] = {
+                    name: np.concatenate([batch[name] for batch in batches])
+                    for name in self._names[identity]
+                }
+            else:
+                res[identity] = {}
+        return res
+
+    @property
+    def scales(self) -> dict:
+        """
+        Get scale factors of selected attributes, so that columns
+        accumulated as raw integers (scaling=False) can be scaled
+        once per column e.g. cols["lat"] * sink.scales["NAV-PVT"]["lat"].
+        Attributes with no scale factor are omitted.
+
+        :return: dict of identity and dict of attribute name and scale factor
+        :rtype: dict
+        """
+
+        res = {}
+        for identity, names in self._names.items():
+            pdict = self._pdicts.get(identity, None)
+            if pdict is None:  # no messages yet
+                pdict = ubg.UBX_PAYLOADS_GET.get(identity, {})
+            res[identity] = {
+                name: scale
+                for name, scale in get_scales(pdict).items()
+                if (name in pdict if names is None else name in names)
+            }
+        return res
+
+    def to_arrow(self) -> dict:
+        """
+        Get accumulated messages as Arrow tables, with one record batch
+        per converted batch of messages.
+
+        :return: dict of identity and pyarrow.Table
+        :rtype: dict
+        :raises: UBXMessageError (if pyarrow not installed)
+        """
+
+        if pa is None:
+            raise ube.UBXMessageError("pyarrow is not installed")
+        self.flush()
+        res = {}
+        for identity, batches in self._batches.items():
+            names = self._names[identity] or ()
+            res[identity] = pa.Table.from_batches(
+                [
+                    pa.RecordBatch.from_arrays(
+                        [_arrow_array(batch[name]) for name in names], names=names
+                    )
+                    for batch in batches
+                ],
+                schema=None if batches else pa.schema([]),
+            )
+        return res
+
+    def write_parquet(self, identity: str, where: object):
+        """
+        Write accumulated messages of given type to Parquet file.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :param object where: file path or writable file-like object
+        :raises: UBXMessageError (if pyarrow not installed)
+        """
+
+        table = self.to_arrow()[identity]
+        import_module("pyarrow.parquet").write_table(table, where)
+
+
+def _arrow_array(arr: object) -> object:
+    """
+    Convert NumPy array to Arrow array, converting 2-dimensional
+    arrays to fixed size lists, raw bytes to fixed size binary and
+    integers wider than 8 bytes (Python int objects) to decimal128,
+    or to strings if they exceed 38 digits.
+
+    :param numpy.ndarray arr: array
+    :return: Arrow array
+    :rtype: pyarrow.Array
+    """
+
+    if arr.ndim == 2:
+        return pa.FixedSizeListArray.from_arrays(pa.array(arr.ravel()), arr.shape[1])
+    if arr.dtype.kind == "V":
+        return pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(arr.dtype.itemsize), len(arr), [None, pa.py_buffer(arr.tobytes())]
+        )
+    if arr.dtype.kind == "O":
+        if all(abs(val) < 10**38 for val in arr):
+            return pa.array(arr.tolist(), type=pa.decimal128(38, 0))
+        return pa.array([str(val) for val in arr], type=pa.string())
+    return pa.array(arr)
@@ -0,0 +1,572 @@
+"""
+UBXDecoder class.
+
+Compiles a UBX payload definition (as held in the ubxtypes_get,
+ubxtypes_set and ubxtypes_poll modules) into a decode plan
+comprising precomputed struct formats for each fixed block of
+attributes, nested plans for repeating groups and precomputed
+scale factors and bitfield masks.
+
+Incoming payloads can then be decoded by running the plan,
+rather than interpreting the payload definition dictionary
+attribute by attribute. Plans are compiled once per payload
+definition and cached.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import struct
+import pyubx2.exceptions as ube
+import pyubx2.ubxtypes_core as ubt
+from pyubx2.ubxhelpers import (
+    attsiz,
+    atttyp,
+    bytes2array,
+    bytes2val,
+    cfgkey2name,
+    group_names,
+)
+
+# plan operation types
+OP_BLOCK = 0  # fixed block of attributes, unpacked with a single struct
+OP_GROUP = 1  # repeating group of attributes
+OP_STRING = 2  # variable length string (e.g. INF-NOTICE)
+OP_CFGVAL = 3  # CFG-VALGET configuration key value pairs
+
+# block attribute types
+FLD_VAL = 0  # value as unpacked
+FLD_SCALE = 1  # scaled value
+FLD_INT = 2  # non-standard size integer e.g. U3, U6
+FLD_ARRAY = 3  # array of unsigned integers e.g. A256
+FLD_BITS = 4  # bitfield parsed into individual flags
+FLD_BITSB = 5  # non-standard size bitfield e.g. X6, X24
+FLD_NAVHP = 6  # NAV-HPPOSLLH / NAV-HPPOSECEF high precision component
+
+BITFIELDS = (ubt.X1, ubt.X2, ubt.X4, ubt.X6, ubt.X8, ubt.X24)
+INTFMT = {1: "B", 2: "H", 4: "I", 8: "Q"}
+FLOATFMT = {4: "f", 8: "d"}
+
+# NAV-HPPOSLLH and NAV-HPPOSECEF high precision components,
+# with the standard precision component they are combined with
+# and the (hp multiplier, combined multiplier) used to combine them
+NAVHP = {
+    "_latHp": ("lat", "_lat", 0.01, 1e-7),
+    "_lonHp": ("lon", "_lon", 0.01, 1e-7),
+    "_heightHp": ("height", "_height", 0.1, 1),  # mm
+    "_hMSLHp": ("hMSL", "_hMSL", 0.1, 1),  # mm
+    "_ecefXHp": ("ecefX", "_ecefX", 0.01, 1),  # cm
+    "_ecefYHp": ("ecefY", "_ecefY", 0.01, 1),  # cm
+    "_ecefZHp": ("ecefZ", "_ecefZ", 0.01, 1),  # cm
+}
+NAVHP_KEYS = tuple(NAVHP) + tuple(std for _, std, _, _ in NAVHP.values())
+
+_DECODERS = {}  # cache of compiled decoders
+_SCALES = {}  # id of payload definition: (payload definition, scale factors)
+
+
+class UBXDecodeFallback(Exception):
+    """
+    Raised when a payload cannot be decoded by a compiled plan
+    (e.g. truncated payload), in which case the caller should
+    revert to interpreting the payload definition.
+    """
+
+
+class UBXDecoder:
+    """
+    UBXDecoder class.
+    """
+
+    def __init__(self, pdict: dict, **kwargs):
+        """
+        Constructor.
+
+        :param dict pdict: payload definition
+        :param bool parsebitfield: (kwarg) parse bitfields ('X' type attributes) Y/N (1)
+        :param bool scaling: (kwarg) apply scale factors Y/N (1)
+        :param bool cfgval: (kwarg) parse repeating group as CFG-VALGET key value pairs (0)
+        :param int arraytype: (kwarg) type of array ('A' type) attributes ARR_LIST (0) = list,
+            ARR_ARRAY (1) = array.array('B'), ARR_NUMPY (2) = numpy.ndarray (0)
+        :raises: UBXTypeError (if definition contains unknown attribute type,
+            or arraytype is invalid)
+        :raises: UBXDecodeFallback (if definition cannot be compiled)
+        """
+
+        self._pdict = pdict
+        self._parsebf = bool(kwargs.get("parsebitfield", True))
+        self._scaling = bool(kwargs.get("scaling", True))
+        self._cfgval = bool(kwargs.get("cfgval", False))
+        self._arraytype = int(kwargs.get("arraytype", ubt.ARR_LIST))
+        bytes2array(b"", self._arraytype)  # check arraytype is valid
+        self._index = {}
+        self._names = {}  # attribute names by (id of block fields, suffix)
+        self._plan = self._compile(pdict, self._index)
+
+    def _compile(self, pdict: dict, index: dict = None) -> tuple:
+        """
+        Compile payload definition into tuple of plan operations.
+        Consecutive fixed size attributes are combined into a single
+        OP_BLOCK operation.
+
+        If an index dict is provided, it is populated with the payload
+        offset of each attribute preceding the first repeating group
+        or variable length string (i.e. those attributes whose offset
+        does not depend on the payload content).
+
+        :param dict pdict: payload definition
+        :param dict index: attribute index to be populated (None)
+        :return: plan
+        :rtype: tuple
+        """
+
+        plan = []
+        fmt = ""
+        fields = []
+        offset = 0
+        for key, att in pdict.items():
+            if isinstance(att, tuple):
+                numr, attd = att
+                if numr in BITFIELDS:
+                    fmt1, field = self._compile_bitfield(key, numr, attd)
+                else:
+                    fmt1, field = None, self._compile_group(numr, attd)
+            elif att == ubt.CH:
+                fmt1, field = None, (OP_STRING, key)
+            else:
+                fmt1, field = self._compile_attribute(key, att)
+            if fmt1 is not None:
+                if index is not None:
+                    offset = self._index_attribute(index, offset, fmt1, field)
+                fmt += fmt1
+                fields.append(field)
+                continue
+            index = None  # subsequent offsets depend on payload content
+            op = field
+            if fields:
+                plan.append((OP_BLOCK, struct.Struct("<" + fmt), tuple(fields)))
+                fmt = ""
+                fields = []
+            plan.append(op)
+        if fields:
+            plan.append((OP_BLOCK, struct.Struct("<" + fmt), tuple(fields)))
+        return tuple(plan)
+
+    @staticmethod
+    def _index_attribute(index: dict, offset: int, fmt: str, field: tuple) -> int:
+        """
+        Add compiled attribute to attribute index. Bitfield flags are
+        indexed against the bitfield as a whole. NAVHP elements are
+        not indexed, as they must be combined with other attributes.
+
+        :param dict index: attribute index
+        :param int offset: payload offset in bytes
+        :param str fmt: attribute struct format
+        :param tuple field: compiled attribute
+        :return: offset of next attribute
+        :rtype: int
+        """
+
+        stc = struct.Struct("<" + fmt)
+        key, fld, arg = field
+        if fld in (FLD_BITS, FLD_BITSB):
+            for keyb, _, _ in arg:
+                index[keyb] = (offset, stc, field)
+        elif fld != FLD_NAVHP and key not in NAVHP_KEYS:
+            index[key] = (offset, stc, field)
+        return offset + stc.size
+
+    def _compile_attribute(self, key: str, att: object) -> tuple:
+        """
+        Compile single attribute.
+
+        :param str key: attribute keyword
+        :param object att: attribute type string, or list of [type, scale]
+        :return: tuple of (struct format, (key, field type, field arg))
+        :rtype: tuple
+        :raises: UBXTypeError
+        """
+
+        scale = None
+        if isinstance(att, list):
+            att, scale = att
+            if not self._scaling or key in NAVHP_KEYS:
+                scale = None  # NAVHP elements are combined unscaled
+        typ = atttyp(att)
+        siz = attsiz(att)
+
+        if typ in ("E", "L", "U", "I") and siz in INTFMT:
+            fmt = INTFMT[siz].lower() if typ == "I" else INTFMT[siz]
+            fld = (key, FLD_VAL, None)
+        elif typ == "R" and siz in FLOATFMT:
+            fmt = FLOATFMT[siz]
+            fld = (key, FLD_VAL, None)
+        elif typ in ("E", "L", "U", "I"):
+            fmt = f"{siz}s"
+            fld = (key, FLD_INT, typ == "I")
+        elif typ in ("C", "X"):
+            fmt = f"{siz}s"
+            fld = (key, FLD_VAL, None)
+        elif typ == "A":
+            fmt = f"{siz}s"
+            fld = (key, FLD_ARRAY, self._arraytype)
+        else:
+            raise ube.UBXTypeError(f"Unknown attribute type {att}")
+
+        if scale is not None:
+            if fld[1] != FLD_VAL or typ in ("C", "X"):
+                raise UBXDecodeFallback(f"Unsupported scaled attribute type {att}")
+            fld = (key, FLD_SCALE, scale)
+        elif key in NAVHP:
+            fld = (key, FLD_NAVHP, NAVHP[key])
+        return fmt, fld
+
+    def _compile_bitfield(self, key: str, bft: str, bfd: dict) -> tuple:
+        """
+        Compile bitfield attribute, precomputing the bit offset
+        and mask of each (non-reserved) flag.
+
+        :param str key: bitfield keyword
+        :param str bft: type of bitfield e.g. 'X004'
+        :param dict bfd: bitfield definition
+        :return: tuple of (struct format, (key, field type, field arg))
+        :rtype: tuple
+        """
+
+        bfs = attsiz(bft)
+        if not self._parsebf:  # treat bitfield as a single byte array
+            return f"{bfs}s", (key, FLD_VAL, None)
+
+        bits = []
+        bfoffset = 0
+        for keyb, keyt in bfd.items():
+            atts = attsiz(keyt)
+            if keyb[0:8] != "reserved":  # don't bother to set reserved bits
+                bits.append((keyb, bfoffset, pow(2, atts) - 1))
+            bfoffset += atts
+        if bfs in INTFMT:
+            return INTFMT[bfs], (key, FLD_BITS, tuple(bits))
+        return f"{bfs}s", (key, FLD_BITSB, tuple(bits))
+
+    def _compile_group(self, numr: object, attd: dict) -> tuple:
+        """
+        Compile repeating group.
+
+        :param object numr: number of repeats as int, or name of attribute
+            holding number of repeats, or 'None' if variable by size
+        :param dict attd: group definition
+        :return: plan operation
+        :rtype: tuple
+        """
+
+        if self._cfgval:
+            return (OP_CFGVAL,)
+        plan = self._compile(attd)
+        size = 0
+        if len(plan) == 1 and plan[0][0] == OP_BLOCK:
+            size = plan[0][1].size
+        if numr == "None":
+            if size == 0:
+                raise UBXDecodeFallback("Unsupported variable size group")
+            numr = None
+        return (OP_GROUP, numr, plan, size)
+
+    def decode(self, payload: bytes) -> dict:
+        """
+        Decode payload to dictionary of attribute values,
+        in payload definition order.
+
+        :param bytes payload: raw payload
+        :return: dict of {attribute name: value}
+        :rtype: dict
+        :raises: UBXDecodeFallback (if payload does not match definition)
+        """
+
+        vals = {}
+        try:
+            self._run(self._plan, payload, 0, vals, "")
+        except (KeyError, IndexError, ValueError, struct.error) as err:
+            raise UBXDecodeFallback(str(err)) from err
+        return vals
+
+    def _run(
+        self, plan: tuple, payload: bytes, offset: int, vals: dict, sfx: str
+    ) -> int:
+        """
+        Run (nested) plan against payload.
+
+        :param tuple plan: plan
+        :param bytes payload: raw payload
+        :param int offset: payload offset in bytes
+        :param dict vals: dict of decoded values to be updated
+        :param str sfx: repeating group index suffix e.g. '_01'
+        :return: offset
+        :rtype: int
+        """
+
+        for op in plan:
+            typ = op[0]
+            if typ == OP_BLOCK:
+                _, stc, fields = op
+                end = offset + stc.size
+                if end > len(payload):
+                    raise UBXDecodeFallback("Payload truncated")
+                self._unpack(
+                    fields,
+                    stc.unpack_from(payload, offset),
+                    vals,
+                    self._block_names(fields, sfx),
+                )
+                offset = end
+            elif typ == OP_GROUP:
+                _, numr, sub, size = op
+                if isinstance(numr, int):
+                    rng = numr
+                elif numr is None:  # variable by size
+                    rng = max((len(payload) - offset) // size, 0)
+                else:  # number of repeats held in named attribute
+                    rng = vals[numr]
+                if size:  # fixed size group, unpack all repeats at once
+                    end = offset + size * rng
+                    if end > len(payload):
+                        raise UBXDecodeFallback("Payload truncated")
+                    _, stc, fields = sub[0]
+                    for names, values in zip(
+                        self._group_names(fields, sfx, rng),
+                        stc.iter_unpack(payload[offset:end]),
+                    ):
+                        self._unpack(fields, values, vals, names)
+                    offset = end
+                else:
+                    for sfxi in group_names(sfx, rng):
+                        offset = self._run(sub, payload, offset, vals, sfxi)
+            elif typ == OP_STRING:
+                atts = len(payload)
+                vals[op[1] + sfx] = bytes(payload[offset : offset + atts]).decode(
+                    "utf-8", "backslashreplace"
+                )
+                offset += atts
+            else:  # OP_CFGVAL
+                offset = self._run_cfgval(payload, offset, vals)
+        return offset
+
+    def decode_attribute(self, payload: bytes, name: str) -> dict:
+        """
+        Decode single attribute from payload, if the attribute's
+        offset is independent of the payload content. For bitfields,
+        all the flags in the bitfield are decoded.
+
+        :param bytes payload: raw payload
+        :param str name: attribute name e.g. 'lat'
+        :return: dict of {attribute name: value}, or None if attribute not indexed
+        :rtype: dict
+        :raises: UBXDecodeFallback (if payload does not match definition)
+        """
+
+        try:
+            offset, stc, field = self._index[name]
+        except KeyError:
+            return None
+        if offset + stc.size > len(payload):
+            raise UBXDecodeFallback("Payload truncated")
+        vals = {}
+        self._unpack(
+            (field,),
+            stc.unpack_from(payload, offset),
+            vals,
+            self._field_names((field,), ""),
+        )
+        return vals
+
+    @staticmethod
+    def _field_names(fields: tuple, sfx: str) -> tuple:
+        """
+        Get attribute names of compiled block attributes.
+
+        :param tuple fields: compiled block attributes
+        :param str sfx: repeating group index suffix e.g. '_01'
+        :return: tuple of attribute names, or of tuples of flag names for bitfields
+        :rtype: tuple
+        """
+
+        return tuple(
+            (
+                tuple(keyb + sfx for keyb, _, _ in arg)
+                if fld in (FLD_BITS, FLD_BITSB)
+                else key + sfx
+            )
+            for key, fld, arg in fields
+        )
+
+    def _block_names(self, fields: tuple, sfx: str) -> tuple:
+        """
+        Get attribute names of compiled block attributes, computed
+        once for each repeating group index suffix and cached.
+
+        :param tuple fields: compiled block attributes
+        :param str sfx: repeating group index suffix e.g. '_01'
+        :return: tuple of attribute names, or of tuples of flag names for bitfields
+        :rtype: tuple
+        """
+
+        key = (id(fields), sfx)
+        names = self._names.get(key, None)
+        if names is None:
+            names = self._names[key] = self._field_names(fields, sfx)
+        return names
+
+    def _group_names(self, fields: tuple, sfx: str, rng: int) -> tuple:
+        """
+        Get attribute names of compiled block attributes for each
+        repeat of fixed size repeating group, computed once and cached.
+
+        :param tuple fields: compiled group attributes
+        :param str sfx: repeating group index suffix of enclosing group
+        :param int rng: number of repeats
+        :return: tuple of attribute names for each repeat (at least rng)
+        :rtype: tuple
+        """
+
+        key = (id(fields), sfx, None)
+        table = self._names.get(key, None)
+        if table is None or len(table) < rng:
+            table = self._names[key] = tuple(
+                self._field_names(fields, sfxi) for sfxi in group_names(sfx, rng)
+            )
+        return table
+
+    @staticmethod
+    def _unpack(fields: tuple, values: tuple, vals: dict, names: tuple):
+        """
+        Apply precomputed scale factors, bitfield masks and
+        conversions to unpacked block of values.
+
+        :param tuple fields: compiled block attributes
+        :param tuple values: unpacked values
+        :param dict vals: dict of decoded values to be updated
+        :param tuple names: precomputed attribute names (see _field_names)
+        """
+
+        for (key, fld, arg), name, val in zip(fields, names, values):
+            if fld == FLD_VAL:
+                vals[name] = val
+            elif fld == FLD_SCALE:
+                vals[name] = round(val * arg, ubt.SCALROUND)
+            elif fld == FLD_BITS:
+                for (_, bfoffset, mask), nameb in zip(arg, name):
+                    vals[nameb] = (val >> bfoffset) & mask
+            elif fld == FLD_BITSB:
+                val = int.from_bytes(val, "little")
+                for (_, bfoffset, mask), nameb in zip(arg, name):
+                    vals[nameb] = (val >> bfoffset) & mask
+            elif fld == FLD_INT:
+                vals[name] = int.from_bytes(val, "little", signed=arg)
+            elif fld == FLD_ARRAY:
+                vals[name] = bytes2array(val, arg)
+            else:  # FLD_NAVHP
+                vals[key] = val
+                keyp, keys, hpscale, scale = arg
+                vals[keyp] = round((vals[keys] + val * hpscale) * scale, ubt.SCALROUND)
+
+    @staticmethod
+    def _run_cfgval(payload: bytes, offset: int, vals: dict) -> int:
+        """
+        Decode CFG-VALGET payload to set of configuration
+        key value pairs.
+
+        :param bytes payload: raw payload
+        :param int offset: payload offset in bytes
+        :param dict vals: dict of decoded values to be updated
+        :return: offset
+        :rtype: int
+        :raises: UBXMessageError
+        """
+
+        KEYLEN = 4
+        cfglen = len(payload) - offset
+        while offset < cfglen:
+            key = int.from_bytes(payload[offset : offset + KEYLEN], "little")
+            (keyname, att) = cfgkey2name(key)
+            atts = attsiz(att)
+            valb = payload[offset + KEYLEN : offset + KEYLEN + atts]
+            vals[keyname] = bytes2val(valb, att)
+            offset += KEYLEN + atts
+        return offset
+
+    @property
+    def plan(self) -> tuple:
+        """
+        Getter for compiled plan.
+
+        :return: plan as tuple of operations
+        :rtype: tuple
+        """
+
+        return self._plan
+
+
+def get_decoder(pdict: dict, **kwargs) -> object:
+    """
+    Get cached decoder for payload definition, compiling
+    it on first use.
+
+    :param dict pdict: payload definition
+    :param bool parsebitfield: (kwarg) parse bitfields ('X' type attributes) Y/N (1)
+    :param bool scaling: (kwarg) apply scale factors Y/N (1)
+    :param bool cfgval: (kwarg) parse repeating group as CFG-VALGET key value pairs (0)
+    :param int arraytype: (kwarg) type of array ('A' type) attributes ARR_LIST (0) = list,
+        ARR_ARRAY (1) = array.array('B'), ARR_NUMPY (2) = numpy.ndarray (0)
+    :return: UBXDecoder, or None if definition cannot be compiled
+    :rtype: UBXDecoder
+    :raises: UBXTypeError (if definition contains unknown attribute type)
+    """
+
+    key = (
+        id(pdict),
+        bool(kwargs.get("parsebitfield", True)),
+        bool(kwargs.get("scaling", True)),
+        bool(kwargs.get("cfgval", False)),
+        int(kwargs.get("arraytype", ubt.ARR_LIST)),
+    )
+    try:
+        return _DECODERS[key]
+    except KeyError:
+        pass
+    try:
+        decoder = UBXDecoder(pdict, **kwargs)
+    except UBXDecodeFallback:
+        decoder = None
+    _DECODERS[key] = decoder
+    return decoder
+
+
+def get_scales(pdict: dict) -> dict:
+    """
+    Get cached scale factors of scaled attributes in payload
+    definition, by attribute name without repeating group index
+    e.g. {"lat": 1e-07, "prRes": 0.1}, so that values decoded with
+    scaling=False (as raw integers) can be scaled on access or in
+    bulk. NAV-HPPOSLLH and NAV-HPPOSECEF high precision elements
+    are excluded, as they are always combined and scaled.
+
+    :param dict pdict: payload definition
+    :return: dict of attribute name and scale factor
+    :rtype: dict
+    """
+
+    entry = _SCALES.get(id(pdict), None)
+    if entry is not None and entry[0] is pdict:
+        return entry[1]
+    scales = {}
+    stack = [pdict]
+    while stack:
+        for key, att in stack.pop().items():
+            if isinstance(att, tuple):  # group or bitfield
+                stack.append(att[1])
+            elif isinstance(att, list) and key not in NAVHP_KEYS:
+                scales[key] = att[1]
+    _SCALES[id(pdict)] = (pdict, scales)
+    return scales
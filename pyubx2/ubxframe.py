@@ -0,0 +1,169 @@
+"""
+UBXFrame class.
+
+Lightweight record of a single raw UBX, NMEA or RTCM3 frame as
+read from a data stream, returned by UBXReader in 'framesonly'
+mode in place of a fully parsed message object.
+
+Frames carry the protocol, stream offset and raw bytes of the
+message. The message identity is derived on demand from the
+frame header without decoding the payload, and the payload and
+checksum are returned as memoryviews of the raw bytes rather
+than copies.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import pyubx2.ubxtypes_core as ubt
+from pyubx2.ubxhelpers import lazy_import
+
+pynmeagps = lazy_import("pynmeagps")  # imported on first use
+
+
+class UBXFrame:
+    """
+    UBXFrame class.
+    """
+
+    __slots__ = ("protocol", "offset", "raw")
+
+    def __init__(self, protocol: int, raw: bytes, offset: int = 0):
+        """
+        Constructor.
+
+        :param int protocol: protocol of frame 1 = NMEA, 2 = UBX, 4 = RTCM3
+        :param bytes raw: raw frame bytes, including header and checksum
+        :param int offset: byte offset of frame start in data stream (0)
+        """
+
+        self.protocol = protocol
+        self.offset = offset
+        self.raw = raw
+
+    def __len__(self) -> int:
+        """
+        Length of raw frame in bytes.
+
+        :return: length
+        :rtype: int
+        """
+
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: representation
+        :rtype: str
+        """
+
+        return (
+            f"UBXFrame(protocol={self.protocol}, raw={self.raw}, offset={self.offset})"
+        )
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: string representation
+        :rtype: str
+        """
+
+        prot = {
+            ubt.NMEA_PROTOCOL: "NMEA",
+            ubt.UBX_PROTOCOL: "UBX",
+            ubt.RTCM3_PROTOCOL: "RTCM3",
+        }.get(self.protocol, "UNKNOWN")
+        return (
+            f"<{prot}FRAME({self.identity}, offset={self.offset}, "
+            + f"length={len(self.raw)})>"
+        )
+
+    @property
+    def msgid(self) -> object:
+        """
+        Message id getter, taken from frame header.
+
+        :return: UBX class and id as bytes e.g. b'\\x01\\x07',
+            NMEA (talker, msgID) as tuple of str e.g. ('GN', 'GGA'),
+            or RTCM3 message number as int e.g. 1077
+        :rtype: object
+        """
+
+        raw = self.raw
+        if self.protocol == ubt.UBX_PROTOCOL:
+            return raw[2:4]
+        if self.protocol == ubt.RTCM3_PROTOCOL:
+            return (raw[3] << 4) | (raw[4] >> 4)
+        hdr = raw[1 : raw.find(b",")].decode("utf-8", "backslashreplace")
+        if hdr[0:1] == "P":  # proprietary
+            return ("P", hdr[1:])
+        return (hdr[0:2], hdr[2:])
+
+    @property
+    def identity(self) -> str:
+        """
+        Message identity getter, derived from frame header.
+
+        Unrecognised UBX messages are identified in the same way
+        as UBXMessage e.g. 'NAV-ff01-NOMINAL'.
+
+        :return: message identity e.g. 'NAV-PVT', 'GNGGA' or '1077'
+        :rtype: str
+        """
+
+        msgid = self.msgid
+        if self.protocol == ubt.RTCM3_PROTOCOL:
+            return str(msgid)
+        if self.protocol == ubt.NMEA_PROTOCOL:
+            # proprietary messages with sub-ids are identified in the
+            # same way as NMEAMessage e.g. 'PUBX00'
+            if msgid[0] == "P" and msgid[1] in pynmeagps.PROP_MSGIDS:
+                return "P" + msgid[1] + self.raw.split(b",", 2)[1].decode()
+            return msgid[0] + msgid[1]
+        try:
+            # all MGA messages except MGA-DBD are identified by the
+            # 'type' attribute - the first byte of the payload
+            if msgid[0:1] == b"\x13" and msgid[1:2] != b"\x80":
+                return ubt.UBX_MSGIDS[msgid + self.raw[6:7]]
+            return ubt.UBX_MSGIDS[msgid]
+        except KeyError:
+            cls = ubt.UBX_CLASSES.get(msgid[0:1], "UNKNOWN")
+            return f"{cls}-{msgid[0]:02x}{msgid[1]:02x}-NOMINAL"
+
+    @property
+    def payload(self) -> memoryview:
+        """
+        Payload getter, excluding header and checksum.
+
+        :return: payload as view of raw frame
+        :rtype: memoryview
+        """
+
+        raw = self.raw
+        if self.protocol == ubt.UBX_PROTOCOL:
+            return memoryview(raw)[6:-2]
+        if self.protocol == ubt.RTCM3_PROTOCOL:
+            return memoryview(raw)[3:-3]
+        return memoryview(raw)[raw.find(b",") + 1 : raw.rfind(b"*")]
+
+    @property
+    def checksum(self) -> memoryview:
+        """
+        Checksum getter (UBX checksum, NMEA hex checksum or RTCM3 CRC).
+
+        :return: checksum as view of raw frame
+        :rtype: memoryview
+        """
+
+        raw = self.raw
+        if self.protocol == ubt.UBX_PROTOCOL:
+            return memoryview(raw)[-2:]
+        if self.protocol == ubt.RTCM3_PROTOCOL:
+            return memoryview(raw)[-3:]
+        return memoryview(raw)[raw.rfind(b"*") + 1 : raw.rfind(b"*") + 3]
@@ -10,15 +10,62 @@ Created on 15 Dec 2020
 """
 # pylint: disable=invalid-name
 
+import importlib.util
+import re
 import struct
+import sys
+from array import array
 from datetime import datetime, timedelta
+from itertools import accumulate
 from math import sin, cos, pi
 from pyubx2.ubxtypes_core import GNSSLIST, UBX_HDR, NMEA_HDR
 import pyubx2.ubxtypes_core as ubt
-import pyubx2.ubxtypes_configdb as ubcdb
 import pyubx2.exceptions as ube
 
 
+def lazy_import(name: str) -> object:
+    """
+    Import module on first access to any of its attributes, rather
+    than immediately, to reduce import time. If the module has
+    already been imported, it is returned as is.
+
+    NB: if the module is a submodule, its parent package is imported
+    immediately.
+
+    :param str name: module name e.g. 'numpy'
+    :return: module, or None if module is not installed
+    :rtype: module
+    """
+
+    module = sys.modules.get(name, None)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ubcdb = lazy_import("pyubx2.ubxtypes_configdb")
+np = lazy_import("numpy")  # NumPy is optional
+
+NPCHECKSUM = 1024  # minimum content length for which NumPy checksum is used
+NPWINDOW = 1048576  # size of buffer window for NumPy batch checksum validation
+NPBATCH = 1024  # maximum number of frames per batch when scanning for frames
+UBX_HDR_RE = re.compile(UBX_HDR)
+REVERSECACHE = 32  # maximum number of cached reverse lookup dicts
+NAMETABLECACHE = 4096  # maximum number of cached attribute name tables
+GROUPNAMECACHE = 4096  # maximum number of cached repeating group name tables
+
+_REVERSE = {}  # (id of dictionary, value index): (dictionary, size, reverse dict)
+_NAMETABLES = {}  # tuple of attribute names: (tuple of names, name index dict)
+_GROUPNAMES = {}  # attribute name: tuple of repeating group attribute names
+
+
 def att2idx(att: str) -> int:
     """
     Get integer index corresponding to grouped attribute.
@@ -57,22 +104,159 @@ def calc_checksum(content: bytes) -> bytes:
     """
     Calculate checksum using 8-bit Fletcher's algorithm.
 
+    check_a is the sum of the content bytes and check_b is the sum
+    of the running values of check_a (both modulo 256), so both can
+    be summed in C rather than byte by byte - using NumPy for larger
+    content if it is installed, otherwise itertools.accumulate.
+
     :param bytes content: message content, excluding header and checksum bytes
+        (bytes, bytearray or memoryview)
     :return: checksum
     :rtype: bytes
 
     """
 
-    check_a = 0
-    check_b = 0
+    if np is not None and len(content) >= NPCHECKSUM:
+        cumsum = np.cumsum(np.frombuffer(content, dtype=np.uint8), dtype=np.uint64)
+        return bytes((int(cumsum[-1]) & 0xFF, int(cumsum.sum()) & 0xFF))
+    return bytes((sum(content) & 0xFF, sum(accumulate(content)) & 0xFF))
+
+
+def validate_checksums(buffer: object, offsets: object = None) -> list:
+    """
+    Validate the checksums of multiple UBX frames in a buffer in
+    a single call.
+
+    If no frame offsets are provided, the buffer is scanned for UBX
+    frames. Scanning resumes at the end of a frame with a valid
+    checksum, or immediately after the header of a frame with an
+    invalid checksum. Frames which extend beyond the end of the
+    buffer are ignored.
+
+    If NumPy is installed, the checksums of a batch of frames are
+    validated together using running sums over the buffer, rather
+    than being calculated separately for each frame.
+
+    :param object buffer: buffer e.g. bytes, bytearray, memoryview or mmap
+    :param object offsets: iterable of UBX frame start offsets, None = scan buffer (None)
+    :return: list of (offset, length, valid) tuples, where length is 0 if
+        there is no complete UBX frame at an offset provided
+    :rtype: list
+    """
+
+    view = memoryview(buffer).cast("B")
+    if offsets is not None:
+        frames = [(offset, _frame_length(view, offset)) for offset in offsets]
+        return [
+            (offset, length, valid)
+            for (offset, length), valid in zip(frames, _validate_frames(view, frames))
+        ]
+    results = []
+    pos = 0
+    while True:
+        # validate a batch of consecutive frames on the assumption that
+        # each is valid, then rescan from any frame found to be invalid
+        frames = _scan_frames(view, pos)
+        if not frames:
+            return results
+        for (offset, length), valid in zip(frames, _validate_frames(view, frames)):
+            results.append((offset, length, valid))
+            pos = offset + (length if valid else 2)
+            if not valid:
+                break
 
-    for char in content:
-        check_a += char
-        check_a &= 0xFF
-        check_b += check_a
-        check_b &= 0xFF
 
-    return bytes((check_a, check_b))
+def _frame_length(view: memoryview, offset: int) -> int:
+    """
+    Get length of complete UBX frame starting at offset in buffer.
+
+    :param memoryview view: buffer
+    :param int offset: frame start offset
+    :return: frame length, or 0 if no complete UBX frame at offset
+    :rtype: int
+    """
+
+    if offset < 0 or offset + 6 > len(view) or view[offset : offset + 2] != UBX_HDR:
+        return 0
+    length = 8 + int.from_bytes(view[offset + 4 : offset + 6], "little")
+    return length if offset + length <= len(view) else 0
+
+
+def _scan_frames(view: memoryview, pos: int) -> list:
+    """
+    Scan buffer for a batch of consecutive complete UBX frames,
+    assuming each frame found is valid.
+
+    :param memoryview view: buffer
+    :param int pos: position from which to scan
+    :return: list of (offset, length) tuples
+    :rtype: list
+    """
+
+    frames = []
+    while len(frames) < NPBATCH:
+        hdr = UBX_HDR_RE.search(view, pos)
+        if hdr is None:
+            break
+        offset = hdr.start()
+        length = _frame_length(view, offset)
+        if length == 0:  # incomplete frame at end of buffer
+            break
+        frames.append((offset, length))
+        pos = offset + length
+    return frames
+
+
+def _validate_frames(view: memoryview, frames: list) -> list:
+    """
+    Validate checksums of UBX frames in buffer.
+
+    With NumPy, for frame content c[start:end], check_a is
+    S[end] - S[start] and check_b is end * check_a - (W[end] - W[start]),
+    where S and W are the running sums of c[i] and i * c[i] over
+    a window of the buffer. uint64 overflow does not affect the
+    results modulo 256.
+
+    :param memoryview view: buffer
+    :param list frames: list of (offset, length) tuples (length 0 = invalid)
+    :return: list of valid flags
+    :rtype: list
+    """
+
+    if np is None:
+        return [
+            length > 0
+            and calc_checksum(view[offset + 2 : offset + length - 2])
+            == view[offset + length - 2 : offset + length]
+            for offset, length in frames
+        ]
+    valid = [False] * len(frames)
+    batch = sorted((offset, length, i) for i, (offset, length) in enumerate(frames))
+    batch = [frame for frame in batch if frame[1]]
+    first = 0
+    while first < len(batch):
+        wstart = wend = batch[first][0]
+        last = first
+        while last < len(batch) and batch[last][0] < wstart + NPWINDOW:
+            wend = max(wend, batch[last][0] + batch[last][1])
+            last += 1
+        arr = np.frombuffer(view[wstart:wend], dtype=np.uint8)
+        arr64 = arr.astype(np.uint64)
+        sums = np.zeros(len(arr) + 1, dtype=np.uint64)
+        np.cumsum(arr64, out=sums[1:])
+        wsums = np.zeros(len(arr) + 1, dtype=np.uint64)
+        np.cumsum(arr64 * np.arange(len(arr), dtype=np.uint64), out=wsums[1:])
+        offsets = np.array([frame[0] for frame in batch[first:last]]) - wstart
+        lengths = np.array([frame[1] for frame in batch[first:last]])
+        starts = offsets + 2
+        ends = offsets + lengths - 2
+        check_a = sums[ends] - sums[starts]
+        check_b = ends.astype(np.uint64) * check_a - (wsums[ends] - wsums[starts])
+        oks = ((check_a & 0xFF) == arr[ends]) & ((check_b & 0xFF) == arr[ends + 1])
+        for frame, ok in zip(batch[first:last], oks.tolist()):
+            valid[frame[2]] = ok
+        first = last
+    return valid
 
 
 def isvalid_checksum(message: bytes) -> bool:
@@ -210,13 +394,89 @@ def key_from_val(dictionary: dict, value) -> str:
 
     """
 
-    val = None
-    for key, val in dictionary.items():
-        if val == value:
-            return key
+    try:
+        return reverse_dict(dictionary)[value]
+    except TypeError:  # unhashable values, so search dictionary
+        for key, val in dictionary.items():
+            if val == value:
+                return key
+    except KeyError:
+        pass
     raise KeyError(f"No key found for value {value}")
 
 
+def reverse_dict(dictionary: dict, index: int = None) -> dict:
+    """
+    Helper method - get reverse lookup dict for dictionary, mapping
+    each value to the first key with that value.
+
+    The reverse dict is built on first use and cached. It is rebuilt
+    if entries have since been added to or removed from the dictionary.
+
+    :param dict dictionary: dictionary
+    :param int index: index of element within (tuple) values to look up, None = whole value
+    :return: reverse lookup dict
+    :rtype: dict
+    :raises: TypeError: if values are not hashable
+
+    """
+
+    cid = (id(dictionary), index)
+    entry = _REVERSE.get(cid, None)
+    if entry is None or entry[0] is not dictionary or entry[1] != len(dictionary):
+        reverse = {}
+        for key, val in dictionary.items():
+            reverse.setdefault(val if index is None else val[index], key)
+        if len(_REVERSE) >= REVERSECACHE:
+            _REVERSE.clear()
+        entry = _REVERSE[cid] = (dictionary, len(dictionary), reverse)
+    return entry[2]
+
+
+def name_table(names: tuple) -> tuple:
+    """
+    Helper method - get shared table for tuple of attribute names,
+    so that messages with the same attributes can hold their values
+    as a tuple without each holding its own copy of the names.
+
+    :param tuple names: attribute names
+    :return: tuple of (tuple of names, dict of name: position)
+    :rtype: tuple
+    """
+
+    table = _NAMETABLES.get(names, None)
+    if table is None:
+        if len(_NAMETABLES) >= NAMETABLECACHE:
+            _NAMETABLES.clear()
+        table = _NAMETABLES[names] = (names, {name: i for i, name in enumerate(names)})
+    return table
+
+
+def group_names(name: str, count: int) -> tuple:
+    """
+    Helper method - get names of repeating group attribute for
+    each of 'count' repeats, computed once and cached.
+
+    e.g. group_names("cno", 3) -> ("cno_01", "cno_02", "cno_03")
+
+    :param str name: attribute name, or enclosing group suffix e.g. '_01'
+    :param int count: number of repeats
+    :return: tuple of names
+    :rtype: tuple
+    """
+
+    if count <= 0:
+        return ()
+    names = _GROUPNAMES.get(name, None)
+    if names is None or len(names) < count:
+        if len(_GROUPNAMES) >= GROUPNAMECACHE:
+            _GROUPNAMES.clear()
+        names = _GROUPNAMES[name] = tuple(
+            f"{name}_{i:02d}" for i in range(1, count + 1)
+        )
+    return names if len(names) == count else names[:count]
+
+
 def get_bits(bitfield: bytes, bitmask: int) -> int:
     """
     Get integer value of specified (masked) bit(s) in a UBX bitfield (attribute type 'X')
@@ -259,10 +519,20 @@ def val2bytes(val, att: str) -> bytes:
     elif atttyp(att) in ("E", "L", "U"):  # unsigned integer
         valb = val.to_bytes(atts, byteorder="little", signed=False)
     elif atttyp(att) == "A":  # array of unsigned integers
-        atts = attsiz(att)
-        valb = b""
-        for i in range(atts):
-            valb += val[i].to_bytes(1, byteorder="little", signed=False)
+        # item type code of array('B'), memoryview or NumPy array, else 'B'
+        code = (
+            getattr(val, "typecode", None)
+            or getattr(val, "format", None)
+            or getattr(getattr(val, "dtype", None), "char", "B")
+        )
+        if code == "B":  # list, bytes or unsigned byte array
+            valb = bytes(val[:atts])
+        else:  # wider or signed items converted individually
+            valb = bytes(int(v) for v in val[:atts])
+        if len(valb) != atts:
+            raise ube.UBXTypeError(
+                f"Array attribute type {att} must have {atts} unsigned byte values"
+            )
     elif atttyp(att) == "I":  # signed integer
         valb = val.to_bytes(atts, byteorder="little", signed=True)
     elif att == ubt.R4:  # single precision floating point
@@ -293,10 +563,7 @@ def bytes2val(valb: bytes, att: str) -> object:
     elif atttyp(att) in ("E", "L", "U"):  # unsigned integer
         val = int.from_bytes(valb, "little", signed=False)
     elif atttyp(att) == "A":  # array of unsigned integers
-        atts = attsiz(att)
-        val = []
-        for i in range(atts):
-            val.append(valb[i])
+        val = list(valb)
     elif atttyp(att) == "I":  # signed integer
         val = int.from_bytes(valb, "little", signed=True)
     elif att == ubt.R4:  # single precision floating point
@@ -308,6 +575,32 @@ def bytes2val(valb: bytes, att: str) -> object:
     return val
 
 
+def bytes2array(valb: bytes, arraytype: int = ubt.ARR_LIST) -> object:
+    """
+    Convert bytes to array attribute (type 'A') value of given type,
+    in bulk rather than element by element. A NumPy array is a
+    read-only view of the bytes rather than a copy.
+
+    :param bytes valb: attribute value in byte format
+    :param int arraytype: ARR_LIST (0) = list of int, ARR_ARRAY (1) = array.array('B'),
+        ARR_NUMPY (2) = numpy.ndarray of uint8 (0)
+    :return: attribute value
+    :rtype: object
+    :raises: UBXTypeError (if arraytype is invalid or NumPy is not installed)
+
+    """
+
+    if arraytype == ubt.ARR_LIST:
+        return list(valb)
+    if arraytype == ubt.ARR_ARRAY:
+        return array("B", valb)
+    if arraytype == ubt.ARR_NUMPY:
+        if np is None:
+            raise ube.UBXTypeError("NumPy is not installed")
+        return np.frombuffer(bytes(valb), dtype=np.uint8)
+    raise ube.UBXTypeError(f"Invalid arraytype {arraytype} - must be 0, 1 or 2")
+
+
 def nomval(att: str) -> object:
     """
     Get nominal value for given UBX attribute type.
@@ -404,11 +697,9 @@ def cfgkey2name(keyID: int) -> tuple:
     """
 
     try:
-        val = None
-        for key, val in ubcdb.UBX_CONFIG_DATABASE.items():
-            (kid, typ) = val
-            if keyID == kid:
-                return (key, typ)
+        key = reverse_dict(ubcdb.UBX_CONFIG_DATABASE, 0).get(keyID, None)
+        if key is not None:
+            return (key, ubcdb.UBX_CONFIG_DATABASE[key][1])
 
         # undocumented configuration database key
         # type is derived from keyID
@@ -0,0 +1,369 @@
+"""
+UBXIndex class.
+
+Persistent message index for random access into capture files.
+
+The index is built in a single pass over the capture file using
+UBXReader in 'framesonly' mode, and records the offset, length,
+protocol, identity and (where available) iTOW of every valid frame.
+It is saved as a sidecar file alongside the capture
+(e.g. 'capture.ubx.idx') and reloaded on subsequent use, unless the
+capture file size has changed since the index was built.
+
+Individual messages can then be retrieved by number, or selected
+by identity and iTOW range, without rescanning the capture file.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import os
+import struct
+from array import array
+from mmap import ACCESS_READ, mmap
+
+from pyubx2.ubxdecoder import UBXDecodeFallback, get_decoder
+from pyubx2.ubxframe import UBXFrame
+from pyubx2.ubxreader import UBXReader
+import pyubx2.exceptions as ube
+import pyubx2.ubxtypes_core as ubt
+from pyubx2.ubxhelpers import lazy_import
+
+ubg = lazy_import("pyubx2.ubxtypes_get")  # imported on first use
+
+IDXMAGIC = b"UBXI"
+IDXVERSION = 1
+IDXEXT = ".idx"
+# magic, version, capture file size, number of frames, number of identities
+IDXHEADER = struct.Struct("<4sB3xQQI")
+NOITOW = -1  # iTOW value for frames without iTOW
+
+
+class UBXIndex:
+    """
+    UBXIndex class.
+    """
+
+    def __init__(self, path: str, idxpath: str = None, **kwargs):
+        """
+        Constructor. Loads the index for the capture file, building
+        (and saving) it first if it does not exist or is out of date.
+
+        :param str path: path to capture file
+        :param str idxpath: path to index file, None = capture path + '.idx' (None)
+        :param kwargs: optional UBXReader keyword arguments used when parsing messages
+            (other than 'protfilter', which is set to the protocol of each message)
+        :raises: UBXStreamError (if index file is invalid)
+        """
+
+        self._path = path
+        self._idxpath = path + IDXEXT if idxpath is None else idxpath
+        self._kwargs = kwargs
+        self._offsets = array("Q")  # frame offsets
+        self._lengths = array("I")  # frame lengths
+        self._protocols = array("B")  # frame protocols
+        self._ids = array("H")  # frame identities (index into names)
+        self._itows = array("q")  # frame iTOWs
+        self._names = []  # identity names
+        self._rows = {}  # cached frame numbers by identity
+        self._mapping = None
+
+        size = os.path.getsize(path)
+        if not self._load(size):
+            self._build()
+            self._save(size)
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Number of frames in index.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return len(self._offsets)
+
+    def __getitem__(self, num: int) -> tuple:
+        """
+        Get message number N (zero-based).
+
+        :param int num: message number
+        :return: tuple of (raw_data as bytes, parsed_data)
+        :rtype: tuple
+        :raises: IndexError
+        """
+
+        if num < 0:
+            num += len(self)
+        if not 0 <= num < len(self):
+            raise IndexError(f"Message number {num} out of range")
+        return self._read(num)
+
+    def _build(self):
+        """
+        Build index in single pass over capture file.
+        """
+
+        itowdecoders = {}  # decoder by identity, for UBX messages with iTOW
+        ubr = UBXReader.from_file(
+            self._path,
+            framesonly=True,
+            protfilter=ubt.NMEA_PROTOCOL | ubt.UBX_PROTOCOL | ubt.RTCM3_PROTOCOL,
+            quitonerror=ubt.ERR_IGNORE,
+        )
+        ids = {}
+        try:
+            for raw, frame in ubr:
+                if raw is None or not isinstance(frame, UBXFrame):
+                    continue  # e.g. invalid checksum
+                identity = frame.identity
+                if identity not in ids:
+                    ids[identity] = len(self._names)
+                    self._names.append(identity)
+                    itowdecoders[identity] = self._itow_decoder(
+                        frame.protocol, identity
+                    )
+                itow = NOITOW
+                decoder = itowdecoders[identity]
+                if decoder is not None:
+                    try:
+                        itow = decoder.decode_attribute(frame.payload, "iTOW")["iTOW"]
+                    except UBXDecodeFallback:  # truncated payload
+                        pass
+                self._offsets.append(frame.offset)
+                self._lengths.append(len(frame))
+                self._protocols.append(frame.protocol)
+                self._ids.append(ids[identity])
+                self._itows.append(itow)
+        finally:
+            ubr.datastream.close()
+
+    @staticmethod
+    def _itow_decoder(protocol: int, identity: str) -> object:
+        """
+        Get decoder for UBX message identity if its payload definition
+        includes iTOW at a fixed offset.
+
+        :param int protocol: frame protocol
+        :param str identity: frame identity
+        :return: UBXDecoder or None
+        :rtype: UBXDecoder
+        """
+
+        if protocol != ubt.UBX_PROTOCOL:
+            return None
+        pdict = ubg.UBX_PAYLOADS_GET.get(identity, None)
+        if pdict is None or "iTOW" not in pdict:
+            return None
+        decoder = get_decoder(pdict)
+        try:
+            if decoder is None or decoder.decode_attribute(b"", "iTOW") is None:
+                return None
+        except UBXDecodeFallback:  # indexed, but empty payload is truncated
+            pass
+        return decoder
+
+    def _load(self, size: int) -> bool:
+        """
+        Load index from index file, if it exists and is up to date.
+
+        :param int size: size of capture file
+        :return: True if loaded, False if index needs to be built
+        :rtype: bool
+        :raises: UBXStreamError (if index file is invalid)
+        """
+
+        if not os.path.exists(self._idxpath):
+            return False
+        with open(self._idxpath, "rb") as stream:
+            try:
+                magic, version, fsize, count, numnames = IDXHEADER.unpack(
+                    stream.read(IDXHEADER.size)
+                )
+            except struct.error as err:
+                raise ube.UBXStreamError(f"Invalid index file {self._idxpath}") from err
+            if magic != IDXMAGIC:
+                raise ube.UBXStreamError(f"Invalid index file {self._idxpath}")
+            if version != IDXVERSION or fsize != size:  # out of date
+                return False
+            try:
+                for _ in range(numnames):
+                    self._names.append(stream.read(stream.read(1)[0]).decode("utf-8"))
+                for col in (
+                    self._offsets,
+                    self._lengths,
+                    self._protocols,
+                    self._ids,
+                    self._itows,
+                ):
+                    col.fromfile(stream, count)
+            except (IndexError, EOFError, UnicodeDecodeError) as err:
+                raise ube.UBXStreamError(f"Invalid index file {self._idxpath}") from err
+        return True
+
+    def _save(self, size: int):
+        """
+        Save index to index file.
+
+        :param int size: size of capture file
+        """
+
+        with open(self._idxpath, "wb") as stream:
+            stream.write(
+                IDXHEADER.pack(
+                    IDXMAGIC, IDXVERSION, size, len(self._offsets), len(self._names)
+                )
+            )
+            for name in self._names:
+                nameb = name.encode("utf-8")
+                stream.write(bytes((len(nameb),)) + nameb)
+            for col in (
+                self._offsets,
+                self._lengths,
+                self._protocols,
+                self._ids,
+                self._itows,
+            ):
+                col.tofile(stream)
+
+    def _read(self, num: int) -> tuple:
+        """
+        Read and parse message number N from capture file.
+
+        :param int num: message number
+        :return: tuple of (raw_data as bytes, parsed_data)
+        :rtype: tuple
+        """
+
+        if self._mapping is None:
+            with open(self._path, "rb") as stream:
+                self._mapping = mmap(stream.fileno(), 0, access=ACCESS_READ)
+        self._mapping.seek(self._offsets[num])
+        kwargs = dict(self._kwargs, protfilter=self._protocols[num])
+        return UBXReader(self._mapping, **kwargs).read()
+
+    def find(
+        self, identity: str = None, itowstart: int = None, itowend: int = None
+    ) -> list:
+        """
+        Find message numbers by identity and/or iTOW range (inclusive).
+        If an iTOW range is specified, only messages with an iTOW
+        attribute are returned.
+
+        :param str identity: message identity e.g. 'NAV-PVT', None = any (None)
+        :param int itowstart: earliest iTOW in ms, None = no limit (None)
+        :param int itowend: latest iTOW in ms, None = no limit (None)
+        :return: list of message numbers in file order
+        :rtype: list
+        """
+
+        if identity is None:
+            rows = range(len(self))
+        else:
+            rows = self._rows_for(identity)
+        if itowstart is None and itowend is None:
+            return list(rows)
+        itowstart = 0 if itowstart is None else itowstart
+        itowend = 0xFFFFFFFF if itowend is None else itowend
+        itows = self._itows
+        return [row for row in rows if itowstart <= itows[row] <= itowend]
+
+    def _rows_for(self, identity: str) -> array:
+        """
+        Get (cached) message numbers for identity.
+
+        :param str identity: message identity
+        :return: message numbers
+        :rtype: array
+        """
+
+        if identity not in self._rows:
+            try:
+                idn = self._names.index(identity)
+            except ValueError:
+                idn = -1
+            self._rows[identity] = array(
+                "Q", (row for row, val in enumerate(self._ids) if val == idn)
+            )
+        return self._rows[identity]
+
+    def query(self, identity: str = None, itowstart: int = None, itowend: int = None):
+        """
+        Read and parse messages by identity and/or iTOW range (inclusive)
+        e.g. query('NAV-PVT', 403326000, 403330000).
+
+        :param str identity: message identity e.g. 'NAV-PVT', None = any (None)
+        :param int itowstart: earliest iTOW in ms, None = no limit (None)
+        :param int itowend: latest iTOW in ms, None = no limit (None)
+        :return: generator of (raw_data as bytes, parsed_data) tuples
+        :rtype: generator
+        """
+
+        for row in self.find(identity, itowstart, itowend):
+            yield self._read(row)
+
+    def record(self, num: int) -> tuple:
+        """
+        Get index record for message number N (zero-based).
+
+        :param int num: message number
+        :return: tuple of (offset, length, protocol, identity, iTOW or None)
+        :rtype: tuple
+        """
+
+        itow = self._itows[num]
+        return (
+            self._offsets[num],
+            self._lengths[num],
+            self._protocols[num],
+            self._names[self._ids[num]],
+            None if itow == NOITOW else itow,
+        )
+
+    def close(self):
+        """
+        Close memory-mapped capture file, if open.
+        """
+
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    @property
+    def identities(self) -> list:
+        """
+        Getter for identities present in capture file.
+
+        :return: list of identities, in order of first occurrence
+        :rtype: list
+        """
+
+        return list(self._names)
+
+    @property
+    def idxpath(self) -> str:
+        """
+        Getter for index file path.
+
+        :return: index file path
+        :rtype: str
+        """
+
+        return self._idxpath
@@ -12,9 +12,14 @@ Created on 26 Sep 2020
 import struct
 import pyubx2.exceptions as ube
 import pyubx2.ubxtypes_core as ubt
-import pyubx2.ubxtypes_get as ubg
-import pyubx2.ubxtypes_set as ubs
-import pyubx2.ubxtypes_poll as ubp
+from pyubx2.ubxdecoder import (
+    NAVHP,
+    NAVHP_KEYS,
+    get_decoder,
+    get_scales,
+    UBXDecodeFallback,
+)
+from pyubx2.ubxnumpy import group_array
 from pyubx2.ubxhelpers import (
     calc_checksum,
     attsiz,
@@ -28,8 +33,22 @@ from pyubx2.ubxhelpers import (
     cfgkey2name,
     cfgname2key,
     escapeall,
+    bytes2array,
+    group_names,
+    lazy_import,
+    name_table,
 )
 
+# payload definitions are imported on first use
+ubg = lazy_import("pyubx2.ubxtypes_get")
+ubs = lazy_import("pyubx2.ubxtypes_set")
+ubp = lazy_import("pyubx2.ubxtypes_poll")
+
+VERSIONCACHE = 1024  # maximum number of cached payload-selected definitions
+_DEFINITIONS = {}  # payload definitions or selectors by (msgmode, class + id)
+_VERSIONS = {}  # payload-selected definitions by (msgmode, class + id, length, bytes)
+_SIZES = {}  # (size of UBX_MSGIDS, size of payload definitions) by msgmode
+
 
 class UBXMessage:
     """UBX Message Class."""
@@ -50,6 +69,13 @@ class UBXMessage:
         :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
         :param bool parsebitfield: (kwarg) parse bitfields ('X' type attributes) Y/N
         :param bool scaling: (kwarg) apply scale factors Y/N
+        :param int arraytype: (kwarg) type of array ('A' type) attributes e.g. MON-SPAN spectrum -
+            ARR_LIST (0) = list of int, ARR_ARRAY (1) = array.array('B'),
+            ARR_NUMPY (2) = numpy.ndarray of uint8 (requires NumPy) (0)
+        :param bool lazy: (kwarg) defer decoding of payload until attributes are accessed Y/N
+        :param bool compact: (kwarg) hold attribute values as a single tuple, with attribute
+            names in a table shared between messages, to reduce memory usage Y/N (ignored if lazy)
+        :param bytes checksum: (kwarg) precalculated checksum of payload, if known
         :param kwargs: optional payload key/value pairs
         :raises: UBXMessageError
 
@@ -64,6 +90,11 @@ class UBXMessage:
 
         self._parsebf = kwargs.get("parsebitfield", True)  # parsing bitfields Y/N?
         self._scaling = kwargs.get("scaling", True)  # apply scale factors Y/N?
+        self._arraytype = kwargs.get(
+            "arraytype", ubt.ARR_LIST
+        )  # type of array attributes
+        self._lazy = None  # decoder for payload not yet decoded
+        self._identity = None  # identity, resolved on first use
 
         if msgmode not in (0, 1, 2):
             raise ube.UBXMessageError(f"Invalid msgmode {msgmode} - must be 0, 1 or 2.")
@@ -80,6 +111,12 @@ class UBXMessage:
             self._ubxID = ubxID
 
         self._do_attributes(**kwargs)
+        if (
+            kwargs.get("compact", False)
+            and self._lazy is None
+            and "_names" not in self.__dict__
+        ):
+            self._do_compact()
 
         self._immutable = True  # once initialised, object is immutable
 
@@ -94,7 +131,7 @@ class UBXMessage:
         """
 
         offset = 0  # payload offset in bytes
-        index = []  # array of (nested) group indices
+        key = None  # attribute being processed, if any
 
         try:
             if len(kwargs) == 0:  # if no kwargs, assume null payload
@@ -102,11 +139,30 @@ class UBXMessage:
             else:
                 self._payload = kwargs.get("payload", b"")
                 pdict = self._get_dict(**kwargs)  # get appropriate payload dict
-                for key in pdict:  # process each attribute in dict
-                    (offset, index) = self._set_attribute(
-                        offset, pdict, key, index, **kwargs
+                # if payload keyword has been provided, decode it using
+                # compiled plan, otherwise process each attribute in dict
+                if not self._decode_payload(pdict, **kwargs):
+                    navhp = self._ubxClass == b"\x01" and self._ubxID in (
+                        b"\x13",
+                        b"\x14",
                     )
-            self._do_len_checksum()
+                    if navhp:  # NAV-HPPOSLLH or NAV-HPPOSECEF
+                        # HP elements are combined unscaled
+                        pdict = {
+                            key: (
+                                att[0]
+                                if key in NAVHP_KEYS and isinstance(att, list)
+                                else att
+                            )
+                            for key, att in pdict.items()
+                        }
+                    for key in pdict:
+                        offset = self._set_attribute(offset, pdict, key, "", **kwargs)
+                    if navhp:
+                        self._do_navhp()
+            self._do_len_checksum(
+                kwargs.get("checksum", None) if "payload" in kwargs else None
+            )
 
         except (
             AttributeError,
@@ -116,7 +172,8 @@ class UBXMessage:
         ) as err:
             raise ube.UBXTypeError(
                 (
-                    f"Incorrect type for attribute '{key}' "
+                    "Incorrect type "
+                    f"{'' if key is None else f'for attribute {key!r} '}"
                     f"in {['GET', 'SET', 'POLL'][self._mode]} message "
                     f"class {self.identity}"
                 )
@@ -124,25 +181,179 @@ class UBXMessage:
         except (OverflowError,) as err:
             raise ube.UBXTypeError(
                 (
-                    f"Overflow error for attribute '{key}' "
+                    "Overflow error "
+                    f"{'' if key is None else f'for attribute {key!r} '}"
                     f"in {['GET', 'SET', 'POLL'][self._mode]} message "
                     f"class {self.identity}"
                 )
             ) from err
 
+    def _decode_payload(self, pdict: dict, **kwargs) -> bool:
+        """
+        Decode payload using compiled (and cached) plan for this payload
+        definition. Returns False if the payload must instead be
+        processed attribute by attribute (e.g. because it is truncated).
+
+        :param dict pdict: dict representing payload definition
+        :param kwargs: optional payload key/value pairs
+        :return: True if payload decoded, otherwise False
+        :rtype: bool
+        :raises: UBXTypeError
+
+        """
+
+        if "payload" not in kwargs:
+            return False
+        # ESF-MEAS SET has a conditional extra repeat
+        if (
+            self._ubxClass == b"\x10"
+            and self._ubxID == b"\x02"
+            and self._mode == ubt.SET
+        ):
+            return False
+        decoder = get_decoder(
+            pdict,
+            parsebitfield=self._parsebf,
+            scaling=self._scaling,
+            arraytype=self._arraytype,
+            cfgval=(
+                self._ubxClass == b"\x06"
+                and self._ubxID == b"\x8b"
+                and self._mode == ubt.GET
+            ),
+        )
+        if decoder is None:
+            return False
+        if kwargs.get("lazy", False):  # defer decoding until attribute accessed
+            self._lazy = decoder
+            return True
+        try:
+            vals = decoder.decode(self._payload)
+        except (UBXDecodeFallback, TypeError):
+            return False
+        if kwargs.get("compact", False):
+            self._do_compact(vals)
+        else:
+            self.__dict__.update(vals)
+        return True
+
+    def _do_compact(self, vals: dict = None):
+        """
+        Hold attribute values as a single tuple, with attribute names
+        in a table shared by all messages with the same attributes.
+
+        :param dict vals: dict of decoded attribute values, or None to
+            move public attributes already set into tuple (None)
+        """
+
+        attrs = self.__dict__
+        if vals is None:
+            vals = {key: attrs.pop(key) for key in [k for k in attrs if k[0] != "_"]}
+        attrs["_names"] = name_table(tuple(vals))
+        attrs["_values"] = tuple(vals.values())
+
+    def _do_lazy(self):
+        """
+        Decode deferred (lazy) payload in full, preserving the
+        payload definition order of attributes.
+        """
+
+        attrs = self.__dict__
+        decoder = attrs["_lazy"]
+        attrs["_lazy"] = None
+        # remove any attributes already decoded individually
+        for key in [key for key in attrs if key[0] != "_"]:
+            del attrs[key]
+        try:
+            attrs.update(decoder.decode(self._payload))
+        except (UBXDecodeFallback, TypeError):
+            attrs["_immutable"] = False
+            self._do_attributes(
+                payload=self._payload,
+                parsebitfield=self._parsebf,
+                scaling=self._scaling,
+                arraytype=self._arraytype,
+            )
+            attrs["_immutable"] = True
+
+    def __getattr__(self, name):
+        """
+        Get attribute value from tuple of values if message is compact,
+        or decode attribute on first access if payload decoding has been
+        deferred (lazy), memoizing the result.
+
+        Only called if the attribute has not already been set.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError
+
+        """
+
+        attrs = self.__dict__
+        table = attrs.get("_names", None)
+        if table is not None:
+            i = table[1].get(name, None)
+            if i is not None:
+                return attrs["_values"][i]
+        decoder = attrs.get("_lazy", None)
+        if decoder is not None:
+            try:
+                vals = decoder.decode_attribute(attrs["_payload"], name)
+            except UBXDecodeFallback:
+                vals = None
+            if vals is None:  # not individually decodable
+                self._do_lazy()
+            else:
+                attrs.update(vals)
+            if name in attrs:
+                return attrs[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __getstate__(self) -> dict:
+        """
+        Get state for pickling, decoding any deferred (lazy) payload
+        first so that the decoder itself is not pickled.
+
+        :return: attribute dict
+        :rtype: dict
+        """
+
+        if self.__dict__.get("_lazy", None) is not None:
+            self._do_lazy()
+        state = self.__dict__
+        if "_names" in state:  # pickle names rather than shared table
+            state = {**state, "_names": state["_names"][0]}
+        return state
+
+    def __setstate__(self, state: dict):
+        """
+        Set state when unpickling, restoring any shared table of
+        attribute names.
+
+        :param dict state: attribute dict
+        """
+
+        if "_names" in state:
+            state = {**state, "_names": name_table(state["_names"])}
+        self.__dict__.update(state)
+
     def _set_attribute(
-        self, offset: int, pdict: dict, key: str, index: list, **kwargs
-    ) -> tuple:
+        self, offset: int, pdict: dict, key: str, sfx: str, **kwargs
+    ) -> int:
         """
         Recursive routine to set individual or grouped payload attributes.
 
         :param int offset: payload offset in bytes
         :param dict pdict: dict representing payload definition
         :param str key: attribute keyword
-        :param list index: repeating group index array
+        :param str sfx: repeating group index suffix e.g. '_01'
         :param kwargs: optional payload key/value pairs
-        :return: (offset, index[])
-        :rtype: tuple
+        :return: offset
+        :rtype: int
 
         """
 
@@ -153,38 +364,31 @@ class UBXMessage:
             numr, _ = att
             if numr in (ubt.X1, ubt.X2, ubt.X4, ubt.X6, ubt.X8, ubt.X24):  # bitfield
                 if self._parsebf:  # if we're parsing bitfields
-                    (offset, index) = self._set_attribute_bitfield(
-                        att, offset, index, **kwargs
-                    )
+                    offset = self._set_attribute_bitfield(att, offset, sfx, **kwargs)
                 else:  # treat bitfield as a single byte array
                     offset = self._set_attribute_single(
-                        numr, offset, key, index, **kwargs
+                        numr, offset, key, sfx, **kwargs
                     )
             else:  # repeating group of attributes
-                (offset, index) = self._set_attribute_group(
-                    att, offset, index, **kwargs
-                )
+                offset = self._set_attribute_group(att, offset, sfx, **kwargs)
         else:  # single attribute
-            offset = self._set_attribute_single(att, offset, key, index, **kwargs)
+            offset = self._set_attribute_single(att, offset, key, sfx, **kwargs)
 
-        return (offset, index)
+        return offset
 
-    def _set_attribute_group(
-        self, att: tuple, offset: int, index: list, **kwargs
-    ) -> tuple:
+    def _set_attribute_group(self, att: tuple, offset: int, sfx: str, **kwargs) -> int:
         """
         Process (nested) group of attributes.
 
         :param tuple att: attribute group - tuple of (num repeats, attribute dict)
         :param int offset: payload offset in bytes
-        :param list index: repeating group index array
+        :param str sfx: repeating group index suffix of enclosing group e.g. '_01'
         :param kwargs: optional payload key/value pairs
-        :return: (offset, index[])
-        :rtype: tuple
+        :return: offset
+        :rtype: int
 
         """
 
-        index.append(0)  # add a (nested) group index
         numr, attd = att  # number of repeats, attribute dictionary
         # if CFG-VALGET message, use dedicated method to
         # parse as configuration key value pairs
@@ -210,21 +414,16 @@ class UBXMessage:
                 ):
                     if getattr(self, "calibTtagValid", 0):
                         rng += 1
-            # recursively process each group attribute,
-            # incrementing the payload offset and index as we go
-            for i in range(rng):
-                index[-1] = i + 1
+            # recursively process each group attribute, incrementing
+            # the payload offset and suffixing names with index as we go
+            for sfxi in group_names(sfx, rng):
                 for key1 in attd:
-                    (offset, index) = self._set_attribute(
-                        offset, attd, key1, index, **kwargs
-                    )
-
-        index.pop()  # remove this (nested) group index
+                    offset = self._set_attribute(offset, attd, key1, sfxi, **kwargs)
 
-        return (offset, index)
+        return offset
 
     def _set_attribute_single(
-        self, att: object, offset: int, key: str, index: list, **kwargs
+        self, att: object, offset: int, key: str, sfx: str, **kwargs
     ) -> int:
         """
         Set individual attribute value, applying scaling where appropriate.
@@ -235,7 +434,7 @@ class UBXMessage:
         :param list att: if scaled, list of [attribute type string, scaling factor float]
         :param int offset: payload offset in bytes
         :param str key: attribute keyword
-        :param list index: repeating group index array
+        :param str sfx: repeating group index suffix e.g. '_01'
         :param kwargs: optional payload key/value pairs
         :return: offset
         :rtype: int
@@ -243,21 +442,15 @@ class UBXMessage:
         """
         # pylint: disable=no-member
 
-        # if HP element of NAV-HPPOSLLH or NAV-HPPOSECEF message type
-        isNavHP = self._is_navhp(key)
-
         # if attribute is scaled
         scale = 1
-        if isinstance(att, list) and self._scaling:
-            if not isNavHP:  # don't scale NavHP elements at this point
+        if isinstance(att, list):
+            if self._scaling:
                 scale = att[1]
             att = att[0]
 
         # if attribute is part of a (nested) repeating group, suffix name with index
-        keyr = key
-        for i in index:  # one index for each nested level
-            if i > 0:
-                keyr += f"_{i:02d}"
+        keyr = key + sfx
 
         # determine attribute size (bytes)
         if att == ubt.CH:  # variable length string
@@ -283,29 +476,24 @@ class UBXMessage:
             else:
                 valb = val2bytes(int(val / scale), att)
             self._payload += valb
+        if self._arraytype and att[0:1] == "A":  # array attribute as array type
+            val = bytes2array(valb, self._arraytype)
 
         setattr(self, keyr, val)
         offset += atts
 
-        # if HP element of NAV-HPPOSLLH or NAV-HPPOSECEF message type
-        if isNavHP:
-            self._set_attribute_navhp(key)
-
         return offset
 
-    def _set_attribute_bitfield(
-        self, att: str, offset: int, index: list, **kwargs
-    ) -> tuple:
+    def _set_attribute_bitfield(self, att: str, offset: int, sfx: str, **kwargs) -> int:
         """
         Parse bitfield attribute (type 'X').
 
         :param str att: attribute type e.g. 'X002'
         :param int offset: payload offset in bytes
-        :param str key: attribute key name
-        :param list index: repeating group index array
+        :param str sfx: repeating group index suffix e.g. '_01'
         :param kwargs: optional payload key/value pairs
-        :return: (offset, index[])
-        :rtype: tuple
+        :return: offset
+        :rtype: int
 
         """
         # pylint: disable=no-member
@@ -324,7 +512,7 @@ class UBXMessage:
         # process each flag in bitfield
         for key, keyt in bfd.items():
             (bitfield, bfoffset) = self._set_attribute_bits(
-                bitfield, bfoffset, key, keyt, index, **kwargs
+                bitfield, bfoffset, key, keyt, sfx, **kwargs
             )
 
         # update payload
@@ -332,7 +520,7 @@ class UBXMessage:
         if "payload" not in kwargs:
             self._payload += bitfield.to_bytes(bfs, "little")
 
-        return (offset, index)
+        return offset
 
     def _set_attribute_bits(
         self,
@@ -340,7 +528,7 @@ class UBXMessage:
         bfoffset: int,
         key: str,
         keyt: str,
-        index: list,
+        sfx: str,
         **kwargs,
     ) -> tuple:
         """
@@ -350,7 +538,7 @@ class UBXMessage:
         :param int bfoffset: bitfield offset in bits
         :param str key: attribute key name
         :param str keyt: key type e.g. 'U001'
-        :param list index: repeating group index array
+        :param str sfx: repeating group index suffix e.g. '_01'
         :param kwargs: optional payload key/value pairs
         :return: (bitfield, bfoffset)
         :rtype: tuple
@@ -359,10 +547,7 @@ class UBXMessage:
         # pylint: disable=no-member
 
         # if attribute is part of a (nested) repeating group, suffix name with index
-        keyr = key
-        for i in index:  # one index for each nested level
-            if i > 0:
-                keyr += f"_{i:02d}"
+        keyr = key + sfx
 
         atts = attsiz(keyt)  # determine flag size in bits
 
@@ -378,68 +563,25 @@ class UBXMessage:
         bfoffset += atts
         return (bitfield, bfoffset)
 
-    def _is_navhp(self, key) -> bool:
-        """
-        Check for NAV-HPPOSLLH or NAV-HPPOSECEF
-        high precision attribute type, e.g.
-        '_latHp' or '_heightHp'.
-
-        :param str key: attribute name e.g. '_latHp'
-        :return: True or False
-        :rtype: bool
-        """
-
-        return (
-            self._ubxClass == b"\x01"
-            and self._ubxID in (b"\x13", b"\x14")
-            and key
-            in (
-                "_lat",
-                "_latHp",
-                "_lon",
-                "_lonHp",
-                "_height",
-                "_heightHp",
-                "_hMSL",
-                "_hMSLHp",
-                "_ecefX",
-                "_ecefXHp",
-                "_ecefY",
-                "_ecefYHp",
-                "_ecefZ",
-                "_ecefZHp",
-            )
-        )
-
-    def _set_attribute_navhp(self, key: str):
+    def _do_navhp(self):
         """
         Combine separate private standard and high precision
         attributes of NAV-HPPOSLLH and NAV-HPPOSECEF message
-        types into single public attribute
-        e.g. '_lat' and '_latHp' are combined into 'lat'.
-
-        :param str key: attribute keyword
-        """
-        # pylint: disable=no-member
-
-        if key == "_latHp":
-            val = (self._lat + self._latHp * 0.01) * 1e-7
-        elif key == "_lonHp":
-            val = (self._lon + self._lonHp * 0.01) * 1e-7
-        elif key == "_heightHp":
-            val = self._height + self._heightHp * 0.1  # mm
-        elif key == "_hMSLHp":
-            val = self._hMSL + self._hMSLHp * 0.1  # mm
-        elif key == "_ecefXHp":
-            val = self._ecefX + self._ecefXHp * 0.01  # cm
-        elif key == "_ecefYHp":
-            val = self._ecefY + self._ecefYHp * 0.01  # cm
-        elif key == "_ecefZHp":
-            val = self._ecefZ + self._ecefZHp * 0.01  # cm
-        else:
-            return
-
-        setattr(self, key[1:-2], round(val, ubt.SCALROUND))
+        types into single public attribute, placed after the
+        high precision attribute e.g. '_lat' and '_latHp' are
+        combined into 'lat'.
+        """
+
+        attrs = self.__dict__
+        vals = {}
+        for key, val in attrs.items():
+            vals[key] = val
+            hpc = NAVHP.get(key, None)
+            if hpc is not None:
+                keyp, keys, hpscale, scale = hpc
+                vals[keyp] = round((attrs[keys] + val * hpscale) * scale, ubt.SCALROUND)
+        attrs.clear()
+        attrs.update(vals)
 
     def _set_attribute_cfgval(self, offset: int, **kwargs):
         """
@@ -478,13 +620,19 @@ class UBXMessage:
             else:
                 i += 1
 
-    def _do_len_checksum(self):
+    def _do_len_checksum(self, checksum: bytes = None):
+        """
+        Calculate and format payload length and checksum as bytes.
+
+        :param bytes checksum: precalculated checksum, if known (None)
         """
-        Calculate and format payload length and checksum as bytes."""
 
         if self._payload is None:
             self._length = val2bytes(0, ubt.U2)
             self._checksum = calc_checksum(self._ubxClass + self._ubxID + self._length)
+        elif checksum is not None:  # already calculated when parsing
+            self._length = val2bytes(len(self._payload), ubt.U2)
+            self._checksum = checksum
         else:
             self._length = val2bytes(len(self._payload), ubt.U2)
             self._checksum = calc_checksum(
@@ -495,7 +643,16 @@ class UBXMessage:
         """
         Get payload dictionary corresponding to message mode (GET/SET/POLL)
         Certain message types need special handling as alternate payload
-        definitions exist for the same ubxClass/ubxID.
+        definitions exist for the same ubxClass/ubxID; these are selected
+        by a version selector method registered in VERSION_SELECTORS.
+
+        Definitions are cached on (msgmode, ubxClass + ubxID) and, where
+        selected from a payload, on (msgmode, ubxClass + ubxID, payload
+        length, first 2 bytes of payload), so the usual case is a single
+        dict lookup. As with reverse_dict(), the caches are cleared if
+        entries have since been added to or removed from UBX_MSGIDS or
+        the payload definitions for the message mode; an existing
+        definition replaced in place is not detected.
 
         :param kwargs: optional payload key/value pairs
         :return: dictionary representing payload definition
@@ -503,61 +660,72 @@ class UBXMessage:
 
         """
 
+        mode = self._mode
+        if mode == ubt.GET:
+            sizes = (len(ubt.UBX_MSGIDS), len(ubg.UBX_PAYLOADS_GET))
+        elif mode == ubt.SET:
+            sizes = (len(ubt.UBX_MSGIDS), len(ubs.UBX_PAYLOADS_SET))
+        else:
+            sizes = (len(ubt.UBX_MSGIDS), len(ubp.UBX_PAYLOADS_POLL))
+        if _SIZES.get(mode, None) != sizes:  # definitions added or removed
+            _DEFINITIONS.clear()
+            _VERSIONS.clear()
+            _SIZES[mode] = sizes
+        key = (mode, self._ubxClass + self._ubxID)
         try:
-            if self._mode == ubt.POLL:
-                # CFG-TP5 POLL
-                if self._ubxClass == b"\x06" and self._ubxID == b"\x31":
-                    pdict = self._get_cfgtp5_version(**kwargs)
-                else:
-                    pdict = ubp.UBX_PAYLOADS_POLL[self.identity]
-            elif self._mode == ubt.SET:
-                # MGA SET
-                if self._ubxClass == b"\x13" and self._ubxID != b"\x80":
-                    pdict = self._get_mga_version(ubt.SET, **kwargs)
-                # RXM-PMP SET
-                elif self._ubxClass == b"\x02" and self._ubxID == b"\x72":
-                    pdict = self._get_rxmpmp_version(**kwargs)
-                # RXM-PMREQ SET
-                elif self._ubxClass == b"\x02" and self._ubxID == b"\x41":
-                    pdict = self._get_rxmpmreq_version(**kwargs)
-                # TIM-VCOCAL SET
-                elif self._ubxClass == b"\x0d" and self._ubxID == b"\x15":
-                    pdict = self._get_timvcocal_version(**kwargs)
-                # CFG-DAT SET
-                elif self._ubxClass == b"\x06" and self._ubxID == b"\x06":
-                    pdict = self._get_cfgdat_version(**kwargs)
-                else:
-                    pdict = ubs.UBX_PAYLOADS_SET[self.identity]
-            else:
-                # MGA GET
-                if self._ubxClass == b"\x13" and self._ubxID != b"\x80":
-                    pdict = self._get_mga_version(ubt.GET, **kwargs)
-                # RXM-PMP GET
-                elif self._ubxClass == b"\x02" and self._ubxID == b"\x72":
-                    pdict = self._get_rxmpmp_version(**kwargs)
-                # RXM-RLM GET
-                elif self._ubxClass == b"\x02" and self._ubxID == b"\x59":
-                    pdict = self._get_rxmrlm_version(**kwargs)
-                # CFG-NMEA GET
-                elif self._ubxClass == b"\x06" and self._ubxID == b"\x17":
-                    pdict = self._get_cfgnmea_version(**kwargs)
-                # NAV-AOPSTATUS GET
-                elif self._ubxClass == b"\x01" and self._ubxID == b"\x60":
-                    pdict = self._get_aopstatus_version(**kwargs)
-                # NAV-RELPOSNED GET
-                elif self._ubxClass == b"\x01" and self._ubxID == b"\x3C":
-                    pdict = self._get_relposned_version(**kwargs)
-                # Unknown GET message, parsed to nominal definition
-                elif self.identity[-7:] == "NOMINAL":
-                    pdict = ubg.UBX_PAYLOADS_GET["UBX-NOMINAL"]
-                else:
-                    pdict = ubg.UBX_PAYLOADS_GET[self.identity]
-            return pdict
+            pdict = _DEFINITIONS.get(key, None)
+            if pdict is None:
+                pdict = _DEFINITIONS[key] = self._resolve_dict()
+            if isinstance(pdict, dict):
+                return pdict
+            # alternate definitions selected by payload or keywords
+            payload = kwargs.get("payload", None)
+            if payload is None:
+                return pdict(self, **kwargs)
+            vkey = key + (len(payload), bytes(payload[0:2]))
+            vdict = _VERSIONS.get(vkey, None)
+            if vdict is None:
+                vdict = pdict(self, **kwargs)
+                if len(_VERSIONS) >= VERSIONCACHE:
+                    _VERSIONS.clear()
+                _VERSIONS[vkey] = vdict
+            return vdict
         except KeyError as err:
             raise KeyError(
                 f"{err} - Check 'msgmode' keyword argument is appropriate for message category"
             )
 
+    def _resolve_dict(self) -> object:
+        """
+        Resolve payload dictionary, or version selector method where
+        alternate payload definitions exist, for message mode and
+        ubxClass/ubxID.
+
+        :return: dictionary representing payload definition or version selector
+        :rtype: object
+        :raises: KeyError (if no definition for message mode)
+
+        """
+
+        selector = VERSION_SELECTORS.get((self._mode, self._ubxClass + self._ubxID))
+        if selector is not None:
+            return selector
+        # MGA messages (except MGA-DBD) are identified by 'type' attribute
+        if (
+            self._mode != ubt.POLL
+            and self._ubxClass == b"\x13"
+            and self._ubxID != b"\x80"
+        ):
+            return UBXMessage._get_mga_version
+        if self._mode == ubt.POLL:
+            return ubp.UBX_PAYLOADS_POLL[self.identity]
+        if self._mode == ubt.SET:
+            return ubs.UBX_PAYLOADS_SET[self.identity]
+        # Unknown GET message, parsed to nominal definition
+        if self._ubxClass + self._ubxID not in ubt.UBX_MSGIDS:
+            return ubg.UBX_PAYLOADS_GET["UBX-NOMINAL"]
+        return ubg.UBX_PAYLOADS_GET[self.identity]
+
     def _get_cfgtp5_version(self, **kwargs) -> dict:
         """
         Select appropriate CFG-TP5 POLL payload definition by checking
@@ -580,12 +748,11 @@ class UBXMessage:
             pdict = ubp.UBX_PAYLOADS_POLL["CFG-TP5"]
         return pdict
 
-    def _get_mga_version(self, mode: int, **kwargs) -> dict:
+    def _get_mga_version(self, **kwargs) -> dict:
         """
         Select appropriate MGA payload definition by checking
         value of 'type' attribute (1st byte of payload).
 
-        :param str mode: mode (0=GET, 1=SET, 2=POLL)
         :param kwargs: optional payload key/value pairs
         :return: dictionary representing payload definition
         :rtype: dict
@@ -602,7 +769,7 @@ class UBXMessage:
                 "MGA message definitions must include type or payload keyword"
             )
         identity = ubt.UBX_MSGIDS[self._ubxClass + self._ubxID + typ]
-        if mode == ubt.SET:
+        if self._mode == ubt.SET:
             pdict = ubs.UBX_PAYLOADS_SET[identity]
         else:
             pdict = ubg.UBX_PAYLOADS_GET[identity]
@@ -850,17 +1017,24 @@ class UBXMessage:
         clsid = None
         msgid = None
 
+        if self._lazy is not None:
+            self._do_lazy()
         umsg_name = self.identity
         if self.payload is None:
             return f"<UBX({umsg_name})>"
 
+        attrs = self.__dict__
+        if "_names" in attrs:  # compact
+            attrs = {**attrs, **dict(zip(attrs["_names"][0], attrs["_values"]))}
         stg = f"<UBX({umsg_name}, "
-        for i, att in enumerate(self.__dict__):
+        for i, att in enumerate(attrs):
             if att[0] != "_":  # only show public attributes
-                val = self.__dict__[att]
+                val = attrs[att]
                 # escape all byte chars
                 if isinstance(val, bytes) and att not in ("datumName",):
                     val = escapeall(val)
+                if hasattr(val, "tolist"):  # array attribute as array or NumPy array
+                    val = val.tolist()
                 if att[0:6] == "gnssId":  # attribute is a GNSS ID
                     val = gnss2str(val)  # get string representation e.g. 'GPS'
                 if att == "iTOW":  # attribute is a GPS Time of Week
@@ -877,7 +1051,7 @@ class UBXMessage:
                         msgid = val2bytes(val, ubt.U1)
                         val = ubt.UBX_MSGIDS.get(clsid + msgid, clsid + msgid)
                 stg += att + "=" + str(val)
-                if i < len(self.__dict__) - 1:
+                if i < len(attrs) - 1:
                     stg += ", "
         stg += ")>"
 
@@ -930,6 +1104,91 @@ class UBXMessage:
         )
         return output
 
+    def group(self, name: str) -> list:
+        """
+        Return values of repeating group attribute as list, in repeat
+        order e.g. msg.group("cno") returns [msg.cno_01, msg.cno_02, ...].
+        For nested repeating groups, include the index of the enclosing
+        group e.g. msg.group("cno_02").
+
+        :param str name: attribute name without repeat index e.g. 'cno'
+        :return: list of values (empty if no such repeating group attribute)
+        :rtype: list
+
+        """
+
+        if self._lazy is not None:
+            self._do_lazy()
+        attrs = self.__dict__
+        table = attrs.get("_names", None)
+        values = None
+        if table is not None:  # compact
+            values = attrs["_values"]
+            attrs = table[1]
+        vals = []
+        count = 32
+        while True:
+            for keyr in group_names(name, count)[len(vals) :]:
+                if keyr not in attrs:
+                    return vals
+                vals.append(attrs[keyr] if values is None else values[attrs[keyr]])
+            count *= 2
+
+    def scaled(self, name: str) -> object:
+        """
+        Return value of attribute with scale factor applied, for
+        messages parsed with scaling=False (raw integer mode) e.g.
+        msg.scaled("lat") or msg.scaled("prRes_01"). Values of messages
+        parsed with scaling=True, and of attributes with no scale
+        factor, are returned unchanged.
+
+        :param str name: attribute name
+        :return: scaled value
+        :rtype: object
+        :raises: AttributeError (if no such attribute)
+
+        """
+
+        val = getattr(self, name)
+        if self._scaling:
+            return val
+        scales = self.scales
+        key = name
+        while key not in scales:
+            key, _, idx = key.rpartition("_")
+            if not (key and idx.isdigit()):  # not a repeating group attribute
+                return val
+        return round(val * scales[key], ubt.SCALROUND)
+
+    def to_numpy(self, group: str = None) -> object:
+        """
+        Return fixed size repeating group (e.g. the satellites in
+        NAV-SAT) as a NumPy structured array, with one record per
+        repeat and one field per group attribute e.g.
+        msg.to_numpy()["cno"]. Bitfields and scale factors are
+        handled according to the message's 'parsebitfield' and
+        'scaling' settings. Requires NumPy.
+
+        :param str group: name of any attribute in group, None = first group (None)
+        :return: structured array
+        :rtype: numpy.ndarray
+        :raises: UBXMessageError (if NumPy not installed or no such fixed size group)
+
+        """
+
+        if self._payload is None:
+            raise ube.UBXMessageError("No payload")
+        decoder = get_decoder(
+            self._get_dict(payload=self._payload),
+            parsebitfield=self._parsebf,
+            scaling=self._scaling,
+        )
+        if decoder is None:
+            raise ube.UBXMessageError(f"{self.identity} cannot be converted")
+        return group_array(
+            decoder.plan, self._payload, lambda name: getattr(self, name), group
+        )
+
     @property
     def identity(self) -> str:
         """
@@ -939,11 +1198,16 @@ class UBXMessage:
         to a nominal payload definition UBX-NOMINAL and
         the term 'NOMINAL' is appended to the identity.
 
+        The identity is resolved on first access and then retained.
+
         :return: message identity e.g. 'CFG-MSG'
         :rtype: str
 
         """
 
+        umsg_name = self.__dict__.get("_identity", None)
+        if umsg_name is not None:
+            return umsg_name
         try:
             # all MGA messages except MGA-DBD need to be identified by the
             # 'type' attribute - the first byte of the payload
@@ -963,8 +1227,27 @@ class UBXMessage:
                 f"{cls}-{int.from_bytes(self._ubxClass, 'little'):02x}"
                 + f"{int.from_bytes(self._ubxID, 'little'):02x}-NOMINAL"
             )
+        if self._immutable:  # payload is complete
+            self.__dict__["_identity"] = umsg_name
         return umsg_name
 
+    @property
+    def scales(self) -> dict:
+        """
+        Returns scale factors of scaled attributes in payload definition,
+        by attribute name without repeating group index e.g.
+        {"lat": 1e-07, "prRes": 0.1}, so that raw integer values
+        (scaling=False) can be scaled on access or in bulk.
+
+        :return: dict of attribute name and scale factor
+        :rtype: dict
+
+        """
+
+        if self._payload is None:
+            return {}
+        return get_scales(self._get_dict(payload=self._payload))
+
     @property
     def msg_cls(self) -> bytes:
         """
@@ -1136,3 +1419,20 @@ class UBXMessage:
             lis = lis + keyb
 
         return UBXMessage("CFG", "CFG-VALGET", ubt.POLL, payload=payload + lis)
+
+
+# version selector methods for message types with alternate payload
+# definitions for the same ubxClass/ubxID, keyed on (msgmode, ubxClass + ubxID)
+# pylint: disable=protected-access
+VERSION_SELECTORS = {
+    (ubt.POLL, b"\x06\x31"): UBXMessage._get_cfgtp5_version,  # CFG-TP5
+    (ubt.SET, b"\x02\x72"): UBXMessage._get_rxmpmp_version,  # RXM-PMP
+    (ubt.SET, b"\x02\x41"): UBXMessage._get_rxmpmreq_version,  # RXM-PMREQ
+    (ubt.SET, b"\x0d\x15"): UBXMessage._get_timvcocal_version,  # TIM-VCOCAL
+    (ubt.SET, b"\x06\x06"): UBXMessage._get_cfgdat_version,  # CFG-DAT
+    (ubt.GET, b"\x02\x72"): UBXMessage._get_rxmpmp_version,  # RXM-PMP
+    (ubt.GET, b"\x02\x59"): UBXMessage._get_rxmrlm_version,  # RXM-RLM
+    (ubt.GET, b"\x06\x17"): UBXMessage._get_cfgnmea_version,  # CFG-NMEA
+    (ubt.GET, b"\x01\x60"): UBXMessage._get_aopstatus_version,  # NAV-AOPSTATUS
+    (ubt.GET, b"\x01\x3c"): UBXMessage._get_relposned_version,  # NAV-RELPOSNED
+}
@@ -0,0 +1,281 @@
+"""
+NumPy conversion of UBX repeating groups.
+
+Converts a fixed size repeating group in a UBX payload (e.g. the
+satellites in NAV-SAT or the measurements in RXM-RAWX) into a NumPy
+structured array, with one record per repeat and one field per group
+attribute.
+
+The array dtype is derived from the compiled payload definition
+(see UBXDecoder) and the group is read with np.frombuffer directly
+from the payload. Where scale factors are applied, bitfields are
+parsed into individual flags or non-standard size integers (e.g.
+U3) are present, the affected fields are converted column by column.
+
+NumPy is an optional dependency; a UBXMessageError is raised if it
+is not installed.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import re
+
+import pyubx2.exceptions as ube
+import pyubx2.ubxtypes_core as ubt
+from pyubx2.ubxdecoder import (
+    FLD_ARRAY,
+    FLD_BITS,
+    FLD_BITSB,
+    FLD_INT,
+    FLD_NAVHP,
+    FLD_SCALE,
+    OP_BLOCK,
+    OP_GROUP,
+)
+from pyubx2.ubxhelpers import lazy_import
+
+np = lazy_import("numpy")  # NumPy is optional
+
+# NumPy type corresponding to struct format character
+NPTYPES = {
+    "B": "<u1",
+    "H": "<u2",
+    "I": "<u4",
+    "Q": "<u8",
+    "b": "<i1",
+    "h": "<i2",
+    "i": "<i4",
+    "q": "<i8",
+    "f": "<f4",
+    "d": "<f8",
+}
+STRUCTFMT = re.compile(r"(\d*)([a-zA-Z])")
+
+
+def check_numpy():
+    """
+    Check that NumPy is installed.
+
+    :raises: UBXMessageError (if NumPy not installed)
+    """
+
+    if np is None:
+        raise ube.UBXMessageError("NumPy is not installed")
+
+
+def block_dtypes(stc: object, fields: tuple) -> tuple:
+    """
+    Get raw and converted NumPy dtypes for compiled block of attributes.
+
+    :param struct.Struct stc: block struct
+    :param tuple fields: compiled block attributes (key, field type, field arg)
+    :return: tuple of (raw dtype, converted dtype, or None if no conversion required)
+    :rtype: tuple
+    """
+
+    raw = []
+    out = []
+    convert = False
+    for (key, fld, arg), (num, code) in zip(
+        fields, STRUCTFMT.findall(stc.format.lstrip("<"))
+    ):
+        if code == "s":
+            num = int(num)
+            if fld in (FLD_INT, FLD_BITSB, FLD_ARRAY):  # array of bytes
+                raw.append((key, "u1", (num,)))
+            else:  # characters or unparsed bitfield, as raw bytes
+                raw.append((key, f"V{num}"))
+        else:
+            raw.append((key, NPTYPES[code]))
+        if fld == FLD_SCALE:
+            out.append((key, "<f8"))
+            convert = True
+        elif fld == FLD_INT:  # wider than 8 bytes as Python int objects
+            out.append((key, "O" if num > 8 else "<i8" if arg else "<u8"))
+            convert = True
+        elif fld == FLD_BITS:
+            out += [(keyb, NPTYPES[code]) for keyb, _, _ in arg]
+            convert = True
+        elif fld == FLD_BITSB:
+            out += [(keyb, "<u8") for keyb, _, _ in arg]
+            convert = True
+        elif fld == FLD_NAVHP:  # high precision component and combined value
+            out += [raw[-1], (arg[0], "<f8")]
+            convert = True
+        else:
+            out.append(raw[-1])
+    return np.dtype(raw), (np.dtype(out) if convert else None)
+
+
+def _bytes2int(arr: object, signed: bool) -> object:
+    """
+    Convert array of little-endian byte sequences to integers.
+    Sequences wider than 8 bytes (e.g. U9) are converted to an
+    array of Python int objects, as they do not fit in an int64.
+
+    :param numpy.ndarray arr: 2-dimensional array of bytes
+    :param bool signed: signed Y/N
+    :return: array of integers
+    :rtype: numpy.ndarray
+    """
+
+    if arr.shape[1] > 8:
+        vals = np.empty(arr.shape[0], dtype=object)
+        vals[:] = [
+            int.from_bytes(row.tobytes(), "little", signed=signed) for row in arr
+        ]
+        return vals
+    vals = np.zeros(arr.shape[0], dtype=np.uint64)
+    for i in range(arr.shape[1]):
+        vals |= arr[:, i].astype(np.uint64) << np.uint64(8 * i)
+    if not signed:
+        return vals
+    bits = 8 * arr.shape[1]
+    vals = vals.astype(np.int64)
+    return np.where(vals >= 1 << (bits - 1), vals - (1 << bits), vals)
+
+
+def convert_columns(raw: object, fields: tuple, names: set = None) -> dict:
+    """
+    Convert columns of raw structured array, applying scale factors,
+    parsing bitfields, combining high precision components and
+    converting non-standard size integers.
+
+    :param numpy.ndarray raw: raw structured array
+    :param tuple fields: compiled attributes (key, field type, field arg)
+    :param set names: names of attributes required, None = all (None)
+    :return: dict of attribute name and converted array
+    :rtype: dict
+    """
+
+    cols = {}
+    for key, fld, arg in fields:
+        if fld in (FLD_BITS, FLD_BITSB):
+            bits = [bit for bit in arg if names is None or bit[0] in names]
+            if bits:
+                col = raw[key] if fld == FLD_BITS else _bytes2int(raw[key], False)
+                for keyb, bfoffset, mask in bits:
+                    vals = (col >> bfoffset) & mask
+                    cols[keyb] = vals.astype(np.uint64) if col.dtype == object else vals
+            continue
+        if fld == FLD_NAVHP:
+            keyp, keys, hpscale, scale = arg
+            if names is None or keyp in names:
+                cols[keyp] = np.round(
+                    (raw[keys] + raw[key] * hpscale) * scale, ubt.SCALROUND
+                )
+        if names is not None and key not in names:
+            continue
+        if fld == FLD_SCALE:
+            cols[key] = np.round(raw[key] * arg, ubt.SCALROUND)
+        elif fld == FLD_INT:
+            cols[key] = _bytes2int(raw[key], arg)
+        else:
+            cols[key] = raw[key]
+    return cols
+
+
+def convert_block(raw: object, fields: tuple, dtype: object) -> object:
+    """
+    Convert raw structured array to converted dtype (see convert_columns).
+
+    :param numpy.ndarray raw: raw structured array
+    :param tuple fields: compiled block attributes (key, field type, field arg)
+    :param numpy.dtype dtype: converted dtype
+    :return: converted structured array
+    :rtype: numpy.ndarray
+    """
+
+    out = np.empty(raw.shape, dtype=dtype)
+    for key, col in convert_columns(raw, fields).items():
+        out[key] = col
+    return out
+
+
+def find_group(plan: tuple, payload: bytes, getval: object, name: str = None) -> tuple:
+    """
+    Find fixed size repeating group in payload.
+
+    :param tuple plan: compiled payload plan (see UBXDecoder)
+    :param bytes payload: raw payload
+    :param object getval: function returning value of named (count) attribute
+    :param str name: name of any attribute in group, None = first group (None)
+    :return: tuple of (payload offset, number of repeats, group block struct, group block fields)
+    :rtype: tuple
+    :raises: UBXMessageError (if no such fixed size group)
+    """
+
+    offset = 0
+    for op in plan:
+        if op[0] == OP_BLOCK:
+            offset += op[1].size
+            continue
+        if op[0] != OP_GROUP or op[3] == 0:  # variable size
+            break
+        _, numr, sub, size = op
+        _, stc, fields = sub[0]
+        if isinstance(numr, int):
+            count = numr
+        elif numr is None:  # variable by size
+            count = max((len(payload) - offset) // size, 0)
+        else:
+            count = getval(numr)
+        if name is None or name in field_names(fields):
+            if offset + size * count > len(payload):
+                raise ube.UBXMessageError("Payload truncated")
+            return offset, count, stc, fields
+        offset += size * count
+    raise ube.UBXMessageError(
+        "No fixed size repeating group"
+        + ("" if name is None else f" containing attribute {name}")
+    )
+
+
+def field_names(fields: tuple) -> list:
+    """
+    Get attribute names in compiled attributes, with parsed bitfields
+    represented by their individual flags.
+
+    :param tuple fields: compiled block attributes (key, field type, field arg)
+    :return: list of attribute names
+    :rtype: list
+    """
+
+    names = []
+    for key, fld, arg in fields:
+        if fld in (FLD_BITS, FLD_BITSB):  # parsed bitfield
+            names += [keyb for keyb, _, _ in arg]
+            continue
+        names.append(key)
+        if fld == FLD_NAVHP:
+            names.append(arg[0])
+    return names
+
+
+def group_array(plan: tuple, payload: bytes, getval: object, name: str = None):
+    """
+    Get fixed size repeating group in payload as NumPy structured array.
+
+    If no conversions are required, the array is a read-only view
+    of the payload.
+
+    :param tuple plan: compiled payload plan (see UBXDecoder)
+    :param bytes payload: raw payload
+    :param object getval: function returning value of named (count) attribute
+    :param str name: name of any attribute in group, None = first group (None)
+    :return: structured array with one record per repeat
+    :rtype: numpy.ndarray
+    :raises: UBXMessageError (if NumPy not installed or no such fixed size group)
+    """
+
+    check_numpy()
+    offset, count, stc, fields = find_group(plan, payload, getval, name)
+    rawdtype, outdtype = block_dtypes(stc, fields)
+    raw = np.frombuffer(payload, dtype=rawdtype, count=count, offset=offset)
+    if outdtype is None:
+        return raw
+    return convert_block(raw, fields, outdtype)
@@ -0,0 +1,189 @@
+"""
+Parallel parsing of a single large capture file.
+
+The file is split into chunks, each chunk boundary is realigned to
+a verified UBX, NMEA or RTCM3 frame start, and the chunks are then
+parsed in separate processes using a memory-mapped UBXReader. Results
+are returned either as a single list of (raw, parsed) tuples in
+original file order, or as a list of per-chunk aggregates.
+
+For well-formed streams the results are identical to those of a
+single sequential UBXReader pass over the file. Any UBXReader keyword
+arguments (including an 'errorhandler' or 'aggregate' function) must
+be picklable.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from mmap import ACCESS_READ, mmap
+
+from pynmeagps.nmeahelpers import calc_checksum as nmea_checksum, get_parts
+import pynmeagps.exceptions as nme
+from pyrtcm.rtcmhelpers import calc_crc24q
+from pyubx2.ubxhelpers import calc_checksum
+from pyubx2.ubxreader import SYNCBYTES, UBXReader
+import pyubx2.ubxtypes_core as ubt
+
+MINCHUNK = 1048576  # minimum default chunk size in bytes
+NMEAMAXLEN = 1024  # maximum NMEA sentence length searched for terminator
+
+
+def frame_length(buf: object, pos: int) -> int:
+    """
+    Get length of a valid UBX, NMEA or RTCM3 frame starting at the
+    specified position, with a valid checksum or CRC.
+
+    :param object buf: buffer e.g. bytes or mmap
+    :param int pos: position of candidate frame start
+    :return: length of frame in bytes, or 0 if no valid frame
+    :rtype: int
+    """
+
+    hdr = buf[pos : pos + 2]
+    if hdr == ubt.UBX_HDR and pos + 8 <= len(buf):
+        end = pos + 8 + int.from_bytes(buf[pos + 4 : pos + 6], "little")
+        if (
+            end <= len(buf)
+            and calc_checksum(buf[pos + 2 : end - 2]) == buf[end - 2 : end]
+        ):
+            return end - pos
+    elif hdr in ubt.NMEA_HDR:
+        end = buf.find(b"\n", pos, pos + NMEAMAXLEN) + 1
+        if end > 0:
+            raw = buf[pos:end]
+            try:
+                _, _, _, cksum = get_parts(raw)
+                if raw[-2:] == b"\x0d\x0a" and cksum == nmea_checksum(raw):
+                    return end - pos
+            except (nme.NMEAMessageError, UnicodeDecodeError, ValueError):
+                pass
+    elif len(hdr) == 2 and hdr[0] == 0xD3 and (hdr[1] & ~0x03) == 0:
+        if pos + 3 <= len(buf):
+            end = pos + 6 + (buf[pos + 2] | (hdr[1] << 8))
+            if end <= len(buf) and calc_crc24q(buf[pos:end]) == 0:
+                return end - pos
+    return 0
+
+
+def find_frame(buf: object, pos: int) -> int:
+    """
+    Find the first verified frame start at or after the specified
+    position. A frame is verified if it is valid and is followed
+    either by another valid frame or by the end of the buffer.
+
+    :param object buf: buffer e.g. bytes or mmap
+    :param int pos: position from which to search
+    :return: position of verified frame start, or length of buffer if none found
+    :rtype: int
+    """
+
+    while True:
+        sync = SYNCBYTES.search(buf, pos)
+        if sync is None:
+            return len(buf)
+        pos = sync.start()
+        length = frame_length(buf, pos)
+        if length and (pos + length == len(buf) or frame_length(buf, pos + length)):
+            return pos
+        pos += 1
+
+
+def chunk_bounds(path: str, chunksize: int) -> list:
+    """
+    Split file into chunks of approximately the specified size,
+    with each chunk starting at a verified frame start.
+
+    :param str path: path to capture file
+    :param int chunksize: nominal chunk size in bytes
+    :return: list of (start, end) offsets for each chunk
+    :rtype: list
+    """
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    with open(path, "rb") as stream:
+        with mmap(stream.fileno(), 0, access=ACCESS_READ) as mapping:
+            starts = [0]
+            for offset in range(chunksize, size, chunksize):
+                start = find_frame(mapping, max(offset, starts[-1]))
+                if start > starts[-1]:
+                    starts.append(start)
+    return [
+        (start, end) for start, end in zip(starts, starts[1:] + [size]) if start < end
+    ]
+
+
+def parse_chunk(path: str, start: int, end: int, aggregate: object, kwargs: dict):
+    """
+    Parse all frames starting within a chunk of a capture file.
+
+    :param str path: path to capture file
+    :param int start: chunk start offset
+    :param int end: chunk end offset
+    :param object aggregate: function taking UBXReader and returning aggregate, or None
+    :param dict kwargs: UBXReader keyword arguments
+    :return: list of (raw, parsed) tuples, or aggregate
+    :rtype: object
+    """
+
+    ubr = UBXReader.from_file(path, start=start, end=end, **kwargs)
+    try:
+        if aggregate is None:
+            return list(ubr)
+        return aggregate(ubr)
+    finally:
+        ubr.datastream.close()
+
+
+def parse_file(
+    path: str,
+    workers: int = None,
+    chunksize: int = None,
+    aggregate: object = None,
+    **kwargs,
+) -> list:
+    """
+    Parse capture file in parallel across multiple processes.
+
+    If an 'aggregate' function is provided, it is called in each
+    worker process with a UBXReader over that chunk (an iterator of
+    (raw, parsed) tuples) and its return values are returned in
+    chunk order e.g.
+
+    def count(ubr):
+        return Counter(parsed.identity for _, parsed in ubr)
+
+    :param str path: path to capture file
+    :param int workers: number of worker processes, None = number of CPUs (None)
+    :param int chunksize: nominal chunk size in bytes, None = derived from file size (None)
+    :param object aggregate: function taking UBXReader and returning aggregate (None)
+    :param kwargs: optional UBXReader keyword arguments
+    :return: list of (raw, parsed) tuples in file order, or list of per-chunk aggregates
+    :rtype: list
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(MINCHUNK, -(-os.path.getsize(path) // (workers * 4)))
+    bounds = chunk_bounds(path, chunksize)
+    if workers == 1 or len(bounds) < 2:  # no benefit in separate processes
+        results = [
+            parse_chunk(path, start, end, aggregate, kwargs) for start, end in bounds
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(parse_chunk, path, start, end, aggregate, kwargs)
+                for start, end in bounds
+            ]
+            results = [future.result() for future in futures]
+    if aggregate is not None:
+        return results
+    return [msg for chunk in results for msg in chunk]
@@ -0,0 +1,77 @@
+"""
+UBXParser class.
+
+Push-based incremental parser for UBX, NMEA and RTCM3 messages.
+
+Arbitrary chunks of data (e.g. from an event loop, selector,
+serial callback or message broker) are fed to the parser, which
+returns all the messages completed by that chunk and holds any
+partial message until the remainder is fed:
+
+ubp = UBXParser(protfilter=7)
+for (raw_data, parsed_data) in ubp.feed(data):
+    ...
+
+The parser never reads from or blocks on a stream. Messages are
+framed and parsed by an internal UBXReader, so protocol detection,
+filtering and error handling are identical to UBXReader.read().
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2020
+:license: BSD 3-Clause
+"""
+
+from pyubx2.ubxreader import UBXReader
+
+# pylint: disable=protected-access
+
+
+class UBXParser:
+    """
+    UBXParser class.
+    """
+
+    def __init__(self, **kwargs):
+        """Constructor.
+
+        :param kwargs: optional UBXReader keyword arguments (protfilter, quitonerror etc.)
+        """
+
+        self._ubr = UBXReader(None, **kwargs)
+
+    def feed(self, data: bytes) -> list:
+        """
+        Feed data to parser and return any messages completed by it.
+
+        If 'quitonerror' = 2 (ERR_RAISE), a parsing error is raised
+        as soon as it is encountered, and any messages preceding the
+        erroneous message in the same chunk are discarded. Parsing
+        resumes after the erroneous message on the next call.
+
+        :param bytes data: data e.g. bytes, bytearray or memoryview
+        :return: list of (raw_data as bytes, parsed_data) tuples
+        :rtype: list
+        """
+
+        ubr = self._ubr
+        ubr._feed(data)
+        messages = []
+        while True:
+            msg = ubr._read_buffered()
+            if msg is None:  # no further complete messages
+                return messages
+            if msg != (None, None):  # (None, None) = malformed NMEA terminator
+                messages.append(msg)
+
+    @property
+    def pending(self) -> int:
+        """
+        Getter for number of bytes held pending completion of a message.
+
+        :return: number of bytes
+        :rtype: int
+        """
+
+        return len(self._ubr._buffer) - self._ubr._pos
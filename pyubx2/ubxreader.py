@@ -17,17 +17,28 @@ Created on 2 Oct 2020
 :license: BSD 3-Clause
 """
 
+import mmap as mmp
+import os
+import re
+from io import BufferedReader, BytesIO, FileIO
 from socket import socket
-from pyrtcm import RTCMReader
-import pyrtcm.exceptions as rte
-from pynmeagps import NMEAReader
-import pynmeagps.exceptions as nme
+from time import perf_counter
 from pyubx2.socket_stream import SocketStream
+from pyubx2.ubxframe import UBXFrame
 from pyubx2.ubxmessage import UBXMessage
-from pyubx2.ubxhelpers import calc_checksum, val2bytes, bytes2val
+from pyubx2.ubxhelpers import calc_checksum, lazy_import, val2bytes, bytes2val
 import pyubx2.ubxtypes_core as ubt
 import pyubx2.exceptions as ube
 
+# NMEA and RTCM3 parsers are imported on first use
+pynmeagps = lazy_import("pynmeagps")
+pyrtcm = lazy_import("pyrtcm")
+
+READCHUNK = 65536  # size of read-ahead chunks for file streams
+SYNCBYTES = re.compile(b"[\xb5\x24\xd3]")  # UBX, NMEA or RTCM3 first byte
+# names of statistics collected for each message identity
+STATNAMES = ("count", "bytes", "time", "maxtime", "cksumfail", "failed")
+
 
 class UBXReader:
     """
@@ -37,16 +48,28 @@ class UBXReader:
     def __init__(self, datastream, **kwargs):
         """Constructor.
 
-        :param datastream stream: input data stream
-        :param int quitonerror: (kwarg) 0 = ignore errors,  1 = log errors and continue, 2 = (re)raise errors (1)
+        :param datastream stream: input data stream (including memory-mapped file),
+            or None if data is to be fed to the internal buffer
+        :param int quitonerror: (kwarg) 0 = ignore errors,  1 = log errors and continue,
+            2 = (re)raise errors (1)
         :param int errorhandler: (kwarg) error handling object or function (None)
         :param int protfilter: (kwarg) protocol filter 1 = NMEA, 2 = UBX, 4 = RTCM3 (3)
+        :param set msgfilter: (kwarg) message filter - set of message identities to be
+            returned e.g. {'NAV-PVT', 'GGA', 1077}, None = all (None)
         :param int validate: (kwarg) 0 = ignore invalid checksum, 1 = validate checksum (1)
         :param int msgmode: (kwarg) 0=GET, 1=SET, 2=POLL (0)
         :param bool parsebitfield: (kwarg) 1 = parse bitfields, 0 = leave as bytes (1)
         :param bool scaling: (kwarg) 1 = apply scale factors, 0 = do not apply (1)
         :param bool labelmsm: (kwarg) whether to label RTCM3 MSM NSAT and NCELL attributes (1)
+        :param bool lazy: (kwarg) defer decoding of UBX payload attributes until accessed (0)
+        :param bool compact: (kwarg) hold UBX attribute values as a single tuple to reduce
+            memory usage (0)
+        :param int arraytype: (kwarg) type of UBX array attributes e.g. MON-SPAN spectrum
+            0 = list, 1 = array.array('B'), 2 = numpy.ndarray (0)
+        :param bool framesonly: (kwarg) return validated raw frames as UBXFrame objects
+            without parsing (0)
         :param int bufsize: (kwarg) socket recv buffer size (1024)
+        :param bool stats: (kwarg) collect message and error statistics (see stats property) (0)
         :raises: UBXStreamError (if mode is invalid)
 
         """
@@ -66,12 +89,86 @@ class UBXReader:
         self._scaling = int(kwargs.get("scaling", True))
         self._labelmsm = int(kwargs.get("labelmsm", True))
         self._msgmode = int(kwargs.get("msgmode", 0))
+        self._lazy = int(kwargs.get("lazy", False))
+        self._compact = int(kwargs.get("compact", False))
+        self._arraytype = int(kwargs.get("arraytype", ubt.ARR_LIST))
+        self._framesonly = int(kwargs.get("framesonly", False))
+        self._ubxfilter = self._nmeafilter = self._rtcmfilter = None
+        msgfilter = kwargs.get("msgfilter", None)
+        if msgfilter is not None:
+            self._set_msgfilter(msgfilter)
+        self._buffer = bytearray()  # internal read buffer
+        self._pos = 0  # current read position in internal buffer
+        self._offset = 0  # stream offset of start of internal buffer
+        self._end = None  # stream offset at which to stop reading, if any
+        self._mark = 0  # position of last candidate frame start found by scan
+        # statistics are only collected if requested, None = not collected
+        self._stats = None
+        if kwargs.get("stats", False):
+            self.reset_stats()
+        # a memory-mapped file is framed in place, using the
+        # mapping itself as the internal buffer
+        self._mapped = isinstance(self._stream, mmp.mmap)
+        # with no stream, data is fed to (pushed into) the internal buffer
+        self._push = self._stream is None
+        # only read ahead where the stream will return what is
+        # available rather than blocking until the chunk is filled
+        self._readahead = (
+            self._mapped
+            or self._push
+            or isinstance(self._stream, (BytesIO, SocketStream))
+            or (
+                isinstance(self._stream, BufferedReader)
+                and isinstance(self._stream.raw, FileIO)
+            )
+        )
+        if self._mapped:
+            self._buffer = self._stream
+            self._pos = self._stream.tell()
+        elif self._readahead and hasattr(self._stream, "tell"):
+            # report offsets relative to start of file
+            self._offset = self._stream.tell()
 
         if self._msgmode not in (0, 1, 2):
             raise ube.UBXStreamError(
                 f"Invalid stream mode {self._msgmode} - must be 0, 1 or 2"
             )
 
+    @classmethod
+    def from_file(
+        cls, path: str, mmap: bool = True, start: int = 0, end: int = None, **kwargs
+    ) -> "UBXReader":
+        """
+        Create UBXReader for a capture file, optionally memory-mapping
+        the file so that frames are sliced directly from the mapping
+        rather than read into an intermediate buffer.
+
+        If a byte range is specified, only frames starting within
+        that range are returned (a frame starting before 'end' is
+        read in full).
+
+        The mapping (or file) can be closed via `datastream.close()`.
+
+        :param str path: path to capture file
+        :param bool mmap: memory-map the file Y/N (True)
+        :param int start: offset in file at which to start reading (0)
+        :param int end: offset in file at which to stop reading, None = end of file (None)
+        :param kwargs: optional UBXReader keyword arguments
+        :return: UBXReader instance
+        :rtype: UBXReader
+        """
+
+        # an empty file cannot be mapped
+        if not mmap or os.path.getsize(path) == 0:
+            stream = open(path, "rb")  # pylint: disable=consider-using-with
+        else:
+            with open(path, "rb") as fstream:
+                stream = mmp.mmap(fstream.fileno(), 0, access=mmp.ACCESS_READ)
+        stream.seek(start)
+        ubr = cls(stream, **kwargs)
+        ubr._end = end
+        return ubr
+
     def __iter__(self):
         """Iterator."""
 
@@ -100,7 +197,11 @@ class UBXReader:
         'protfilter' determines which protocols are parsed.
         'quitonerror' determines whether to raise, log or ignore parsing errors.
 
-        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage, NMEAMessage or RTCMMessage)
+        In 'framesonly' mode, parsed_data is a UBXFrame holding the
+        checksum-validated raw frame and its offset in the stream.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage, NMEAMessage,
+            RTCMMessage or UBXFrame)
         :rtype: tuple
         :raises: UBXStreamError (if unrecognised protocol in data stream)
         """
@@ -111,47 +212,40 @@ class UBXReader:
             while parsing:  # loop until end of valid message or EOF
                 raw_data = None
                 parsed_data = None
-                byte1 = self._read_bytes(1)  # read the first byte
-                # if not UBX, NMEA or RTCM3, discard and continue
-                if byte1 not in (b"\xb5", b"\x24", b"\xd3"):
-                    continue
-                byte2 = self._read_bytes(1)
-                bytehdr = byte1 + byte2
+                # discard any bytes preceding the next UBX, NMEA or RTCM3
+                # first byte, then read the 2-byte header
+                bytehdr = self._scan()
+                byte1 = bytehdr[0:1]
+                byte2 = bytehdr[1:2]
                 # if it's a UBX message (b'\xb5\x62')
                 if bytehdr == ubt.UBX_HDR:
-                    (raw_data, parsed_data) = self._parse_ubx(bytehdr)
-                    # if protocol filter passes UBX, return message,
-                    # otherwise discard and continue
-                    if self._protfilter & ubt.UBX_PROTOCOL:
-                        parsing = False
-                    else:
-                        continue
+                    parser = self._parse_ubx
                 # if it's an NMEA message ('$G' or '$P')
                 elif bytehdr in ubt.NMEA_HDR:
-                    (raw_data, parsed_data) = self._parse_nmea(bytehdr)
-                    # if protocol filter passes NMEA, return message,
-                    # otherwise discard and continue
-                    if self._protfilter & ubt.NMEA_PROTOCOL:
-                        parsing = False
-                    else:
-                        continue
+                    parser = self._parse_nmea
                 # if it's a RTCM3 message
                 # (byte1 = 0xd3; byte2 = 0b000000**)
                 elif byte1 == b"\xd3" and (byte2[0] & ~0x03) == 0:
-                    (raw_data, parsed_data) = self._parse_rtcm3(bytehdr)
-                    # if protocol filter passes RTCM, return message,
-                    # otherwise discard and continue
-                    if self._protfilter & ubt.RTCM3_PROTOCOL:
-                        parsing = False
-                    else:
-                        continue
+                    parser = self._parse_rtcm3
                 # unrecognised protocol header
                 else:
+                    if self._stats is not None:
+                        self._unknown += 1
+                        self._discarded += len(bytehdr)
                     if self._quitonerror == ubt.ERR_RAISE:
                         raise ube.UBXParseError(f"Unknown protocol {bytehdr}.")
                     if self._quitonerror == ubt.ERR_LOG:
                         return (bytehdr, f"<UNKNOWN PROTOCOL(header={bytehdr})>")
                     continue
+                if self._stats is None:
+                    (raw_data, parsed_data) = parser(bytehdr)
+                else:
+                    (raw_data, parsed_data) = self._parse_stats(parser, bytehdr)
+                # if protocol and message filters pass message, return
+                # message, otherwise discard and continue
+                if raw_data is None:
+                    continue
+                parsing = False
 
         except EOFError:
             return (None, None)
@@ -160,14 +254,19 @@ class UBXReader:
             ube.UBXTypeError,
             ube.UBXParseError,
             ube.UBXStreamError,
-            nme.NMEAMessageError,
-            nme.NMEATypeError,
-            nme.NMEAParseError,
-            nme.NMEAStreamError,
-            rte.RTCMMessageError,
-            rte.RTCMParseError,
-            rte.RTCMStreamError,
-            rte.RTCMTypeError,
+        ) as err:
+            if self._quitonerror:
+                self._do_error(str(err))
+            parsed_data = str(err)
+        except (
+            pynmeagps.NMEAMessageError,
+            pynmeagps.NMEATypeError,
+            pynmeagps.NMEAParseError,
+            pynmeagps.NMEAStreamError,
+            pyrtcm.RTCMMessageError,
+            pyrtcm.RTCMParseError,
+            pyrtcm.RTCMStreamError,
+            pyrtcm.RTCMTypeError,
         ) as err:
             if self._quitonerror:
                 self._do_error(str(err))
@@ -184,27 +283,38 @@ class UBXReader:
         :rtype: tuple
         """
 
-        # read the rest of the UBX message from the buffer
-        byten = self._read_bytes(4)
-        clsid = byten[0:1]
-        msgid = byten[1:2]
-        lenb = byten[2:4]
-        leni = int.from_bytes(lenb, "little", signed=False)
-        byten = self._read_bytes(leni + 2)
-        plb = byten[0:leni]
-        cksum = byten[leni : leni + 2]
-        raw_data = hdr + clsid + msgid + lenb + plb + cksum
-        # only parse if we need to (filter passes UBX)
-        if self._protfilter & ubt.UBX_PROTOCOL:
+        offset = self._offset + self._pos - len(hdr)
+        # rewind to header and read entire frame from the buffer in one slice
+        self._pos -= len(hdr)
+        frmhdr = self._peek(6)
+        leni = int.from_bytes(frmhdr[4:6], "little", signed=False)
+        # skip frame without reading it if filtered out
+        if not self._protfilter & ubt.UBX_PROTOCOL or (
+            self._ubxfilter is not None and not self._ubx_wanted(frmhdr, leni)
+        ):
+            self._skip(leni + 8)
+            return (None, None)
+        raw_data = self._read_bytes(leni + 8)
+        if self._framesonly:
+            if self._validate & ubt.VALCKSUM:
+                cksum = raw_data[-2:]
+                ckv = calc_checksum(memoryview(raw_data)[2:-2])
+                if cksum != ckv:
+                    raise ube.UBXParseError(
+                        (f"Message checksum {cksum}" f" invalid - should be {ckv}")
+                    )
+            parsed_data = UBXFrame(ubt.UBX_PROTOCOL, raw_data, offset)
+        else:
             parsed_data = self.parse(
                 raw_data,
                 validate=self._validate,
                 msgmode=self._msgmode,
                 parsebitfield=self._parsebf,
                 scaling=self._scaling,
+                lazy=self._lazy,
+                compact=self._compact,
+                arraytype=self._arraytype,
             )
-        else:
-            parsed_data = None
         return (raw_data, parsed_data)
 
     def _parse_nmea(self, hdr: bytes) -> tuple:
@@ -216,51 +326,326 @@ class UBXReader:
         :rtype: tuple
         """
 
-        # read the rest of the NMEA message from the buffer
-        byten = self._stream.readline()  # NMEA protocol is CRLF-terminated
-        if byten[-2:] != b"\x0d\x0a":
+        offset = self._offset + self._pos - len(hdr)
+        # rewind to header and read the entire NMEA message from the buffer
+        self._pos -= len(hdr)
+        raw_data = self._read_line()  # NMEA protocol is CRLF-terminated
+        if raw_data[-2:] != b"\x0d\x0a":
             raise EOFError()
-        raw_data = hdr + byten
-        # only parse if we need to (filter passes NMEA)
-        if self._protfilter & ubt.NMEA_PROTOCOL:
+        # discard if filtered out
+        if not self._protfilter & ubt.NMEA_PROTOCOL or (
+            self._nmeafilter is not None and not self._nmea_wanted(raw_data)
+        ):
+            return (None, None)
+        if self._framesonly:
+            if self._validate & ubt.VALCKSUM:
+                try:
+                    talker, msgid, _, cksum = pynmeagps.get_parts(raw_data)
+                    ckv = pynmeagps.calc_checksum(raw_data)
+                except pynmeagps.NMEAMessageError as err:
+                    raise pynmeagps.NMEAParseError(err) from err
+                if cksum != ckv:
+                    raise pynmeagps.NMEAParseError(
+                        f"Message {talker}{msgid} invalid checksum {cksum}"
+                        f" - should be {ckv}."
+                    )
+            parsed_data = UBXFrame(ubt.NMEA_PROTOCOL, raw_data, offset)
+        else:
             # invoke pynmeagps parser
-            parsed_data = NMEAReader.parse(
+            parsed_data = pynmeagps.NMEAReader.parse(
                 raw_data,
                 validate=self._validate,
                 msgmode=self._msgmode,
             )
-        else:
-            parsed_data = None
         return (raw_data, parsed_data)
 
-    def _parse_rtcm3(self, hdr: bytes, **kwargs) -> tuple:
+    def _parse_rtcm3(self, hdr: bytes) -> tuple:
         """
         Parse any RTCM3 data in the stream (using pyrtcm library).
 
         :param bytes hdr: first 2 bytes of RTCM3 header
-        :param bool validate: (kwarg) validate crc Y/N
         :return: tuple of (raw_data as bytes, parsed_stub as RTCMMessage)
         :rtype: tuple
         """
 
-        hdr3 = self._read_bytes(1)
-        size = hdr3[0] | (hdr[1] << 8)
-        payload = self._read_bytes(size)
-        crc = self._read_bytes(3)
-        raw_data = hdr + hdr3 + payload + crc
-        # only parse if we need to (filter passes RTCM)
-        if self._protfilter & ubt.RTCM3_PROTOCOL:
+        offset = self._offset + self._pos - len(hdr)
+        # rewind to header and read entire frame from the buffer in one slice
+        self._pos -= len(hdr)
+        size = self._peek(3)[2] | (hdr[1] << 8)
+        # skip frame without reading it if filtered out
+        if not self._protfilter & ubt.RTCM3_PROTOCOL or (
+            self._rtcmfilter is not None and not self._rtcm_wanted(size)
+        ):
+            self._skip(size + 6)
+            return (None, None)
+        raw_data = self._read_bytes(size + 6)
+        if self._framesonly:
+            if self._validate & ubt.VALCKSUM and pyrtcm.calc_crc24q(raw_data):
+                raise pyrtcm.RTCMParseError(
+                    f"RTCM3 message invalid - failed CRC: {raw_data[-3:]}"
+                )
+            parsed_data = UBXFrame(ubt.RTCM3_PROTOCOL, raw_data, offset)
+        else:
             # invoke pyrtcm parser
-            parsed_data = RTCMReader.parse(
+            parsed_data = pyrtcm.RTCMReader.parse(
                 raw_data,
                 validate=self._validate,
                 scaling=self._scaling,
                 labelmsm=self._labelmsm,
             )
-        else:
-            parsed_data = None
         return (raw_data, parsed_data)
 
+    def _parse_stats(self, parser: object, hdr: bytes) -> tuple:
+        """
+        Parse remainder of message, recording its size and parse time
+        (or the checksum failure or other error) against its identity.
+
+        :param object parser: parse method e.g. self._parse_ubx
+        :param bytes hdr: 2-byte header
+        :return: tuple of (raw_data as bytes, parsed_data), as returned by parser
+        :rtype: tuple
+        """
+
+        start = self._offset + self._pos - len(hdr)
+        started = perf_counter()
+        try:
+            (raw_data, parsed_data) = parser(hdr)
+        except EOFError:
+            raise
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            # identify failed frame from any part of it still in buffer
+            pos = start - self._offset
+            raw = bytes(self._buffer[pos : self._pos]) if pos >= 0 else b""
+            if hdr == ubt.UBX_HDR:
+                protocol = ubt.UBX_PROTOCOL
+            elif hdr in ubt.NMEA_HDR:
+                protocol = ubt.NMEA_PROTOCOL
+            else:
+                protocol = ubt.RTCM3_PROTOCOL
+            try:
+                identity = UBXFrame(protocol, raw).identity
+            except (IndexError, KeyError, ValueError):  # truncated or malformed
+                identity = "UNKNOWN"
+            stats = self._stats.get(identity, None)
+            if stats is None:
+                stats = self._stats[identity] = [0, 0, 0.0, 0.0, 0, 0]
+            err = str(err)
+            if "checksum" in err or "CRC" in err:
+                stats[4] += 1
+            else:
+                stats[5] += 1
+            raise
+        elapsed = perf_counter() - started
+        if raw_data is not None:  # not filtered out
+            identity = parsed_data.identity
+            stats = self._stats.get(identity, None)
+            if stats is None:
+                stats = self._stats[identity] = [0, 0, 0.0, 0.0, 0, 0]
+            stats[0] += 1
+            stats[1] += len(raw_data)
+            stats[2] += elapsed
+            if elapsed > stats[3]:
+                stats[3] = elapsed
+        return (raw_data, parsed_data)
+
+    def _set_msgfilter(self, msgfilter: object):
+        """
+        Convert message filter into sets of UBX message keys
+        (class, id and, for MGA messages, type bytes), NMEA identities
+        and RTCM3 message numbers, for checking against frame headers.
+
+        :param object msgfilter: iterable of message identities
+        """
+
+        names = {str(name) for name in msgfilter}
+        self._ubxfilter = {key for key, name in ubt.UBX_MSGIDS.items() if name in names}
+        self._nmeafilter = set()
+        self._rtcmfilter = set()
+        for name in names:
+            if name.isdigit():  # RTCM3 message number
+                self._rtcmfilter.add(int(name))
+            elif name.endswith("-NOMINAL"):  # unrecognised UBX e.g. 'NAV-ff01-NOMINAL'
+                try:
+                    self._ubxfilter.add(bytes.fromhex(name.split("-")[1]))
+                except ValueError:
+                    pass
+            else:  # NMEA identity or msgID e.g. 'GNGGA', 'GGA' or 'PUBX00'
+                self._nmeafilter.add(name)
+
+    def _ubx_wanted(self, hdr: bytes, length: int) -> bool:
+        """
+        Check if UBX message passes message filter.
+
+        :param bytes hdr: first 6 bytes of UBX frame
+        :param int length: payload length
+        :return: True if message is wanted
+        :rtype: bool
+        """
+
+        key = hdr[2:4]
+        # all MGA messages except MGA-DBD are identified by the
+        # 'type' attribute - the first byte of the payload
+        if key[0] == 0x13 and key[1] != 0x80 and length:
+            mgakey = key + self._peek(7)[6:7]
+            if mgakey in ubt.UBX_MSGIDS:
+                key = mgakey
+        return key in self._ubxfilter
+
+    def _nmea_wanted(self, raw_data: bytes) -> bool:
+        """
+        Check if NMEA message passes message filter, by either
+        identity (e.g. 'GNGGA') or msgID (e.g. 'GGA').
+
+        :param bytes raw_data: raw NMEA message
+        :return: True if message is wanted
+        :rtype: bool
+        """
+
+        frame = UBXFrame(ubt.NMEA_PROTOCOL, raw_data)
+        try:
+            return (
+                frame.msgid[1] in self._nmeafilter or frame.identity in self._nmeafilter
+            )
+        except (IndexError, UnicodeDecodeError):  # malformed header
+            return False
+
+    def _rtcm_wanted(self, size: int) -> bool:
+        """
+        Check if RTCM3 message passes message filter.
+
+        :param int size: payload length
+        :return: True if message is wanted
+        :rtype: bool
+        """
+
+        if size < 2:
+            return False
+        hdr = self._peek(5)
+        msgtype = (hdr[3] << 4) | (hdr[4] >> 4)
+        return msgtype in self._rtcmfilter
+
+    def _fill(self, size: int) -> bool:
+        """
+        Top up internal buffer from stream until it holds at least
+        the specified number of unread bytes. File and socket streams are read
+        ahead in chunks; other streams (e.g. serial) are read
+        for the exact number of bytes still required.
+
+        :param int size: number of unread bytes required
+        :return: True if buffer holds required bytes, False if stream ended
+        :rtype: bool
+        """
+
+        buf = self._buffer
+        if self._mapped or self._push:  # only data already in buffer is available
+            return len(buf) - self._pos >= size
+        while len(buf) - self._pos < size:
+            if self._pos:  # discard bytes already read
+                del buf[: self._pos]
+                self._offset += self._pos
+                self._pos = 0
+            if self._readahead:
+                data = self._stream.read1(max(size - len(buf), READCHUNK))
+                if not data:  # EOF
+                    return False
+            else:
+                data = self._stream.read(size - len(buf))
+                if len(data) < size - len(buf):  # EOF or timeout
+                    return False
+            buf += data
+        return True
+
+    def _feed(self, data: bytes):
+        """
+        Append data to internal buffer, discarding bytes already read.
+        Only applicable where there is no data stream.
+
+        :param bytes data: data
+        """
+
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._offset += self._pos
+            self._pos = 0
+        self._buffer += data
+
+    def _read_buffered(self) -> tuple:
+        """
+        Read next message from data already in internal buffer.
+        If the buffer ends part way through a message, the read
+        position is rewound to the start of that message so that
+        it can be read again once more data has been fed.
+        Only applicable where there is no data stream.
+
+        :return: tuple of (raw_data as bytes, parsed_data), or None if buffer holds
+            no complete message
+        :rtype: tuple
+        """
+
+        self._mark = self._pos
+        (raw_data, parsed_data) = self.read()
+        if (
+            raw_data is None and parsed_data is None and self._pos >= len(self._buffer)
+        ):  # buffer exhausted part way through message
+            self._pos = self._mark
+            return None
+        return (raw_data, parsed_data)
+
+    def _scan(self) -> bytes:
+        """
+        Discard bytes until the next candidate UBX, NMEA or RTCM3
+        first byte, then read 2-byte header.
+
+        :return: 2-byte header
+        :rtype: bytes
+        :raises: EOFError if stream ends prematurely
+        """
+
+        while True:
+            if not self._fill(1):
+                raise EOFError()
+            pos = self._pos
+            sync = SYNCBYTES.search(self._buffer, pos)
+            # discard entire buffer if no first byte found
+            self._pos = len(self._buffer) if sync is None else sync.start()
+            if self._stats is not None:
+                self._discarded += self._pos - pos
+            self._mark = self._pos
+            if self._end is not None and self._offset + self._pos >= self._end:
+                raise EOFError()
+            if sync is not None:
+                return self._read_bytes(2)
+
+    def _peek(self, size: int) -> bytes:
+        """
+        Return a specified number of bytes from stream without
+        consuming them.
+
+        :param int size: number of bytes to return
+        :return: bytes
+        :rtype: bytes
+        :raises: EOFError if stream ends prematurely
+        """
+
+        if not self._fill(size):  # EOF
+            self._pos = len(self._buffer)
+            raise EOFError()
+        return bytes(self._buffer[self._pos : self._pos + size])
+
+    def _skip(self, size: int):
+        """
+        Skip a specified number of bytes in stream without
+        copying them.
+
+        :param int size: number of bytes to skip
+        :raises: EOFError if stream ends prematurely
+        """
+
+        if not self._fill(size):  # EOF
+            self._pos = len(self._buffer)
+            raise EOFError()
+        self._pos += size
+
     def _read_bytes(self, size: int) -> bytes:
         """
         Read a specified number of bytes from stream.
@@ -271,12 +656,39 @@ class UBXReader:
         :raises: EOFError if stream ends prematurely
         """
 
-        data = self._stream.read(size)
-        if len(data) < size:  # EOF
-            raise EOFError()
+        data = self._peek(size)
+        self._pos += size
         return data
 
-    def iterate(self, **kwargs) -> tuple:
+    def _read_line(self) -> bytes:
+        """
+        Read bytes from stream until LF reached.
+
+        :return: bytes, including LF terminator if found before end of stream
+        :rtype: bytes
+        """
+
+        if not self._readahead:  # avoid reading past line end
+            data = self._stream.readline()
+            line = bytes(self._buffer[self._pos :]) + data
+            self._pos = len(self._buffer)
+            self._offset += len(data)
+            return line
+        searched = 0  # number of unread bytes already searched
+        while True:
+            end = self._buffer.find(b"\n", self._pos + searched)
+            if end >= 0:
+                end += 1
+                break
+            searched = len(self._buffer) - self._pos
+            if not self._fill(searched + 1):  # EOF
+                end = len(self._buffer)
+                break
+        pos = self._pos
+        self._pos = end
+        return bytes(self._buffer[pos:end])
+
+    def iterate(self) -> tuple:
         """
         DEPRECATED - WILL BE REMOVED IN VERSION >=1.2.23
         USE STANDARD ITERATOR INSTEAD
@@ -300,6 +712,8 @@ class UBXReader:
         :raises: UBXParseError if quitonerror = 2
         """
 
+        if self._stats is not None:
+            self._errors += 1
         if self._quitonerror == ubt.ERR_RAISE:
             raise ube.UBXParseError(err)
         if self._quitonerror == ubt.ERR_LOG:
@@ -309,6 +723,60 @@ class UBXReader:
             else:
                 self._errorhandler(err)
 
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for snapshot of statistics collected since reader was
+        created or statistics were last reset (only if created with
+        stats=True). 'identities' holds, for each message identity:
+
+        - count: number of messages read
+        - bytes: total size of messages read
+        - time: cumulative parse time in seconds
+        - maxtime: maximum parse time in seconds
+        - cksumfail: number of messages with invalid checksum or CRC
+        - failed: number of messages which failed to parse for other reasons
+
+        Unrecognised UBX messages are included under their NOMINAL
+        identity e.g. 'NAV-ff01-NOMINAL'. Stream-level counts are:
+
+        - nominal: number of unrecognised UBX messages read
+        - unknown: number of unrecognised protocol headers
+        - discarded: number of bytes discarded while seeking next message
+        - errors: number of errors handled (see quitonerror)
+
+        :return: dict of statistics, or None if not collected
+        :rtype: dict
+        """
+
+        if self._stats is None:
+            return None
+        identities = {
+            identity: dict(zip(STATNAMES, stats))
+            for identity, stats in self._stats.items()
+        }
+        return {
+            "identities": identities,
+            "nominal": sum(
+                stats["count"]
+                for identity, stats in identities.items()
+                if identity.endswith("NOMINAL")
+            ),
+            "unknown": self._unknown,
+            "discarded": self._discarded,
+            "errors": self._errors,
+        }
+
+    def reset_stats(self):
+        """
+        Reset statistics, enabling their collection if not already enabled.
+        """
+
+        self._stats = {}  # identity: [count, bytes, time, maxtime, cksumfail, failed]
+        self._unknown = 0
+        self._discarded = 0
+        self._errors = 0
+
     @property
     def datastream(self) -> object:
         """
@@ -328,11 +796,17 @@ class UBXReader:
         Includes option to validate incoming payload length and checksum
         (the UBXMessage constructor can calculate and assign its own values anyway).
 
-        :param bytes message: binary message to parse
+        :param bytes message: binary message to parse (bytes or memoryview)
         :param int validate: (kwarg) validate cksum (VALCKSUM (1)=True (default), VALNONE (0)=False)
         :param int msgmode: (kwarg) message mode (0=GET (default), 1=SET, 2=POLL)
         :param bool parsebitfield: (kwarg) 1 = parse bitfields, 0 = leave as bytes (1)
         :param bool scaling: (kwarg) 1 = apply scale factors, 0 = do not apply (1)
+        :param bool lazy: (kwarg) 1 = defer decoding of attributes until accessed,
+            0 = decode now (0)
+        :param bool compact: (kwarg) 1 = hold attribute values as a single tuple,
+            0 = as individual attributes (0)
+        :param int arraytype: (kwarg) type of array attributes 0 = list, 1 = array.array('B'),
+            2 = numpy.ndarray (0)
         :return: UBXMessage object
         :rtype: UBXMessage
         :raises: UBXParseError (if data stream contains invalid data or unknown message type)
@@ -343,28 +817,31 @@ class UBXReader:
         validate = kwargs.get("validate", ubt.VALCKSUM)
         parsebf = kwargs.get("parsebitfield", True)
         scaling = kwargs.get("scaling", True)
+        lazy = kwargs.get("lazy", False)
+        compact = kwargs.get("compact", False)
+        arraytype = kwargs.get("arraytype", ubt.ARR_LIST)
 
         if msgmode not in (0, 1, 2):
             raise ube.UBXParseError(
                 f"Invalid message mode {msgmode} - must be 0, 1 or 2"
             )
 
-        lenm = len(message)
-        hdr = message[0:2]
-        clsid = message[2:3]
-        msgid = message[3:4]
-        lenb = message[4:6]
+        # slice message through a memoryview so that only the payload is copied
+        view = memoryview(message)
+        lenm = len(view)
+        hdr = bytes(view[0:2])
+        clsid = bytes(view[2:3])
+        msgid = bytes(view[3:4])
+        lenb = bytes(view[4:6])
         if lenb == b"\x00\x00":
             payload = None
             leni = 0
         else:
-            payload = message[6 : lenm - 2]
+            payload = bytes(view[6 : lenm - 2])
             leni = len(payload)
-        ckm = message[lenm - 2 : lenm]
-        if payload is not None:
-            ckv = calc_checksum(clsid + msgid + lenb + payload)
-        else:
-            ckv = calc_checksum(clsid + msgid + lenb)
+        ckm = bytes(view[lenm - 2 : lenm])
+        # checksum covers class, id, length and payload
+        ckv = calc_checksum(view[2 : 6 + leni])
         if validate & ubt.VALCKSUM:
             if hdr != ubt.UBX_HDR:
                 raise ube.UBXParseError(
@@ -391,6 +868,11 @@ class UBXReader:
                 payload=payload,
                 parsebitfield=parsebf,
                 scaling=scaling,
+                lazy=lazy,
+                compact=compact,
+                arraytype=arraytype,
+                # reuse checksum if it is consistent with payload length
+                checksum=ckv if leni == bytes2val(lenb, ubt.U2) else None,
             )
         except KeyError as err:
             modestr = ["GET", "SET", "POLL"][msgmode]
@@ -21,6 +21,9 @@ RTCM3_PROTOCOL = 4
 ERR_RAISE = 2
 ERR_LOG = 1
 ERR_IGNORE = 0
+ARR_LIST = 0  # array ('A' type) attributes as list of int
+ARR_ARRAY = 1  # array attributes as array.array('B')
+ARR_NUMPY = 2  # array attributes as numpy.ndarray of uint8 (requires NumPy)
 
 GNSSLIST = {
     0: "GPS",
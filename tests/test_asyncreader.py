@@ -0,0 +1,116 @@
+"""
+Asynchronous stream tests for pyubx2.AsyncUBXReader
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import asyncio
+import os
+import unittest
+from io import BytesIO
+
+from pyubx2 import AsyncUBXReader, UBXReader, ERR_IGNORE, ERR_LOG, ERR_RAISE
+from pyubx2.exceptions import UBXParseError
+
+LOGS = (
+    "pygpsdata-MIXED-RTCM3.log",
+    "pygpsdata-NAV.log",
+    "pygpsdata-MIXED3.log",
+    "pygpsdata-MIXED3BADCK.log",
+    "pygpsdata-BADHDR.log",
+    "pygpsdata-BADEOF1.log",
+    "pygpsdata-BADNMEAEOF.log",
+)
+
+
+def read_sync(data, **kwargs):
+    errors = []
+    ubr = UBXReader(BytesIO(data), errorhandler=errors.append, **kwargs)
+    return [(raw, str(parsed)) for raw, parsed in ubr], errors
+
+
+async def read_async(data, chunk, **kwargs):
+    errors = []
+    stream = asyncio.StreamReader()
+
+    async def produce():
+        for i in range(0, len(data), chunk):
+            stream.feed_data(data[i : i + chunk])
+            await asyncio.sleep(0)
+        stream.feed_eof()
+
+    producer = asyncio.ensure_future(produce())
+    ubr = AsyncUBXReader(stream, errorhandler=errors.append, **kwargs)
+    res = [(raw, str(parsed)) async for raw, parsed in ubr]
+    await producer
+    return res, errors
+
+
+class AsyncReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        self.data = {}
+        for name in LOGS:
+            with open(os.path.join(dirname, name), "rb") as stream:
+                self.data[name] = stream.read()
+
+    def testAsyncIter(self):  # same results as UBXReader for any chunking
+        for name, data in self.data.items():
+            for kwargs in (
+                {"protfilter": 7},
+                {"protfilter": 2, "quitonerror": ERR_IGNORE},
+                {"protfilter": 5, "framesonly": True},
+            ):
+                expected = read_sync(data, **kwargs)
+                for chunk in (1, 7, 64, 4096):
+                    res = asyncio.run(read_async(data, chunk, **kwargs))
+                    self.assertEqual(res, expected, f"{name} {kwargs} {chunk}")
+
+    def testAsyncRead(self):
+        async def run():
+            stream = asyncio.StreamReader()
+            stream.feed_data(self.data["pygpsdata-NAV.log"][0:150])
+            stream.feed_eof()
+            ubr = AsyncUBXReader(stream)
+            self.assertIs(ubr.datastream, stream)
+            return [await ubr.read(), await ubr.read(), await ubr.read()]
+
+        res = asyncio.run(run())
+        self.assertEqual(str(res[0][1])[0:19], "<UBX(NAV-PVT, iTOW=")
+        self.assertEqual(res[1:], [(None, None), (None, None)])  # partial frame at EOF
+
+    def testAsyncLog(self):
+        _, errors = asyncio.run(
+            read_async(
+                self.data["pygpsdata-MIXED3BADCK.log"],
+                16,
+                protfilter=7,
+                quitonerror=ERR_LOG,
+            )
+        )
+        self.assertEqual(errors[0][0:18], "Message checksum b")
+
+    def testAsyncRaise(self):
+        with self.assertRaisesRegex(UBXParseError, "Message checksum (.*) invalid"):
+            asyncio.run(
+                read_async(
+                    self.data["pygpsdata-MIXED3BADCK.log"],
+                    16,
+                    protfilter=7,
+                    quitonerror=ERR_RAISE,
+                )
+            )
+
+    def testAsyncEmpty(self):
+        self.assertEqual(asyncio.run(read_async(b"", 16)), ([], []))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
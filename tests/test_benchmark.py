@@ -0,0 +1,102 @@
+"""
+Benchmark suite tests for benchmarks package
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import (
+    compare_results,
+    generate_messages,
+    load_results,
+    measure,
+    measure_memory,
+    memory_benchmarks,
+    run_benchmarks,
+    save_results,
+)
+from pyubx2 import GET, SET, UBXReader, __version__
+
+FAST = {"mintime": 0.0001, "repeat": 1}
+
+
+class BenchmarkTest(unittest.TestCase):
+    def testMeasure(self):
+        res = measure(lambda: None, **FAST)
+        self.assertEqual(list(res), ["number", "repeat", "best", "median", "rate"])
+        self.assertGreaterEqual(res["number"], 1)
+        self.assertEqual(measure(lambda: None, number=3, repeat=2)["number"], 3)
+
+    def testGenerateMessages(self):
+        msgs, skipped = generate_messages(
+            GET, ["NAV-PVT", "NAV-SAT", "MGA-ACK-DATA0", "XXX"]
+        )
+        self.assertEqual(list(msgs), ["NAV-PVT", "NAV-SAT"])
+        self.assertEqual(skipped, ["MGA-ACK-DATA0", "XXX"])
+        msg = UBXReader.parse(msgs["NAV-SAT"][1])
+        self.assertEqual(msg.numSvs, 4)
+        self.assertEqual(len(UBXReader.parse(msgs["NAV-PVT"][1]).payload), 92)
+        msgs, _ = generate_messages(SET)
+        self.assertGreater(len(msgs), 50)
+
+    def testRunBenchmarks(self):
+        suites = []
+        res = run_benchmarks(
+            identities=["NAV-PVT", "CFG-MSG"],
+            svs=[1, 120],
+            messages=100,
+            count=5,
+            progress=suites.append,
+            **FAST,
+        )
+        self.assertEqual(suites, ["decode", "scaling", "stream", "construct", "memory"])
+        self.assertEqual(res["metadata"]["pyubx2"], __version__)
+        results = res["results"]
+        self.assertEqual(
+            list(results["decode"]["GET"]["messages"]), ["NAV-PVT", "CFG-MSG"]
+        )
+        self.assertEqual(results["decode"]["GET"]["messages"]["NAV-PVT"]["length"], 92)
+        self.assertEqual(results["decode"]["SET"]["skipped"], ["NAV-PVT"])
+        self.assertEqual([val["length"] for val in results["scaling"]], [20, 1448])
+        for name, val in results["stream"].items():
+            self.assertEqual(val["messages"], 100, name)
+        self.assertIn("serialize", results["construct"]["SET"]["messages"]["CFG-MSG"])
+        self.assertIn("best", results["construct"]["config_set"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.json")
+            save_results(res, path)
+            res2 = load_results(path)
+        self.assertEqual(res2, json.loads(json.dumps(res)))
+        ratios = compare_results(res, res2)
+        self.assertIn("decode/GET/messages/NAV-PVT", ratios)
+        self.assertIn("scaling/numSvs=120,length=1448", ratios)
+        self.assertEqual(set(ratios.values()), {1.0})
+
+    def testMemory(self):
+        res = memory_benchmarks(identities=["NAV-PVT", "NAV-SAT"], repeats=40, count=20)
+        self.assertEqual(res["NAV-SAT"]["length"], 488)
+        for val in res.values():
+            self.assertLess(val["compact"], val["default"])
+            self.assertLess(val["lazy"], val["compact"])
+        path = os.path.join(os.path.dirname(__file__), "pygpsdata-NAV.log")
+        res = memory_benchmarks(path=path, identities=["NAV-SAT"], count=5)
+        self.assertEqual(list(res), ["NAV-SAT"])
+        self.assertLess(measure_memory(lambda: None), 16)
+
+    def testInvalidSuite(self):
+        with self.assertRaisesRegex(ValueError, "Invalid benchmark suite xyz"):
+            run_benchmarks(["decode", "xyz"])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Columnar export tests for pyubx2.UBXColumnSink
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+import pyubx2.ubxcolumns as ubc
+import pyubx2.ubxnumpy as ubn
+from pyubx2 import SET, UBXColumnSink, UBXMessage, UBXReader
+from pyubx2.exceptions import UBXMessageError
+
+LOGS = (
+    "pygpsdata-NAV.log",
+    "pygpsdata-NAVHPPOS.log",
+    "pygpsdata-MIXED.log",
+    "pygpsdata-MON.log",
+)
+IDENTITIES = {
+    "NAV-PVT": None,
+    "NAV-HPPOSLLH": None,
+    "NAV-HPPOSECEF": None,
+    "NAV-SAT": ["iTOW", "numSvs"],  # variable size messages
+    "MON-SPAN": None,
+    "NAV-COV": None,  # integer attribute wider than 8 bytes
+}
+
+
+def message_values(data, identities, **kwargs):
+    """Get attribute values of parsed messages, by column."""
+
+    res = {identity: {} for identity in identities}
+    for _, msg in UBXReader(BytesIO(data), protfilter=2, quitonerror=0, **kwargs):
+        cols = identities.get(msg.identity, {})
+        for name in cols:
+            res[msg.identity].setdefault(name, []).append(getattr(msg, name))
+    return res
+
+
+def array_values(cols):
+    """Get array values by column."""
+
+    return {
+        identity: {name: arr.tolist() for name, arr in arrs.items()}
+        for identity, arrs in cols.items()
+    }
+
+
+class ColumnsTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        if ubn.np is None:
+            self.skipTest("NumPy not installed")
+        dirname = os.path.dirname(__file__)
+        self.data = b""
+        for name in LOGS:
+            with open(os.path.join(dirname, name), "rb") as stream:
+                self.data += stream.read()
+
+    def testColumns(self):  # same values as parsed messages
+        for kwargs in ({}, {"scaling": False, "parsebitfield": False}):
+            sink = UBXColumnSink(IDENTITIES, batchsize=7, **kwargs)
+            count = sink.consume(UBXReader(BytesIO(self.data), framesonly=True))
+            self.assertEqual(count, 75)
+            cols = array_values(sink.to_numpy())
+            self.assertEqual(cols, message_values(self.data, cols, **kwargs))
+            self.assertEqual(cols["NAV-COV"]["reserved0"], [1171368248954360692736])
+
+    def testColumnsNames(self):
+        sink = UBXColumnSink(["NAV-PVT", "NAV-HPPOSLLH", "NAV-SAT", "RXM-RAWX"])
+        sink.consume_buffer(self.data)
+        cols = sink.to_numpy()
+        self.assertEqual(cols["RXM-RAWX"], {})
+        self.assertEqual(
+            list(cols["NAV-SAT"]), ["iTOW", "version", "numSvs", "reserved0"]
+        )
+        self.assertEqual(
+            list(cols["NAV-HPPOSLLH"])[3:8], ["iTOW", "lon", "lat", "height", "hMSL"]
+        )
+        self.assertEqual(cols["NAV-PVT"]["lat"].dtype, ubn.np.dtype("<f8"))
+        self.assertEqual(cols["NAV-PVT"]["gnssFixOk"].dtype, ubn.np.dtype("<u1"))
+
+    def testScales(self):  # raw integer columns scaled once per column
+        sink = UBXColumnSink(
+            {"NAV-PVT": ["iTOW", "lat", "pDOP"], "NAV-SAT": None}, scaling=False
+        )
+        self.assertEqual(
+            sink.scales, {"NAV-PVT": {"lat": 1e-07, "pDOP": 0.01}, "NAV-SAT": {}}
+        )
+        sink.consume_buffer(self.data)
+        cols = sink.to_numpy()["NAV-PVT"]
+        scaled = UBXColumnSink({"NAV-PVT": ["lat"]}, batchsize=7)
+        scaled.consume_buffer(self.data)
+        self.assertEqual(
+            ubn.np.round(cols["lat"] * sink.scales["NAV-PVT"]["lat"], 7).tolist(),
+            scaled.to_numpy()["NAV-PVT"]["lat"].tolist(),
+        )
+
+    def testConsumeBuffer(self):  # same values as UBXReader source
+        sink1 = UBXColumnSink(IDENTITIES)
+        count = sink1.consume(
+            UBXReader(BytesIO(self.data), msgfilter=set(IDENTITIES), quitonerror=0)
+        )
+        sink2 = UBXColumnSink(IDENTITIES)
+        self.assertEqual(sink2.consume_buffer(bytearray(self.data)), count)
+        self.assertEqual(array_values(sink1.to_numpy()), array_values(sink2.to_numpy()))
+
+    def testOnBatch(self):
+        batches = []
+        sink = UBXColumnSink(
+            {"NAV-PVT": ["iTOW"]},
+            batchsize=15,
+            onbatch=lambda identity, cols: batches.append(
+                (identity, len(cols["iTOW"]))
+            ),
+        )
+        sink.consume_buffer(self.data)
+        self.assertEqual(batches, [("NAV-PVT", 15)] * 2)
+        sink.flush()
+        self.assertEqual(batches[-1], ("NAV-PVT", 10))
+        self.assertEqual(sink.to_numpy(), {"NAV-PVT": {}})
+
+    def testVersions(self):  # definitions selected by version, same payload length
+        raws = [
+            UBXMessage(
+                "RXM",
+                "RXM-PMP",
+                SET,
+                version=1,
+                numBytesUserData=504,
+                reserved0=5,
+                timeTag=1000,
+                fecBits=7,
+            ).serialize(),
+            UBXMessage(
+                "RXM", "RXM-PMP", SET, version=0, reserved0=0x030201, timeTag=2000
+            ).serialize(),
+        ]
+        self.assertEqual(len(raws[0]), len(raws[1]))
+        data = b"".join(raws * 3)
+        names = ["version", "reserved0", "timeTag"]
+        sink = UBXColumnSink({"RXM-PMP": names})
+        self.assertEqual(sink.consume_buffer(data), 6)
+        cols = array_values(sink.to_numpy())
+        self.assertEqual(cols, message_values(data, cols))
+        self.assertEqual(cols["RXM-PMP"]["reserved0"], [5, 0x030201] * 3)
+        sink = UBXColumnSink({"RXM-PMP": names + ["fecBits"]})
+        with self.assertRaisesRegex(
+            UBXMessageError,
+            "RXM-PMP attribute\\(s\\) fecBits not in fixed part of payload",
+        ):
+            sink.consume_buffer(data)
+
+    def testColumnsErrors(self):
+        with self.assertRaisesRegex(
+            UBXMessageError, "Unknown or unsupported identity NAV-XYZ"
+        ):
+            UBXColumnSink(["NAV-PVT", "NAV-XYZ"])
+        sink = UBXColumnSink({"NAV-SAT": ["iTOW", "cno", "xyz"]})
+        with self.assertRaisesRegex(
+            UBXMessageError,
+            "NAV-SAT attribute\\(s\\) cno, xyz not in fixed part of payload",
+        ):
+            sink.consume_buffer(self.data)
+        np = ubn.np
+        try:
+            ubn.np = None
+            with self.assertRaisesRegex(UBXMessageError, "NumPy is not installed"):
+                UBXColumnSink(["NAV-PVT"])
+        finally:
+            ubn.np = np
+
+    def testArrow(self):
+        if ubc.pa is None:
+            self.skipTest("pyarrow not installed")
+        sink = UBXColumnSink(IDENTITIES, batchsize=7)
+        sink.consume_buffer(self.data)
+        tables = sink.to_arrow()
+        cols = array_values(sink.to_numpy())
+        for identity, table in tables.items():
+            self.assertEqual(table.to_pydict(), cols[identity], identity)
+        self.assertEqual(len(tables["NAV-PVT"].to_batches()), 6)
+        stream = BytesIO()
+        sink.write_parquet("NAV-SAT", stream)
+        stream.seek(0)
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        self.assertEqual(pq.read_table(stream).to_pydict(), cols["NAV-SAT"])
+
+    def testArrowNotInstalled(self):
+        pa = ubc.pa
+        try:
+            ubc.pa = None
+            with self.assertRaisesRegex(UBXMessageError, "pyarrow is not installed"):
+                UBXColumnSink(["NAV-PVT"]).to_arrow()
+        finally:
+            ubc.pa = pa
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
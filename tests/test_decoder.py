@@ -0,0 +1,180 @@
+"""
+Compiled payload decoder tests for pyubx2.UBXDecoder
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyubx2 import UBXMessage, UBXReader, UBXParseError, UBXTypeError, GET, SET
+from pyubx2.ubxhelpers import calc_checksum
+import pyubx2.ubxtypes_get as ubg
+from pyubx2.ubxdecoder import (
+    UBXDecoder,
+    UBXDecodeFallback,
+    get_decoder,
+    get_scales,
+    OP_BLOCK,
+    OP_GROUP,
+    OP_CFGVAL,
+)
+
+
+class DecoderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        self.streamNAV = open(os.path.join(dirname, "pygpsdata-NAV.log"), "rb")
+
+    def tearDown(self):
+        self.streamNAV.close()
+
+    def testCached(self):  # decoder compiled once per definition and options
+        dec1 = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-PVT"])
+        dec2 = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-PVT"])
+        dec3 = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-PVT"], scaling=False)
+        self.assertIs(dec1, dec2)
+        self.assertIsNot(dec1, dec3)
+
+    def testPlanNavPvt(self):  # fixed length message compiles to a single block
+        plan = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-PVT"]).plan
+        self.assertEqual(len(plan), 1)
+        self.assertEqual(plan[0][0], OP_BLOCK)
+        self.assertEqual(plan[0][1].size, 92)
+
+    def testPlanNavSat(self):  # header block followed by repeating group
+        plan = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-SAT"]).plan
+        self.assertEqual([op[0] for op in plan], [OP_BLOCK, OP_GROUP])
+        self.assertEqual(plan[1][1], "numSvs")
+        self.assertEqual(plan[1][3], 12)  # size of each repeat
+
+    def testPlanCfgValget(self):
+        plan = get_decoder(ubg.UBX_PAYLOADS_GET["CFG-VALGET"], cfgval=True).plan
+        self.assertEqual([op[0] for op in plan], [OP_BLOCK, OP_CFGVAL])
+
+    def testUnknownType(self):
+        with self.assertRaisesRegex(UBXTypeError, "Unknown attribute type Z2"):
+            UBXDecoder(ubg.UBX_PAYLOADS_GET["FOO-BAR"])
+
+    def testTruncated(self):  # truncated payload raises fallback
+        with self.assertRaises(UBXDecodeFallback):
+            get_decoder(ubg.UBX_PAYLOADS_GET["NAV-PVT"]).decode(b"\x00" * 20)
+
+    def testTruncatedParse(self):  # falls back to interpreting definition
+        res = UBXReader.parse(b"\xb5b\x06\x01\x03\x00\x0cI\x01`\xf6")
+        self.assertEqual(
+            str(res),
+            "<UBX(CFG-MSG, msgClass=DBG, msgID=b'\\x0cI', rateDDC=1, rateUART1=0, rateUART2=0, rateUSB=0, rateSPI=0, reserved=0)>",
+        )
+
+    def testCfgvalFallback(self):  # CFG-VALGET interpreted if not compiled
+        payload = (
+            b"\x01\x00\x00\x00\x06\x00\x93\x10\x01" b"\x01\x00\x52\x40\x80\x25\x00\x00"
+        )
+        for pload in (payload, payload[:-2]):  # complete, truncated value
+            raw = UBXMessage(b"\x06", b"\x8b", GET, payload=pload).serialize()
+            res = UBXReader.parse(raw)
+            with patch("pyubx2.ubxmessage.get_decoder", return_value=None):
+                res2 = UBXReader.parse(raw)
+            self.assertEqual(vars(res2), vars(res))
+        self.assertEqual(
+            str(res2),
+            "<UBX(CFG-VALGET, version=1, layer=0, position=0, CFG_NMEA_HIGHPREC=1, CFG_UART1_BAUDRATE=9600)>",
+        )
+
+    def testUndecodableKey(self):  # CFG-VALGET key of unknown size
+        msg = b"\x06\x8b\x09\x00\x01\x00\x00\x00\x01\x00\x00\xf0\x01"
+        raw = b"\xb5b" + msg + calc_checksum(msg)
+        with self.assertRaisesRegex(UBXTypeError, "for attribute 'group'"):
+            UBXReader.parse(raw)
+        err = "Incorrect type for attribute 'group' in GET message class CFG-VALGET"
+        for quitonerror in (0, 1):
+            ubr = UBXReader(BytesIO(raw * 2), quitonerror=quitonerror)
+            self.assertEqual(list(ubr), [(None, err)] * 2)
+        with self.assertRaises(UBXParseError):
+            UBXReader(BytesIO(raw), quitonerror=2).read()
+
+    def testRoundTrip(self):  # constructed (interpreted) v parsed (compiled)
+        msg = UBXMessage(
+            "NAV",
+            "NAV-SAT",
+            GET,
+            iTOW=403326000,
+            version=1,
+            numSvs=2,
+            gnssId_01=0,
+            svId_01=12,
+            cno_01=43,
+            elev_01=-12,
+            azim_01=240,
+            prRes_01=-0.5,
+            svUsed_01=1,
+            orbitSource_01=7,
+            gnssId_02=6,
+            svId_02=3,
+            cno_02=18,
+            azim_02=359,
+            prRes_02=1.5,
+            health_02=2,
+        )
+        res = UBXReader.parse(msg.serialize())
+        self.assertEqual(vars(res), vars(msg))
+
+    def testNoScaling(self):  # unscaled values left as raw integers
+        msg = UBXMessage("NAV", "NAV-PVT", GET, lat=53.4507228, lon=-2.2402855)
+        res = UBXReader.parse(msg.serialize(), scaling=False)
+        self.assertEqual(res.lat, 534507228)
+        self.assertEqual(res.lon, -22402855)
+
+    def testScales(self):  # raw integers scaled on access
+        msg = UBXMessage("NAV", "NAV-SAT", GET, lat=53.4507228, numSvs=2, prRes_02=-1.5)
+        res = UBXReader.parse(msg.serialize(), scaling=False)
+        self.assertEqual(res.prRes_02, -15)
+        self.assertEqual(res.scaled("prRes_02"), -1.5)
+        self.assertEqual(res.scaled("numSvs"), 2)
+        self.assertEqual(res.scales, {"prRes": 0.1})
+        self.assertIs(get_scales(ubg.UBX_PAYLOADS_GET["NAV-SAT"]), res.scales)
+        self.assertEqual(
+            get_scales(ubg.UBX_PAYLOADS_GET["NAV-HPPOSLLH"]), {"hAcc": 0.1, "vAcc": 0.1}
+        )
+        res = UBXReader.parse(
+            UBXMessage("NAV", "NAV-PVT", GET, lat=53.4507228).serialize(),
+            scaling=False,
+        )
+        self.assertEqual(res.scaled("lat"), 53.4507228)
+        self.assertEqual(UBXReader.parse(msg.serialize()).scaled("prRes_02"), -1.5)
+
+    def testNavHpposllh(self):  # high precision components combined
+        res = UBXReader.parse(
+            b"\xb5b\x01\x14$\x00\x00\x00\x00\x00\xa8\x88\xea\x0c/-\xc6\xfey\xb4\xca\x1f\xbaL\x04\x003\x90\x03\x00\x04\x1b\xfe\xfd\x16\r\x00\x00\xd8\x12\x00\x00\x8c\r"
+        )
+        self.assertEqual(res.lat, 53.337816927)
+        self.assertEqual(res.lon, -2.056673696)
+        self.assertEqual(res.height, 281785.8)
+        self.assertEqual(res.hMSL, 233522.7)
+
+    def testStreamSet(self):  # SET mode messages parsed from compiled plan
+        msg = UBXMessage("CFG", "CFG-RATE", SET, measRate=200, navRate=1, timeRef=1)
+        res = UBXReader.parse(msg.serialize(), msgmode=SET)
+        self.assertEqual(str(res), str(msg))
+
+    def testStreamNav(self):  # every message in stream parses as before
+        i = 0
+        ubr = UBXReader(self.streamNAV, quitonerror=2)
+        for _, parsed in ubr:
+            self.assertIsInstance(parsed, UBXMessage)
+            i += 1
+        self.assertGreater(i, 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
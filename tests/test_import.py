@@ -0,0 +1,100 @@
+"""
+Lazy import tests for pyubx2
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import subprocess
+import sys
+import unittest
+
+import pyubx2
+import pyubx2.ubxtypes_configdb as ubcdb
+import pyubx2.ubxtypes_core as ubt
+import pyubx2.ubxtypes_get as ubg
+import pyubx2.ubxtypes_poll as ubp
+import pyubx2.ubxtypes_set as ubs
+from pyubx2.ubxhelpers import lazy_import
+
+LAZY = (
+    "pyubx2.ubxtypes_get",
+    "pyubx2.ubxtypes_set",
+    "pyubx2.ubxtypes_poll",
+    "pyubx2.ubxtypes_configdb",
+    "pynmeagps",
+    "pyrtcm",
+)
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.strip()
+
+
+class ImportTest(unittest.TestCase):
+    def testLazyImport(self):  # definitions and parsers not loaded until used
+        code = (
+            "import sys, pyubx2\n"
+            f"print([type(sys.modules[m]).__name__ for m in {LAZY!r}], 'asyncio' in sys.modules)\n"
+            "pyubx2.UBXReader.parse(b'\\xb5b\\x05\\x01\\x02\\x00\\x06\\x01\\x0f\\x38')\n"
+            f"print([type(sys.modules[m]).__name__ for m in {LAZY!r}])"
+        )
+        self.assertEqual(
+            run(code).splitlines(),
+            [
+                "['_LazyModule', '_LazyModule', '_LazyModule', '_LazyModule', '_LazyModule', '_LazyModule'] False",
+                "['module', '_LazyModule', '_LazyModule', '_LazyModule', '_LazyModule', '_LazyModule']",
+            ],
+        )
+
+    def testLazyNames(self):  # all public definition names importable from package
+        for module in (ubg, ubs, ubp, ubcdb):
+            for name, val in vars(module).items():
+                if name[0] != "_" and not hasattr(ubt, name):
+                    self.assertIs(getattr(pyubx2, name), val, name)
+                    self.assertIn(name, dir(pyubx2))
+        from pyubx2 import (
+            latlon2dms,
+            UBX_PAYLOADS_GET,
+        )  # pylint: disable=import-outside-toplevel
+
+        self.assertIs(UBX_PAYLOADS_GET, ubg.UBX_PAYLOADS_GET)
+        self.assertEqual(latlon2dms(53.5, -2.25), ("53°30′0.0″N", "2°15′0.0″W"))
+        with self.assertRaisesRegex(
+            AttributeError, "module 'pyubx2' has no attribute 'xyz'"
+        ):
+            pyubx2.xyz  # pylint: disable=pointless-statement
+
+    def testLazySubmodules(self):  # definition submodules are package attributes
+        code = (
+            "import pyubx2\n"
+            "print(len(pyubx2.ubxtypes_get.UBX_PAYLOADS_GET) > 0,"
+            " len(pyubx2.ubxtypes_set.UBX_PAYLOADS_SET) > 0,"
+            " len(pyubx2.ubxtypes_poll.UBX_PAYLOADS_POLL) > 0,"
+            " pyubx2.ubxtypes_configdb.SET_LAYER_RAM,"
+            " 'ubxtypes_get' in dir(pyubx2))"
+        )
+        self.assertEqual(run(code), "True True True 1 True")
+
+    def testStarImport(self):
+        self.assertEqual(
+            run(
+                "from pyubx2 import *\nprint(len(UBX_PAYLOADS_GET) > 0, SET_LAYER_RAM, UBXReader.__name__)"
+            ),
+            "True 1 UBXReader",
+        )
+
+    def testLazyImportHelper(self):
+        self.assertIs(lazy_import("pyubx2.ubxtypes_core"), ubt)  # already imported
+        self.assertIsNone(lazy_import("xyz_not_installed"))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Message index tests for pyubx2.UBXIndex
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import tempfile
+import unittest
+
+from pyubx2 import UBXIndex, UBXReader, UBXStreamError, UBX_PROTOCOL
+
+
+class IndexTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        data = b""
+        for name in ("pygpsdata-MIXED-RTCM3.log", "pygpsdata-NAV.log"):
+            with open(os.path.join(dirname, name), "rb") as stream:
+                data += stream.read()
+        self.data = data
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "capture.ubx")
+        with open(self.path, "wb") as stream:
+            stream.write(data)
+        with open(self.path, "rb") as stream:
+            self.expected = [
+                (raw, str(parsed)) for raw, parsed in UBXReader(stream, protfilter=7)
+            ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testBuild(self):  # index built and saved as sidecar
+        with UBXIndex(self.path) as idx:
+            self.assertEqual(idx.idxpath, self.path + ".idx")
+            self.assertTrue(os.path.exists(idx.idxpath))
+            self.assertEqual(len(idx), 37)
+            self.assertEqual(idx.record(0), (0, 52, 1, "GNGLL", None))
+            self.assertEqual(idx.record(3), (145, 275, 4, "1077", None))
+            self.assertEqual(
+                idx.record(10), (1227, 100, UBX_PROTOCOL, "NAV-PVT", 560117000)
+            )
+            self.assertEqual(idx.identities[0:3], ["GNGLL", "1005", "4072"])
+
+    def testLoad(self):  # saved index reloaded
+        with UBXIndex(self.path) as idx1:
+            records = [idx1.record(i) for i in range(len(idx1))]
+        with UBXIndex(self.path) as idx2:
+            self.assertEqual([idx2.record(i) for i in range(len(idx2))], records)
+
+    def testStale(self):  # index rebuilt if capture file has changed
+        with UBXIndex(self.path) as idx:
+            self.assertEqual(len(idx), 37)
+        with open(self.path, "ab") as stream:
+            stream.write(self.data[1227:1327])  # another NAV-PVT
+        with UBXIndex(self.path) as idx:
+            self.assertEqual(len(idx), 38)
+            self.assertEqual(idx.record(37)[0:4], (4079, 100, UBX_PROTOCOL, "NAV-PVT"))
+
+    def testInvalid(self):
+        with open(self.path + ".idx", "wb") as stream:
+            stream.write(b"rubbish")
+        with self.assertRaisesRegex(UBXStreamError, "Invalid index file (.*)"):
+            UBXIndex(self.path)
+
+    def testGetItem(self):  # message number N
+        with UBXIndex(self.path) as idx:
+            for i, (raw, parsed) in enumerate(self.expected):
+                res = idx[i]
+                self.assertEqual((res[0], str(res[1])), (raw, parsed))
+            self.assertEqual(str(idx[-1][1]), self.expected[-1][1])
+            with self.assertRaises(IndexError):
+                idx[37]  # pylint: disable=pointless-statement
+
+    def testBadChecksum(self):  # frames with invalid checksum not indexed
+        dirname = os.path.dirname(__file__)
+        for name in ("pygpsdata-MIXED3BADCK.log", "pygpsdata-MIXED-RTCM3BADCRC.log"):
+            path = os.path.join(self.tmpdir.name, name)
+            with open(os.path.join(dirname, name), "rb") as stream:
+                data = stream.read()
+            with open(path, "wb") as stream:
+                stream.write(data)
+            with open(path, "rb") as stream:
+                expected = [
+                    (raw, str(parsed))
+                    for raw, parsed in UBXReader(stream, protfilter=7, quitonerror=0)
+                    if raw is not None
+                ]
+            with UBXIndex(path) as idx:
+                self.assertEqual(len(idx), len(expected))
+                for i, (raw, parsed) in enumerate(expected):
+                    res = idx[i]
+                    self.assertEqual((res[0], str(res[1])), (raw, parsed))
+
+    def testProtfilter(self):  # message returned regardless of protfilter
+        with UBXIndex(self.path, protfilter=2) as idx:
+            self.assertEqual(str(idx[0][1]), self.expected[0][1])
+
+    def testFind(self):
+        with UBXIndex(self.path) as idx:
+            self.assertEqual(idx.find("NAV-PVT"), [8, 10])
+            self.assertEqual(idx.find("NAV-PVT", 560117000, 560117000), [10])
+            self.assertEqual(
+                idx.find(itowstart=560000000, itowend=560200000), list(range(10, 36))
+            )
+            self.assertEqual(idx.find(itowend=300000000), [8, 36])
+            self.assertEqual(idx.find("NAV-FOO"), [])
+
+    def testQuery(self):  # all NAV-PVT between iTOW A and B
+        with UBXIndex(self.path, scaling=False) as idx:
+            res = list(idx.query("NAV-PVT", 200000000, 300000000))
+            self.assertEqual(len(res), 1)
+            self.assertEqual(res[0][0], self.expected[8][0])
+            self.assertEqual(res[0][1].iTOW, 204137000)
+            self.assertEqual(res[0][1].lon, 347738190)
+
+    def testEmpty(self):
+        open(self.path, "wb").close()
+        with UBXIndex(self.path) as idx:
+            self.assertEqual(len(idx), 0)
+            self.assertEqual(list(idx.query("NAV-PVT")), [])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
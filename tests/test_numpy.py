@@ -0,0 +1,158 @@
+"""
+NumPy repeating group tests for pyubx2.UBXMessage.to_numpy
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+
+import pyubx2.ubxnumpy as ubn
+from pyubx2 import UBXReader, UBXMessage, GET, POLL, ARR_NUMPY
+import pyubx2.ubxtypes_get as ubg
+from pyubx2.ubxdecoder import get_decoder
+from pyubx2.exceptions import UBXMessageError, UBXTypeError
+from pyubx2.ubxhelpers import val2bytes
+
+IDENTITIES = (
+    "NAV-SAT",
+    "NAV-SIG",
+    "NAV-ORB",
+    "NAV-SVINFO",
+    "CFG-GNSS",
+    "MON-RF",
+    "MON-SPAN",
+    "MON-HW3",
+    "RXM-MEASX",
+    "RXM-SFRBX",
+    "RXM-SVSI",
+    "ESF-MEAS",
+)
+
+
+def group_values(msg, arr):
+    """Get group values from message attributes, by column."""
+
+    res = {}
+    for name in arr.dtype.names:
+        vals = []
+        for i in range(1, len(arr) + 1):
+            vals.append(getattr(msg, f"{name}_{i:02d}"))
+        res[name] = vals
+    return res
+
+
+def array_values(arr):
+    """Get array values by column."""
+
+    return {name: arr[name].tolist() for name in arr.dtype.names}
+
+
+class NumPyTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        if ubn.np is None:
+            self.skipTest("NumPy not installed")
+        dirname = os.path.dirname(__file__)
+        self.msgs = {}
+        for name in (
+            "pygpsdata-ALL.log",
+            "pygpsdata-NAV.log",
+            "pygpsdata-MON.log",
+            "pygpsdata-RXM.log",
+            "pygpsdata-ESF.log",
+            "pygpsdata-MIXED.log",
+        ):
+            with open(os.path.join(dirname, name), "rb") as stream:
+                for _, msg in UBXReader(stream, protfilter=2, quitonerror=0):
+                    self.msgs.setdefault(msg.identity, msg)
+
+    def testToNumPy(self):  # same values as message attributes
+        for identity in IDENTITIES:
+            msg = self.msgs[identity]
+            arr = msg.to_numpy()
+            self.assertGreater(len(arr), 0, identity)
+            self.assertEqual(array_values(arr), group_values(msg, arr), identity)
+
+    def testToNumPyOptions(self):  # unparsed bitfields and unscaled values
+        raw = self.msgs["NAV-SAT"].serialize()
+        msg = UBXReader.parse(raw, parsebitfield=False, scaling=False)
+        arr = msg.to_numpy("cno")
+        self.assertEqual(
+            arr.dtype.names,
+            ("gnssId", "svId", "cno", "elev", "azim", "prRes", "flags"),
+        )
+        self.assertEqual(arr["prRes"].dtype, ubn.np.dtype("<i2"))
+        self.assertFalse(arr.flags.writeable)  # view of payload
+        self.assertEqual(array_values(arr), group_values(msg, arr))
+
+    def testToNumPyNamed(self):  # second of two repeating groups
+        msg = self.msgs["MON-SPAN"]
+        self.assertEqual(len(msg.to_numpy("pga")), msg.numRfBlocks)
+        with self.assertRaisesRegex(
+            UBXMessageError, "No fixed size repeating group containing attribute xyz"
+        ):
+            msg.to_numpy("xyz")
+
+    def testToNumPyNoGroup(self):
+        with self.assertRaisesRegex(UBXMessageError, "No fixed size repeating group"):
+            self.msgs["NAV-PVT"].to_numpy()
+        with self.assertRaisesRegex(UBXMessageError, "No payload"):
+            UBXMessage("NAV", "NAV-SAT", POLL).to_numpy()
+
+    def testToNumPyEmpty(self):
+        msg = UBXMessage("NAV", "NAV-SAT", GET, numSvs=0)
+        self.assertEqual(len(msg.to_numpy()), 0)
+
+    def testWideIntegers(self):  # integers wider than 8 bytes not truncated
+        msg = UBXMessage(
+            "NAV", "NAV-COV", GET, reserved0=1172170281114452235776, posCovNN=1.5
+        )
+        plan = get_decoder(ubg.UBX_PAYLOADS_GET["NAV-COV"]).plan
+        _, stc, fields = plan[0]
+        rawdtype, dtype = ubn.block_dtypes(stc, fields)
+        raw = ubn.np.frombuffer(msg.payload * 2, dtype=rawdtype)
+        arr = ubn.convert_block(raw, fields, dtype)
+        self.assertEqual(arr["reserved0"].tolist(), [msg.reserved0] * 2)
+        self.assertEqual(arr["posCovNN"].tolist(), [1.5] * 2)
+        vals = ubn.np.array([[0xFF] * 9, [1] + [0] * 8], dtype=ubn.np.uint8)
+        res = ubn._bytes2int(vals, True)  # pylint: disable=protected-access
+        self.assertEqual(res.tolist(), [-1, 1])
+
+    def testArrayType(self):  # array attributes as NumPy arrays
+        raw = self.msgs["MON-SPAN"].serialize()
+        for kwargs in ({}, {"lazy": True}, {"compact": True}):
+            msg = UBXReader.parse(raw, arraytype=ARR_NUMPY, **kwargs)
+            spec = msg.spectrum_01
+            self.assertEqual(spec.dtype, ubn.np.uint8)
+            self.assertFalse(spec.flags.writeable)
+            self.assertEqual(spec.tolist(), self.msgs["MON-SPAN"].spectrum_01)
+            self.assertEqual(str(msg), str(self.msgs["MON-SPAN"]))
+        msg = UBXMessage(
+            "MON", "MON-SPAN", GET, numRfBlocks=1, spectrum_01=spec, arraytype=ARR_NUMPY
+        )
+        self.assertEqual(msg.spectrum_01.tolist(), spec.tolist())
+        wide = ubn.np.array([1, 2], dtype=ubn.np.uint16)  # converted by value
+        with self.assertRaisesRegex(UBXTypeError, "A004 must have 4"):
+            val2bytes(wide, "A004")
+        self.assertEqual(val2bytes(wide.repeat(2), "A004"), b"\x01\x01\x02\x02")
+        self.assertEqual(UBXReader.parse(msg.serialize()).spectrum_01, spec.tolist())
+
+    def testToNumPyNotInstalled(self):
+        np = ubn.np
+        try:
+            ubn.np = None
+            with self.assertRaisesRegex(UBXMessageError, "NumPy is not installed"):
+                self.msgs["NAV-SAT"].to_numpy()
+        finally:
+            ubn.np = np
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Parallel parsing tests for pyubx2.ubxparallel
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from pyubx2 import UBXReader, ERR_RAISE
+from pyubx2.exceptions import UBXParseError
+from pyubx2.ubxparallel import chunk_bounds, find_frame, frame_length, parse_file
+
+
+def count_identities(ubr):  # module level so it can be pickled
+    return Counter(parsed.identity for _, parsed in ubr)
+
+
+class ParallelTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        data = b""
+        for name in (
+            "pygpsdata-MIXED-RTCM3.log",
+            "pygpsdata-NAV.log",
+            "pygpsdata-MIXED.log",
+        ):
+            with open(os.path.join(dirname, name), "rb") as stream:
+                data += stream.read()
+        self.data = data * 2
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "capture.ubx")
+        with open(self.path, "wb") as stream:
+            stream.write(self.data)
+        with open(self.path, "rb") as stream:
+            self.expected = [
+                (raw, str(parsed))
+                for raw, parsed in UBXReader(
+                    stream, protfilter=7, quitonerror=ERR_RAISE
+                )
+            ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testFrameLength(self):
+        self.assertEqual(frame_length(self.data, 0), 52)  # NMEA
+        self.assertEqual(frame_length(self.data, 52), 25)  # RTCM3
+        self.assertEqual(frame_length(self.data, 1057), 100)  # UBX
+        self.assertEqual(frame_length(self.data, 1058), 0)
+        self.assertEqual(frame_length(b"\xb5b\x01\x07\x5c\x00", 0), 0)  # truncated
+
+    def testFindFrame(self):  # realigns to next frame start
+        self.assertEqual(find_frame(self.data, 0), 0)
+        self.assertEqual(find_frame(self.data, 1), 52)
+        self.assertEqual(find_frame(self.data, 1060), 1157)
+        self.assertEqual(find_frame(b"\x00\xb5b\x00", 0), 4)
+
+    def testChunkBounds(self):
+        bounds = chunk_bounds(self.path, 4096)
+        self.assertGreater(len(bounds), 1)
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], len(self.data))
+        for (_, end), (start, _) in zip(bounds, bounds[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(find_frame(self.data, start), start)
+
+    def testParseFile(self):  # results in original order
+        res = parse_file(self.path, workers=2, chunksize=4096, protfilter=7)
+        self.assertEqual([(raw, str(parsed)) for raw, parsed in res], self.expected)
+
+    def testParseFileSequential(self):  # single worker parsed in process
+        res = parse_file(self.path, workers=1, chunksize=4096, protfilter=7)
+        self.assertEqual([(raw, str(parsed)) for raw, parsed in res], self.expected)
+
+    def testParseFileLazy(self):  # lazy messages decoded before pickling
+        res = parse_file(self.path, workers=2, chunksize=4096, protfilter=7, lazy=True)
+        self.assertEqual([(raw, str(parsed)) for raw, parsed in res], self.expected)
+
+    def testParseFileAggregate(self):  # per-chunk aggregates in chunk order
+        res = parse_file(
+            self.path,
+            workers=2,
+            chunksize=4096,
+            aggregate=count_identities,
+            protfilter=7,
+        )
+        self.assertEqual(len(res), len(chunk_bounds(self.path, 4096)))
+        total = sum(res, Counter())
+        self.assertEqual(
+            total,
+            Counter(parsed.split("(")[1].split(",")[0] for _, parsed in self.expected),
+        )
+
+    def testParseFileError(self):  # errors raised from worker process
+        data = bytearray(self.data)
+        data[1057 + 50] ^= 0xFF  # corrupt NAV-PVT payload
+        with open(self.path, "wb") as stream:
+            stream.write(data)
+        with self.assertRaisesRegex(UBXParseError, "Message checksum (.*) invalid"):
+            parse_file(
+                self.path,
+                workers=2,
+                chunksize=4096,
+                protfilter=7,
+                quitonerror=ERR_RAISE,
+            )
+
+    def testParseFileEmpty(self):
+        open(self.path, "wb").close()
+        self.assertEqual(parse_file(self.path, workers=2), [])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -9,9 +9,24 @@ Created on 3 Oct 2020
 """
 # pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
 
+import pickle
 import unittest
 
-from pyubx2 import UBXMessage, UBXReader, VALCKSUM, VALNONE, SET
+from pyubx2 import (
+    UBXMessage,
+    UBXReader,
+    UBXMessageError,
+    VALCKSUM,
+    VALNONE,
+    SET,
+    GET,
+    ARR_ARRAY,
+    U2,
+    U4,
+    UBX_MSGIDS,
+)
+from pyubx2.ubxhelpers import calc_checksum
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
 
 
 class ParseTest(unittest.TestCase):
@@ -277,6 +292,159 @@ class ParseTest(unittest.TestCase):
             "<UBX(ESF-STATUS, iTOW=23:59:42, version=2, reserved0=548, fusionMode=0, reserved1=0, numSens=6, type_01=5, used_01=0, ready_01=1, calibStatus_01=0, timeStatus_01=1, freq_01=0, badMeas_01=0, badTTag_01=0, missingMeas_01=0, noisyMeas_01=0, type_02=13, used_02=0, ready_02=0, calibStatus_02=0, timeStatus_02=1, freq_02=10, badMeas_02=0, badTTag_02=0, missingMeas_02=0, noisyMeas_02=0, type_03=14, used_03=0, ready_03=1, calibStatus_03=0, timeStatus_03=1, freq_03=10, badMeas_03=0, badTTag_03=0, missingMeas_03=0, noisyMeas_03=0, type_04=0, used_04=0, ready_04=0, calibStatus_04=0, timeStatus_04=1, freq_04=10, badMeas_04=0, badTTag_04=0, missingMeas_04=0, noisyMeas_04=0, type_05=1, used_05=0, ready_05=0, calibStatus_05=0, timeStatus_05=0, freq_05=10, badMeas_05=0, badTTag_05=0, missingMeas_05=0, noisyMeas_05=0, type_06=18, used_06=0, ready_06=1, calibStatus_06=0, timeStatus_06=1, freq_06=0, badMeas_06=0, badTTag_06=0, missingMeas_06=0, noisyMeas_06=0)>",
         )
 
+    def testLazy(self):  # test lazy parse decodes only attributes accessed
+        res = UBXReader.parse(self.nav_velned, lazy=True)
+        self.assertNotIn("velE", vars(res))
+        self.assertEqual(res.velE, -15)
+        self.assertEqual(res.heading, 1.28387)
+        self.assertIn("velE", vars(res))
+        self.assertNotIn("velN", vars(res))
+
+    def testLazyStr(self):  # test lazy parse preserves attribute order
+        res = UBXReader.parse(self.nav_velned, lazy=True)
+        self.assertEqual(res.heading, 1.28387)
+        self.assertEqual(
+            str(res),
+            "<UBX(NAV-VELNED, iTOW=16:01:48, velN=-3, velE=-15, velD=-4, speed=16, gSpeed=15, heading=1.28387, sAcc=65, cAcc=80.5272)>",
+        )
+        self.assertEqual(
+            list(vars(res))[-9:],
+            [
+                "iTOW",
+                "velN",
+                "velE",
+                "velD",
+                "speed",
+                "gSpeed",
+                "heading",
+                "sAcc",
+                "cAcc",
+            ],
+        )
+
+    def testLazyGroup(self):  # test lazy parse of repeating group attribute
+        res = UBXReader.parse(self.esf_status, lazy=True)
+        self.assertEqual(res.type_06, 18)
+        self.assertEqual(res.numSens, 6)
+        res2 = UBXReader.parse(self.esf_status)
+        self.assertEqual(str(res), str(res2))
+
+    def testLazyTruncated(self):  # test lazy parse falls back if payload truncated
+        raw = UBXMessage(
+            b"\x01", b"\x12", GET, payload=self.nav_velned[6:26]
+        ).serialize()
+        res = UBXReader.parse(raw, lazy=True)
+        self.assertEqual(res.velE, -15)
+        self.assertEqual(res.cAcc, 0.0)  # not in payload, decoded by interpreter
+        self.assertEqual(str(res), str(UBXReader.parse(raw)))
+        self.assertEqual(
+            str(res),
+            "<UBX(NAV-VELNED, iTOW=16:01:48, velN=-3, velE=-15, velD=-4, speed=16, gSpeed=0, heading=0.0, sAcc=0, cAcc=0.0)>",
+        )
+
+    def testLazyBitfield(self):  # test lazy parse of bitfield flag
+        res = UBXReader.parse(self.esf_status, lazy=True)
+        self.assertEqual(res.fusionMode, 0)
+
+    def testLazyNoAttr(self):  # test lazy parse of nonexistent attribute
+        res = UBXReader.parse(self.nav_velned, lazy=True)
+        with self.assertRaises(AttributeError):
+            res.spam  # pylint: disable=pointless-statement
+        self.assertEqual(res.velN, -3)
+
+    def testLazyImmutable(self):  # test lazy parse is still immutable
+        res = UBXReader.parse(self.nav_velned, lazy=True)
+        with self.assertRaises(UBXMessageError):
+            res.velN = 4
+
+    def testCompact(self):  # test compact parse holds attribute values as tuple
+        res = UBXReader.parse(self.esf_status, compact=True)
+        res2 = UBXReader.parse(self.esf_status)
+        self.assertEqual(str(res), str(res2))
+        self.assertNotIn("numSens", vars(res))
+        self.assertEqual(res.numSens, 6)
+        self.assertEqual(res.type_06, 18)
+        self.assertEqual(len(res._values), len([k for k in vars(res2) if k[0] != "_"]))
+        res3 = UBXReader.parse(self.esf_status, compact=True)
+        self.assertIs(res3._names, res._names)  # shared name table
+        with self.assertRaises(AttributeError):
+            res.spam  # pylint: disable=pointless-statement
+        with self.assertRaises(UBXMessageError):
+            res.numSens = 4
+
+    def testCompactPickle(self):  # test compact message pickles and shares name table
+        res = UBXReader.parse(self.nav_velned, compact=True)
+        res2 = pickle.loads(pickle.dumps(res))
+        self.assertEqual(str(res2), str(res))
+        self.assertIs(res2._names, res._names)
+        self.assertEqual(res2.heading, 1.28387)
+
+    def testCompactConstruct(self):  # test compact message constructed from attributes
+        res = UBXMessage(
+            "CFG", "CFG-MSG", SET, msgClass=1, msgID=7, rateUART1=1, compact=True
+        )
+        res2 = UBXMessage("CFG", "CFG-MSG", SET, msgClass=1, msgID=7, rateUART1=1)
+        self.assertEqual(str(res), str(res2))
+        self.assertEqual(res.serialize(), res2.serialize())
+        self.assertEqual(res.rateUART1, 1)
+        self.assertNotIn("rateUART1", vars(res))
+
+    def testParseMemoryview(self):  # test parse from memoryview of larger buffer
+        buf = b"\x00\x00" + self.nav_velned + b"\x00"
+        view = memoryview(buf)[2 : 2 + len(self.nav_velned)]
+        res = UBXReader.parse(view)
+        self.assertEqual(str(res), str(UBXReader.parse(self.nav_velned)))
+        self.assertEqual(res.serialize(), self.nav_velned)
+        self.assertIsInstance(res.payload, bytes)
+
+    def testVersionCache(
+        self,
+    ):  # test payload-selected definitions are cached by length
+        res1 = UBXReader.parse(self.cfg_nmeavx)
+        res2 = UBXReader.parse(self.cfg_nmeav0)
+        res3 = UBXReader.parse(self.cfg_nmeavx)
+        self.assertEqual(str(res1), str(res3))
+        self.assertNotEqual(str(res1), str(res2))
+        self.assertIs(
+            res1._get_dict(payload=res1.payload), res3._get_dict(payload=res3.payload)
+        )
+
+    def testDefinitionAdded(self):
+        # test cached definitions refreshed if definition tables patched
+        msg = b"\x01\xfe\x06\x00\x01\x00\x00\x00\x02\x00"
+        raw = b"\xb5b" + msg + calc_checksum(msg)
+        self.assertEqual(UBXReader.parse(raw).identity, "NAV-01fe-NOMINAL")
+        try:
+            UBX_MSGIDS[b"\x01\xfe"] = "NAV-TEST"
+            UBX_PAYLOADS_GET["NAV-TEST"] = {"count": U4, "val": U2}
+            res = UBXReader.parse(raw)
+            self.assertEqual(str(res), "<UBX(NAV-TEST, count=1, val=2)>")
+        finally:
+            del UBX_MSGIDS[b"\x01\xfe"]
+            del UBX_PAYLOADS_GET["NAV-TEST"]
+        self.assertEqual(UBXReader.parse(raw).identity, "NAV-01fe-NOMINAL")
+
+    def testGroup(self):  # test repeating group values as list, including nested groups
+        msg = UBXMessage(
+            "MON", "MON-COMMS", GET, nPorts=2, msgs_01_02=5, msgs_02_04=9, txUsage_02=3
+        )
+        for kwargs in ({}, {"compact": True}, {"lazy": True}):
+            res = UBXReader.parse(msg.serialize(), **kwargs)
+            self.assertEqual(res.group("txUsage"), [0, 3])
+            self.assertEqual(res.group("msgs_01"), [0, 5, 0, 0])
+            self.assertEqual(res.group("msgs_02"), [0, 0, 0, 9])
+            self.assertEqual(res.group("version"), [])
+        res = UBXReader.parse(self.nav_velned)
+        self.assertEqual(res.group("iTOW"), [])
+
+    def testArrayType(self):  # test array attributes as array('B')
+        msg = UBXMessage("MON", "MON-SPAN", GET, numRfBlocks=2, spectrum_02=[7] * 256)
+        res = UBXReader.parse(msg.serialize(), arraytype=ARR_ARRAY)
+        self.assertEqual(res.spectrum_02.typecode, "B")
+        self.assertEqual(res.spectrum_02.tolist(), [7] * 256)
+        self.assertEqual(str(res), str(msg))
+        self.assertEqual(pickle.loads(pickle.dumps(res)).spectrum_02, res.spectrum_02)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,87 @@
+"""
+Push-based parser tests for pyubx2.UBXParser
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+from pyubx2 import UBXParser, UBXReader, ERR_IGNORE, ERR_RAISE
+from pyubx2.exceptions import UBXParseError
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        self.data = {}
+        for name in (
+            "pygpsdata-MIXED-RTCM3.log",
+            "pygpsdata-NAV.log",
+            "pygpsdata-MIXED3BADCK.log",
+            "pygpsdata-BADHDR.log",
+            "pygpsdata-BADNMEAEOF.log",
+        ):
+            with open(os.path.join(dirname, name), "rb") as stream:
+                self.data[name] = stream.read()
+
+    def testFeed(self):  # same results as UBXReader for any chunking
+        for name, data in self.data.items():
+            for kwargs in (
+                {"protfilter": 7},
+                {"protfilter": 7, "quitonerror": ERR_IGNORE, "msgfilter": {"NAV-PVT"}},
+            ):
+                expected = [
+                    (raw, str(parsed))
+                    for raw, parsed in UBXReader(
+                        BytesIO(data), errorhandler=lambda err: None, **kwargs
+                    )
+                ]
+                for chunk in (1, 3, 100, len(data)):
+                    ubp = UBXParser(errorhandler=lambda err: None, **kwargs)
+                    res = []
+                    for i in range(0, len(data), chunk):
+                        res += [
+                            (raw, str(parsed))
+                            for raw, parsed in ubp.feed(data[i : i + chunk])
+                        ]
+                    self.assertEqual(res, expected, f"{name} {kwargs} {chunk}")
+
+    def testPartial(self):  # partial frame held until completed
+        data = self.data["pygpsdata-NAV.log"]
+        ubp = UBXParser()
+        self.assertEqual(ubp.feed(data[0:80]), [])
+        self.assertEqual(ubp.pending, 80)
+        res = ubp.feed(memoryview(data)[80:200])
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0][0], data[0:100])
+        self.assertEqual(str(res[0][1])[0:19], "<UBX(NAV-PVT, iTOW=")
+        self.assertEqual(ubp.pending, 100)
+
+    def testGarbage(self):  # bytes preceding next frame not held
+        ubp = UBXParser()
+        self.assertEqual(ubp.feed(b"\x00\x01\x02\x03"), [])
+        self.assertEqual(ubp.pending, 0)
+        self.assertEqual(ubp.feed(b"\x00\x01\xb5"), [])
+        self.assertEqual(ubp.pending, 1)
+
+    def testFeedRaise(self):  # parsing resumes after erroneous message
+        # NB: messages preceding the erroneous message in the same chunk are discarded
+        data = self.data["pygpsdata-MIXED3BADCK.log"]
+        ubp = UBXParser(protfilter=7, quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UBXParseError, "Message checksum (.*) invalid"):
+            ubp.feed(data)
+        res = ubp.feed(b"")
+        self.assertEqual([parsed.identity for _, parsed in res], ["GPGGA"])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -10,8 +10,9 @@ Created on 11 May 2022
 """
 
 import unittest
-from socket import socket
-from pyubx2 import UBXReader
+from io import BytesIO
+from socket import socket, socketpair
+from pyubx2 import SocketStream, UBXReader
 
 
 class DummySocket(socket):
@@ -51,6 +52,11 @@ class DummySocket(socket):
         self._buffer = self._buffer[num:]
         return buff
 
+    def recv_into(self, buffer, nbytes: int = 0) -> int:
+        buff = self.recv(nbytes or len(buffer))
+        buffer[0 : len(buff)] = buff
+        return len(buff)
+
 
 class SocketTest(unittest.TestCase):
     def setUp(self):
@@ -115,6 +121,55 @@ class SocketTest(unittest.TestCase):
                 break
         self.assertEqual(i, 0)
 
+    def testSocketStreamRead(self):  # test reads spanning buffer boundaries
+        stream = DummySocket()
+        data = stream._stream
+        sst = SocketStream(stream, bufsize=64)
+        self.assertEqual(bytes(sst.buffer), data[0:64])
+        res = sst.read(5) + sst.read(100) + sst.read(1000) + sst.read(3)
+        self.assertEqual(res, data[0:1108])
+        self.assertEqual(bytes(sst.buffer), data[1108 : 1108 + len(sst.buffer)])
+
+    def testSocketStreamReadline(self):  # test lines spanning buffer boundaries
+        line = b"$GPRTE,2,1,c,0," + b"PBRCPK," * 200 + b"PLISMR*73\r\n"
+        sock1, sock2 = socketpair()
+        try:
+            sock1.sendall(b"\xb5b" + line * 3 + b"$GPGSA,A,3")
+            sock1.close()
+            sst = SocketStream(sock2, bufsize=32)
+            self.assertEqual(sst.read(2), b"\xb5b")
+            for _ in range(3):
+                self.assertEqual(sst.readline(), line)
+            self.assertEqual(sst.readline(), b"$GPGSA,A,3")  # unterminated
+            self.assertEqual(sst.read(1), b"")
+        finally:
+            sock2.close()
+
+    def testSocketPair(self):  # test reading ahead from real socket until closed
+        stream = DummySocket()
+        data = stream._stream
+        expected = [(raw, str(parsed)) for raw, parsed in UBXReader(BytesIO(data))]
+        sock1, sock2 = socketpair()
+        try:
+            sock1.sendall(data)
+            sock1.close()
+            res = [(raw, str(parsed)) for raw, parsed in UBXReader(sock2, bufsize=100)]
+            self.assertEqual(res, expected)
+        finally:
+            sock2.close()
+
+    def testSocketStreamTimeout(self):  # test partial line returned on timeout
+        sock1, sock2 = socketpair()
+        try:
+            sock1.sendall(b"$GNDTM,W84,,0.0,N")
+            sock2.settimeout(0.1)
+            sst = SocketStream(sock2)
+            self.assertEqual(sst.read(100), b"")
+            self.assertEqual(sst.readline(), b"$GNDTM,W84,,0.0,N")
+        finally:
+            sock1.close()
+            sock2.close()
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
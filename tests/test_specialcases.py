@@ -379,6 +379,52 @@ class SpecialTest(unittest.TestCase):
         msg = UBXReader.parse(b"\xb5b\x0c\x66\x02\x00\x33\x44\xeb\xf8")
         self.assertEqual(str(msg), EXPECTED_RESULT)
 
+    def testNAVHPPOSLLH(
+        self,
+    ):  # test construction of NAV-HPPOSLLH, combining HP attributes
+        EXPECTED_RESULT = "<UBX(NAV-HPPOSLLH, version=0, reserved0=0, invalidLlh=0, iTOW=23:59:43, lon=-0.100000007, lat=51.500000012, height=100000.3, hMSL=49999.6, hAcc=123, vAcc=0)>"
+        msg = UBXMessage(
+            "NAV",
+            "NAV-HPPOSLLH",
+            GET,
+            iTOW=1000,
+            _lat=515000000,
+            _lon=-1000000,
+            _latHp=12,
+            _lonHp=-7,
+            _height=100000,
+            _heightHp=3,
+            _hMSL=50000,
+            _hMSLHp=-4,
+            hAcc=123,
+        )
+        self.assertEqual(str(msg), EXPECTED_RESULT)
+        res = UBXReader.parse(msg.serialize())
+        self.assertEqual((res.lat, res.lon, res.height), (msg.lat, msg.lon, msg.height))
+
+    def testNAVHPPOSECEF(
+        self,
+    ):  # test construction of NAV-HPPOSECEF, combining HP attributes
+        EXPECTED_RESULT = "<UBX(NAV-HPPOSECEF, version=0, reserved0=0, iTOW=23:59:42, ecefX=100.05, ecefY=-3.09, ecefZ=0.0, invalidEcef=0, pAcc=10)>"
+        msg = UBXMessage(
+            "NAV",
+            "NAV-HPPOSECEF",
+            GET,
+            _ecefX=100,
+            _ecefXHp=5,
+            _ecefY=-3,
+            _ecefYHp=-9,
+            pAcc=10,
+        )
+        self.assertEqual(str(msg), EXPECTED_RESULT)
+        res = UBXReader.parse(msg.serialize())
+        self.assertEqual((res.ecefX, res.ecefY), (msg.ecefX, msg.ecefY))
+
+    def testIdentityCached(self):  # test identity is resolved once, including NOMINAL
+        msg = UBXReader.parse(b"\xb5b\x0c\x66\x02\x00\x33\x44\xeb\xf8")
+        self.assertEqual(msg.identity, "DBG-0c66-NOMINAL")
+        self.assertIs(msg.identity, msg.identity)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -12,13 +12,18 @@ Created on 3 Oct 2020
 import os
 import unittest
 import unittest
+from array import array
 
-from pyubx2 import UBXMessage, UBXReader, UBX_CLASSES, POLL
+from pyubx2 import UBXMessage, UBXReader, UBX_CLASSES, POLL, UBXTypeError
 import pyubx2.ubxtypes_core as ubt
+import pyubx2.ubxhelpers as ubh
 from pyubx2.ubxhelpers import (
     calc_checksum,
     isvalid_checksum,
+    validate_checksums,
     key_from_val,
+    reverse_dict,
+    group_names,
     get_bits,
     itow2utc,
     gnss2str,
@@ -27,6 +32,7 @@ from pyubx2.ubxhelpers import (
     msgstr2bytes,
     val2bytes,
     bytes2val,
+    bytes2array,
     cfgkey2name,
     cfgname2key,
     protocol,
@@ -138,6 +144,36 @@ class StaticTest(unittest.TestCase):
             else:
                 self.assertEqual(res, EXPECTED_RESULTS[i])
 
+    def testArrays(self):  # test bulk conversion of array attributes
+        self.assertEqual(bytes2array(b"\x01\x02\xff"), [1, 2, 255])
+        arr = bytes2array(b"\x01\x02\xff", ubt.ARR_ARRAY)
+        self.assertIsInstance(arr, array)
+        self.assertEqual(arr.tolist(), [1, 2, 255])
+        self.assertEqual(val2bytes(arr, "A003"), b"\x01\x02\xff")
+        self.assertEqual(val2bytes(b"\x01\x02\xff", "A003"), b"\x01\x02\xff")
+        self.assertEqual(val2bytes([1, 2, 3, 4], "A003"), b"\x01\x02\x03")
+        with self.assertRaisesRegex(
+            UBXTypeError, "Array attribute type A003 must have 3"
+        ):
+            val2bytes([1, 2], "A003")
+        # wider items are converted by value, not by raw memory
+        self.assertEqual(val2bytes(array("H", [1, 2, 255]), "A003"), b"\x01\x02\xff")
+        with self.assertRaisesRegex(
+            UBXTypeError, "Array attribute type A004 must have 4"
+        ):
+            val2bytes(array("H", [1, 2]), "A004")
+        with self.assertRaises(ValueError):
+            val2bytes(array("H", [1, 2, 256]), "A003")
+        with self.assertRaisesRegex(UBXTypeError, "Invalid arraytype 9"):
+            bytes2array(b"\x01", 9)
+        np = ubh.np
+        try:
+            ubh.np = None
+            with self.assertRaisesRegex(UBXTypeError, "NumPy is not installed"):
+                bytes2array(b"\x01", ubt.ARR_NUMPY)
+        finally:
+            ubh.np = np
+
     def testUBX2Bytes(self):
         res = msgstr2bytes("CFG", "CFG-MSG")
         self.assertEqual(res, (b"\x06", b"\x01"))
@@ -146,10 +182,73 @@ class StaticTest(unittest.TestCase):
         res = key_from_val(UBX_CLASSES, "MON")
         self.assertEqual(res, (b"\x0A"))
 
+    def testGroupNames(self):  # names computed once, table extended as required
+        self.assertEqual(group_names("cno", 3), ("cno_01", "cno_02", "cno_03"))
+        names = group_names("cno", 120)
+        self.assertEqual(names[99], "cno_100")
+        self.assertIs(group_names("cno", 120), names)
+        self.assertEqual(group_names("_02", 2), ("_02_01", "_02_02"))
+        self.assertEqual(group_names("cno", 0), ())
+
+    def testKeyfromValReverse(self):  # first key, kept in sync with dictionary
+        dictionary = {"a": 1, "b": 2, "c": 1}
+        self.assertEqual(key_from_val(dictionary, 1), "a")
+        self.assertIs(reverse_dict(dictionary), reverse_dict(dictionary))
+        dictionary["d"] = 3
+        self.assertEqual(key_from_val(dictionary, 3), "d")
+        del dictionary["a"]
+        self.assertEqual(key_from_val(dictionary, 1), "c")
+        with self.assertRaisesRegex(KeyError, "No key found for value 4"):
+            key_from_val(dictionary, 4)
+        self.assertEqual(key_from_val({"a": [1], "b": [2]}, [2]), "b")  # unhashable
+        self.assertEqual(
+            reverse_dict({"a": (1, "U1"), "b": (2, "U2")}, 0), {1: "a", 2: "b"}
+        )
+
     def testCalcChecksum(self):
         res = calc_checksum(b"\x06\x01\x02\x00\xf0\x05")
         self.assertEqual(res, b"\xfe\x16")
 
+    def testCalcChecksumLarge(self):  # compare with byte-wise Fletcher algorithm
+        content = bytes(range(256)) * 20 + b"\xff" * 3000
+        for size in (0, 1, 100, 1023, 1024, 4096, len(content)):
+            check_a = check_b = 0
+            for char in content[0:size]:
+                check_a = (check_a + char) & 0xFF
+                check_b = (check_b + check_a) & 0xFF
+            res = calc_checksum(content[0:size])
+            self.assertEqual(res, bytes((check_a, check_b)))
+            self.assertEqual(calc_checksum(memoryview(content)[0:size]), res)
+
+    def testValidateChecksums(self):
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-MIXED3BADCK.log"), "rb") as stream:
+            data = stream.read()
+        res = validate_checksums(data)
+        self.assertEqual(res, [(0, 100, True), (230, 100, False)])
+        self.assertEqual(validate_checksums(memoryview(data)[0:150]), [(0, 100, True)])
+        self.assertEqual(
+            validate_checksums(data, [230, 0, 1, 5000]),
+            [(230, 100, False), (0, 100, True), (1, 0, False), (5000, 0, False)],
+        )
+
+    def testValidateChecksumsNumPy(self):  # compare NumPy and pure Python batches
+        if ubh.np is None:
+            self.skipTest("NumPy not installed")
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-ALL.log"), "rb") as stream:
+            data = bytearray(stream.read())
+        data[3000] ^= 0xFF  # corrupt a frame
+        npwindow, np = ubh.NPWINDOW, ubh.np
+        try:
+            ubh.NPWINDOW = 1000  # multiple buffer windows
+            res = validate_checksums(data)
+            ubh.np = None
+            self.assertEqual(validate_checksums(data), res)
+        finally:
+            ubh.NPWINDOW, ubh.np = npwindow, np
+        self.assertIn(False, [valid for _, _, valid in res])
+
     def testGoodChecksum(self):
         res = isvalid_checksum(b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x16")
         self.assertTrue(res)
@@ -204,6 +303,19 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(key, "CFG_I2C_ADDRESS")
         self.assertEqual(typ, ubt.U1)
 
+    def testcfgkey2typeAll(self):  # same as search of configuration database
+        for name, (keyid, typ) in ubh.ubcdb.UBX_CONFIG_DATABASE.items():
+            (key, typ2) = cfgkey2name(keyid)
+            self.assertEqual(cfgname2key(key), (keyid, typ2))
+            if key == name:
+                self.assertEqual(typ2, typ)
+        try:
+            ubh.ubcdb.UBX_CONFIG_DATABASE["CFG_TEST_KEY"] = (0x10FFFFFF, ubt.L)
+            self.assertEqual(cfgkey2name(0x10FFFFFF), ("CFG_TEST_KEY", ubt.L))
+        finally:
+            del ubh.ubcdb.UBX_CONFIG_DATABASE["CFG_TEST_KEY"]
+        self.assertEqual(cfgkey2name(0x10FFFFFF), ("CFG_0x10ffffff", "X001"))
+
     def testgetbits(self):
         INPUTS = [
             (b"\x89", 192),
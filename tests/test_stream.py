@@ -11,7 +11,10 @@ Created on 3 Oct 2020
 
 import sys
 import os
+import tempfile
 import unittest
+from mmap import mmap
+from io import BytesIO
 
 from pyubx2 import (
     UBXReader,
@@ -24,6 +27,7 @@ from pyubx2 import (
 )
 from pyubx2.exceptions import UBXParseError
 import pyubx2.ubxtypes_core as ubt
+import pyubx2.ubxreader as ubxr
 
 
 class StreamTest(unittest.TestCase):
@@ -194,6 +198,25 @@ class StreamTest(unittest.TestCase):
                 self.assertEqual(str(parsed), EXPECTED_RESULTS[i])
                 i += 1
 
+    def testNAVHPPOSLAZY(
+        self,
+    ):  # test stream of UBX NAV-HPPOS* messages with lazy decoding
+        EXPECTED_RESULTS = (
+            ("NAV-HPPOSECEF", "ecefX", 381429769.95),
+            ("NAV-HPPOSLLH", "lat", 53.337816927),
+            ("NAV-HPPOSECEF", "ecefX", 381429768.07),
+            ("NAV-HPPOSLLH", "lat", 53.337817193),
+        )
+
+        i = 0
+        ubxreader = UBXReader(self.streamNAVHPPOS, lazy=True)
+        for _, parsed in ubxreader:
+            identity, att, val = EXPECTED_RESULTS[i]
+            self.assertEqual(parsed.identity, identity)
+            self.assertEqual(getattr(parsed, att), val)
+            i += 1
+        self.assertEqual(i, 4)
+
     def testRXMLOG(
         self,
     ):  # test stream of UBX RXM messages
@@ -666,6 +689,244 @@ class StreamTest(unittest.TestCase):
         self.assertEqual(res2, EXPECTED_RESULTS2)
         self.assertEqual(i, 189)
 
+    def testREADAHEAD(self):  # test chunked read-ahead matches unbuffered stream
+        class PlainStream:  # stream without read-ahead support
+            def __init__(self, stream):
+                self._stream = stream
+
+            def read(self, size):
+                return self._stream.read(size)
+
+            def readline(self):
+                return self._stream.readline()
+
+        data = self.streamMIX.read()
+        chunk = ubxr.READCHUNK
+        try:
+            ubxr.READCHUNK = 7  # force frames to span chunk boundaries
+            res1 = [
+                (raw, str(parsed))
+                for raw, parsed in UBXReader(BytesIO(data), protfilter=7)
+            ]
+        finally:
+            ubxr.READCHUNK = chunk
+        res2 = [
+            (raw, str(parsed))
+            for raw, parsed in UBXReader(PlainStream(BytesIO(data)), protfilter=7)
+        ]
+        self.assertEqual(res1, res2)
+        self.assertGreater(len(res1), 0)
+
+    def testRESYNC(self):  # test garbage preceding valid message is discarded
+        msg = b"\xb5b\x05\x01\x02\x00\x06\x01\x0f\x38"
+        ubxreader = UBXReader(BytesIO(b"\x00\x01\x02" * 50000 + msg + b"\x00" * 7))
+        raw, parsed = ubxreader.read()
+        self.assertEqual(raw, msg)
+        self.assertEqual(str(parsed), "<UBX(ACK-ACK, clsID=CFG, msgID=CFG-MSG)>")
+        self.assertEqual(ubxreader.read(), (None, None))
+
+    def testFRAMESONLY(self):  # test raw frames returned without parsing
+        EXPECTED_RESULTS = (
+            "<NMEAFRAME(GNGLL, offset=0, length=52)>",
+            "<RTCM3FRAME(1005, offset=52, length=25)>",
+            "<RTCM3FRAME(4072, offset=77, length=68)>",
+            "<RTCM3FRAME(1077, offset=145, length=275)>",
+            "<RTCM3FRAME(1087, offset=420, length=201)>",
+            "<RTCM3FRAME(1097, offset=621, length=151)>",
+            "<RTCM3FRAME(1127, offset=772, length=275)>",
+            "<RTCM3FRAME(1230, offset=1047, length=10)>",
+            "<UBXFRAME(NAV-PVT, offset=1057, length=100)>",
+            "<NMEAFRAME(GNRMC, offset=1157, length=70)>",
+        )
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            data = stream.read()
+        ubr = UBXReader(
+            BytesIO(data), protfilter=7, framesonly=True, quitonerror=ERR_RAISE
+        )
+        i = 0
+        for raw, frame in ubr:
+            self.assertEqual(str(frame), EXPECTED_RESULTS[i])
+            self.assertEqual(frame.raw, raw)
+            self.assertEqual(data[frame.offset : frame.offset + len(frame)], raw)
+            i += 1
+        self.assertEqual(i, len(EXPECTED_RESULTS))
+
+    def testFRAMESONLYMSGID(self):  # test frame header attributes
+        frames = [frame for _, frame in UBXReader(self.streamMIX, framesonly=True)]
+        self.assertEqual(frames[0].protocol, UBX_PROTOCOL)
+        self.assertEqual(frames[0].msgid, b"\x01\x07")
+        self.assertEqual(len(frames[0].payload), 92)
+        self.assertIsInstance(frames[0].payload, memoryview)
+        self.assertEqual(frames[0].checksum, frames[0].raw[-2:])
+        self.assertEqual(
+            UBXReader.parse(memoryview(frames[0].raw)).serialize(), frames[0].raw
+        )
+        self.assertEqual(frames[1].protocol, NMEA_PROTOCOL)
+        self.assertEqual(frames[1].msgid, ("GP", "GGA"))
+        self.assertEqual(frames[1].payload[0:9], b"080247.00")
+        self.assertEqual(frames[1].checksum, b"77")
+
+    def testFRAMESONLYBADCK(self):  # test invalid checksum raised in frames mode
+        EXPECTED_ERROR = "Message checksum (.*) invalid - should be (.*)"
+        ubr = UBXReader(self.streamMIXBADCK, framesonly=True, quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UBXParseError, EXPECTED_ERROR):
+            for _ in ubr:
+                pass
+
+    def testFRAMESONLYBADCRC(self):  # test invalid RTCM3 CRC raised in frames mode
+        EXPECTED_ERROR = "RTCM3 message invalid - failed CRC: (.*)"
+        dirname = os.path.dirname(__file__)
+        with open(
+            os.path.join(dirname, "pygpsdata-MIXED-RTCM3BADCRC.log"), "rb"
+        ) as stream:
+            ubr = UBXReader(
+                stream, protfilter=7, framesonly=True, quitonerror=ERR_RAISE
+            )
+            with self.assertRaisesRegex(UBXParseError, EXPECTED_ERROR):
+                for _ in ubr:
+                    pass
+
+    def testMSGFILTER(self):  # test message identity filter
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            ubr = UBXReader(
+                stream,
+                protfilter=7,
+                msgfilter={"NAV-PVT", "RMC", "GNGLL", 1077, "1230"},
+            )
+            res = [parsed.identity for _, parsed in ubr]
+        self.assertEqual(res, ["GNGLL", "1077", "1230", "NAV-PVT", "GNRMC"])
+
+    def testMSGFILTERMGA(self):  # test MGA messages filtered on type
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "assistnow.log"), "rb") as stream:
+            ubr = UBXReader(
+                stream, msgmode=1, msgfilter=("MGA-GPS-EPH", "MGA-INI-TIME-UTC")
+            )
+            res = [parsed.identity for _, parsed in ubr]
+        self.assertEqual(res, ["MGA-INI-TIME-UTC"] + ["MGA-GPS-EPH"] * 10)
+
+    def testMSGFILTERSKIP(self):  # test filtered out frames not validated
+        ubr = UBXReader(self.streamMIXBADCK, quitonerror=ERR_RAISE, msgfilter={"GSA"})
+        res = [str(parsed) for _, parsed in ubr]
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0][0:13], "<NMEA(GPGSA, ")
+
+    def testMSGFILTERFRAMES(self):  # test filter applied in frames mode
+        ubr = UBXReader(self.streamMIX, framesonly=True, msgfilter={"NAV-PVT"})
+        res = [str(parsed) for _, parsed in ubr]
+        self.assertEqual(
+            res,
+            [
+                "<UBXFRAME(NAV-PVT, offset=0, length=100)>",
+                "<UBXFRAME(NAV-PVT, offset=230, length=100)>",
+                "<UBXFRAME(NAV-PVT, offset=460, length=100)>",
+            ],
+        )
+
+    def testMSGFILTERNOMINAL(self):  # test unrecognised UBX identity in filter
+        ubr = UBXReader(
+            BytesIO(self.streamMIX.read()[0:100] + b"\xb5b\x01\xff\x00\x00\x00\xff"),
+            msgfilter={"NAV-01ff-NOMINAL"},
+            validate=0,
+        )
+        res = [str(parsed) for _, parsed in ubr]
+        self.assertEqual(res, ["<UBX(NAV-01ff-NOMINAL)>"])
+
+    def testMMAP(self):  # test memory-mapped file matches buffered file stream
+        dirname = os.path.dirname(__file__)
+        path = os.path.join(dirname, "pygpsdata-MIXED-RTCM3.log")
+        with open(path, "rb") as stream:
+            res1 = [
+                (raw, str(parsed)) for raw, parsed in UBXReader(stream, protfilter=7)
+            ]
+        ubr = UBXReader.from_file(path, protfilter=7)
+        self.assertIsInstance(ubr.datastream, mmap)
+        res2 = [(raw, str(parsed)) for raw, parsed in ubr]
+        ubr.datastream.close()
+        self.assertEqual(res1, res2)
+        self.assertEqual(len(res2), 10)
+
+    def testMMAPOFFSET(self):  # test frame offsets in memory-mapped file
+        dirname = os.path.dirname(__file__)
+        path = os.path.join(dirname, "pygpsdata-MIXED-RTCM3.log")
+        ubr = UBXReader.from_file(path, protfilter=7, framesonly=True)
+        mapping = ubr.datastream
+        for raw, frame in ubr:
+            self.assertEqual(mapping[frame.offset : frame.offset + len(raw)], raw)
+        self.assertEqual(frame.offset, 1157)
+        mapping.close()
+
+    def testMMAPEMPTY(self):  # test empty file is not mapped
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "empty.ubx")
+            open(path, "wb").close()
+            ubr = UBXReader.from_file(path)
+            self.assertEqual(ubr.read(), (None, None))
+            ubr.datastream.close()
+
+    def testSTATS(self):  # test message statistics by identity
+        self.assertIsNone(UBXReader(self.streamMIX).stats)
+        for kwargs in ({}, {"framesonly": True}):
+            self.streamMIX.seek(0)
+            ubr = UBXReader(self.streamMIX, stats=True, **kwargs)
+            for _ in ubr:
+                pass
+            stats = ubr.stats
+            res = {
+                identity: (val["count"], val["bytes"], val["cksumfail"])
+                for identity, val in stats["identities"].items()
+            }
+            self.assertEqual(
+                res,
+                {"NAV-PVT": (3, 300, 0), "GPGGA": (2, 148, 0), "GPGSA": (2, 112, 0)},
+            )
+            pvt = stats["identities"]["NAV-PVT"]
+            self.assertGreater(pvt["time"], 0)
+            self.assertGreaterEqual(pvt["time"], pvt["maxtime"])
+            self.assertEqual(
+                (stats["nominal"], stats["unknown"], stats["discarded"]), (0, 0, 0)
+            )
+
+    def testSTATSERRORS(self):  # test checksum failures and error counts
+        errs = []
+        ubr = UBXReader(
+            self.streamMIXBADCK,
+            stats=True,
+            errorhandler=errs.append,
+            msgfilter={"NAV-PVT"},
+        )
+        for _ in ubr:
+            pass
+        stats = ubr.stats
+        self.assertEqual(stats["identities"]["NAV-PVT"]["count"], 1)
+        self.assertEqual(stats["identities"]["NAV-PVT"]["cksumfail"], 1)
+        self.assertEqual(stats["errors"], len(errs))
+        ubr = UBXReader(
+            self.streamBADHDR, stats=True, quitonerror=ERR_IGNORE, msgfilter=set()
+        )
+        for _ in ubr:
+            pass
+        stats = ubr.stats
+        self.assertEqual(
+            (stats["unknown"], stats["discarded"], stats["errors"]), (1, 100, 0)
+        )
+        ubr.reset_stats()
+        self.assertEqual(
+            ubr.stats,
+            {"identities": {}, "nominal": 0, "unknown": 0, "discarded": 0, "errors": 0},
+        )
+
+    def testSTATSNOMINAL(self):  # test unrecognised UBX messages are counted
+        ubr = UBXReader(
+            BytesIO(b"\x00\x00\xb5b\x01\xff\x00\x00\x00\xff"), validate=0, stats=True
+        )
+        self.assertEqual(str(ubr.read()[1]), "<UBX(NAV-01ff-NOMINAL)>")
+        stats = ubr.stats
+        self.assertEqual(stats["identities"]["NAV-01ff-NOMINAL"]["bytes"], 8)
+        self.assertEqual((stats["nominal"], stats["discarded"]), (1, 2))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']